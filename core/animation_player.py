@@ -57,6 +57,23 @@ class AnimationPlayer:
                 max_time = max(max_time, last_keyframe.time)
         
         self.duration = max_time
+
+    def recompute_duration_from(self, max_time_hint: float, shrinkable: bool = False):
+        """
+        Update the duration after a keyframe edit without rescanning every layer.
+
+        Args:
+            max_time_hint: Latest keyframe time written by the edit
+            shrinkable: True when the edit may have removed or moved the keyframe
+                that defined the current duration; forces a full rescan
+        """
+        if not self.animation:
+            self.duration = 0.0
+            return
+        if shrinkable:
+            self.calculate_duration()
+            return
+        self.duration = max(self.duration, max_time_hint)
     
     def update(self, delta_time: float):
         """
@@ -182,7 +199,7 @@ class AnimationPlayer:
         g = int(get_value_at_time(layer.keyframes, 'g', 'immediate_rgb', 255))
         b = int(get_value_at_time(layer.keyframes, 'b', 'immediate_rgb', 255))
 
-        if getattr(layer, "render_tags", None) and "neutral_color" in layer.render_tags:
+        if "neutral_color" in layer.render_tags:
             r = g = b = 255
 
         # Apply glitch jitter (small random offsets) if enabled
@@ -4,7 +4,7 @@ Defines the core data types used throughout the application
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict, Any, Set
+from typing import List, Tuple, Optional, Dict, Any, Set, FrozenSet
 
 
 @dataclass
@@ -62,8 +62,14 @@ class KeyframeData:
     immediate_sprite: int = 0
     immediate_rgb: int = -1
 
+    def __copy__(self) -> "KeyframeData":
+        """Shallow copy without re-running __init__; every field is an immutable scalar."""
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
 
-@dataclass
+
+@dataclass(slots=True)
 class LayerData:
     """Layer information"""
     name: str
@@ -83,6 +89,14 @@ class LayerData:
     render_tags: Set[str] = field(default_factory=set)
     mask_role: Optional[str] = None
     mask_key: Optional[str] = None
+    # Lazily computed set of sprite names used by keyframes; None means stale.
+    sprite_signature: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Lazily computed sorted string render_tags for export; None means stale.
+    sorted_render_tags: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
 @dataclass
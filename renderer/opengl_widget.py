@@ -313,6 +313,15 @@ class OpenGLAnimationWidget(QOpenGLWidget):
         self._last_layer_world_states = layer_world_states
         return layer_world_states
 
+    def prime_world_state_cache(self, states: Dict[int, Dict]) -> None:
+        """
+        Replace the cached world states with ones built for the current pose.
+
+        For callers that built states with temporarily altered offsets and
+        already hold the states matching the restored ones.
+        """
+        self._last_layer_world_states = states
+
     def _group_attachments_by_layer(self) -> Dict[int, List[AttachmentInstance]]:
         """Return attachment instances grouped by their target layer id."""
         grouping: Dict[int, List[AttachmentInstance]] = {}
@@ -0,0 +1,76 @@
+"""Tests for the streamed atlas XML root rewrite."""
+
+import xml.etree.ElementTree as ET
+
+from utils.atlas_xml import rewrite_atlas_xml_root
+
+ATTRS = {"imagePath": 'new & "odd".png', "width": "64", "hires": "true"}
+
+
+def _rewrite(tmp_path, source: bytes):
+    src = tmp_path / "in.xml"
+    dst = tmp_path / "out.xml"
+    src.write_bytes(source)
+    ok = rewrite_atlas_xml_root(str(src), str(dst), ATTRS)
+    return ok, dst
+
+
+def test_rewrites_root_and_streams_sprites_verbatim(tmp_path):
+    body = b'\n  <sprite n="a" x="0" y="0" w="4" h="4"/>\n  <sprite n="b" x="4" y="0" w="4" h="4"/>\n</TextureAtlas>\n'
+    source = (
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<TextureAtlas imagePath="old.png" width="32" height="16">' + body
+    )
+    ok, dst = _rewrite(tmp_path, source)
+    assert ok
+    output = dst.read_bytes()
+    assert output.endswith(body)
+    root = ET.parse(dst).getroot()
+    assert root.attrib == {
+        "imagePath": 'new & "odd".png',
+        "width": "64",
+        "height": "16",
+        "hires": "true",
+    }
+    assert [sprite.get("n") for sprite in root] == ["a", "b"]
+
+
+def test_ignores_root_lookalikes_in_comments_and_gt_in_values(tmp_path):
+    source = (
+        b'<?xml version="1.0"?>\n'
+        b'<!-- <TextureAtlas imagePath="comment.png"> -->\n'
+        b'<TextureAtlas note="a > b" imagePath="old.png"><sprite n="a"/></TextureAtlas>'
+    )
+    ok, dst = _rewrite(tmp_path, source)
+    assert ok
+    output = dst.read_bytes()
+    assert output.startswith(b'<?xml version="1.0"?>\n<!-- <TextureAtlas imagePath="comment.png"> -->\n')
+    root = ET.parse(dst).getroot()
+    assert root.get("note") == "a > b"
+    assert root.get("imagePath") == 'new & "odd".png'
+    assert root[0].get("n") == "a"
+
+
+def test_self_closing_root(tmp_path):
+    ok, dst = _rewrite(tmp_path, b"<TextureAtlas imagePath='old.png'/>")
+    assert ok
+    assert ET.parse(dst).getroot().get("width") == "64"
+
+
+def test_falls_back_for_unsupported_sources(tmp_path):
+    cases = [
+        b'<?xml version="1.0" encoding="ISO-8859-1"?><TextureAtlas imagePath="a.png"/>',
+        b'<TextureAtlas imagePath="a.png" <broken/></TextureAtlas>',
+        b'<Atlas imagePath="a.png"/>',
+        b"",
+        "<TextureAtlas imagePath='a.png'/>".encode("utf-16"),
+    ]
+    for source in cases:
+        ok, _ = _rewrite(tmp_path, source)
+        assert not ok, source
+
+
+def test_refuses_to_overwrite_its_source(tmp_path):
+    src = tmp_path / "atlas.xml"
+    src.write_bytes(b'<TextureAtlas imagePath="a.png"/>')
+    assert not rewrite_atlas_xml_root(str(src), str(src), ATTRS)
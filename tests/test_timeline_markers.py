@@ -0,0 +1,36 @@
+"""Tests for incremental timeline marker updates."""
+
+from utils.timeline_markers import apply_marker_delta
+
+
+def test_adds_in_sorted_order_and_skips_duplicates():
+    markers = [0.0, 1.0, 2.0]
+    result = apply_marker_delta(markers, [1.5, 0.5, 1.0, 3.0], [], 1e-4)
+    assert result is markers
+    assert markers == [0.0, 0.5, 1.0, 1.5, 2.0, 3.0]
+
+
+def test_removes_every_marker_within_tolerance():
+    markers = [0.0, 0.99995, 1.0, 1.00005, 1.1, 2.0]
+    apply_marker_delta(markers, [], [1.0], 1e-4)
+    assert markers == [0.0, 1.1, 2.0]
+
+
+def test_removal_happens_before_additions():
+    markers = [0.0, 1.0, 2.0]
+    apply_marker_delta(markers, [1.0], [1.0], 1e-4)
+    assert markers == [0.0, 1.0, 2.0]
+
+
+def test_moving_markers_matches_rebuilding_the_list():
+    markers = [0.0, 0.5, 1.0, 1.5]
+    apply_marker_delta(markers, [0.75, 1.75], [0.5, 1.5], 1e-4)
+    assert markers == sorted({0.0, 1.0, 0.75, 1.75})
+
+
+def test_missing_removals_and_empty_list():
+    markers = []
+    apply_marker_delta(markers, [], [5.0], 1e-4)
+    assert markers == []
+    apply_marker_delta(markers, [2.0, 1.0], [], 1e-4)
+    assert markers == [1.0, 2.0]
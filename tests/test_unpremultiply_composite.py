@@ -0,0 +1,47 @@
+"""Parity checks for the fused unpremultiply + background composite kernel."""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from utils import unpremultiply
+
+KERNELS = [unpremultiply.unpremultiply_composite_rows]
+if unpremultiply.unpremultiply_composite_kernel is not None:
+    KERNELS.append(unpremultiply.unpremultiply_composite_kernel)
+
+
+def _pil_composite(src: np.ndarray, color: tuple) -> np.ndarray:
+    """Reference result: LUT unpremultiply of the flipped readback, then PIL."""
+    straight = unpremultiply.unpremultiply_array(src[::-1])
+    base = Image.new("RGBA", (src.shape[1], src.shape[0]), color)
+    return np.asarray(Image.alpha_composite(base, Image.fromarray(straight, "RGBA")))
+
+
+def _kernel_composite(kernel, src: np.ndarray, color: tuple) -> np.ndarray:
+    out = np.empty_like(src)
+    kernel(src, unpremultiply.UNPREMULTIPLY_LUT, *color, out)
+    return out
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("color", [(10, 20, 30, 0), (10, 20, 30, 128), (10, 20, 30, 255)])
+def test_zero_alpha_pixels_match_alpha_composite(kernel, color):
+    src = np.array(
+        [
+            [[0, 0, 0, 0], [50, 60, 70, 0]],
+            [[100, 50, 20, 200], [3, 3, 3, 3]],
+        ],
+        dtype=np.uint8,
+    )
+    np.testing.assert_array_equal(_kernel_composite(kernel, src, color), _pil_composite(src, color))
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("color", [(0, 0, 0, 0), (200, 100, 50, 90), (255, 255, 255, 255)])
+def test_random_premultiplied_pixels_match_alpha_composite(kernel, color):
+    rng = np.random.default_rng(0)
+    alpha = rng.integers(0, 256, size=(16, 16, 1), dtype=np.uint16)
+    rgb = rng.integers(0, 256, size=(16, 16, 3), dtype=np.uint16) * alpha // 255
+    src = np.concatenate([rgb, alpha], axis=-1).astype(np.uint8)
+    np.testing.assert_array_equal(_kernel_composite(kernel, src, color), _pil_composite(src, color))
@@ -595,6 +595,39 @@ class LayerPanel(QWidget):
         self._refresh_row_styles()
         self._update_selection_info()
 
+    def set_order(self, layers: List[LayerData]) -> bool:
+        """
+        Reorder the existing rows to match ``layers`` without rebuilding them.
+
+        Returns False when the layer set differs from the current rows, in
+        which case the caller should fall back to ``update_layers``.
+        """
+        if len(layers) != len(self.layer_rows):
+            return False
+        for layer in layers:
+            row = self.layer_rows.get(layer.layer_id)
+            if row is None or row.layer is not layer:
+                return False
+        self._all_layers = layers
+        layout = self.layer_layout
+        for index, layer in enumerate(layers):
+            row = self.layer_rows[layer.layer_id]
+            if layout.indexOf(row) != index:
+                layout.removeWidget(row)
+                layout.insertWidget(index, row)
+        return True
+
+    def set_visibility_bits(self, visibility: Dict[int, bool]):
+        """Sync row checkboxes to the given layer visibility without emitting toggles."""
+        for layer_id, visible in visibility.items():
+            row = self.layer_rows.get(layer_id)
+            if row is None or row.checkbox.isChecked() == visible:
+                continue
+            was_blocked = row.checkbox.blockSignals(True)
+            row.checkbox.setChecked(visible)
+            row.checkbox.blockSignals(was_blocked)
+            row._update_visibility_style()
+
     def _on_row_sprite_assign(self, layer: LayerData):
         """Emit sprite assignment requests to the host window."""
         if layer and layer.layer_id is not None:
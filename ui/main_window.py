@@ -6,6 +6,7 @@ The main application window that ties everything together
 import sys
 import os
 import re
+import io
 import json
 import math
 import subprocess
@@ -16,16 +17,26 @@ import importlib.util
 import types
 import faulthandler
 import copy
+import ctypes
 import difflib
+import threading
+import time
 import struct
 import random
+import heapq
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right, insort_right
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from xml.sax.saxutils import quoteattr
 from glob import glob
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Dict, List, Set, Tuple, Any
+from typing import Optional, Callable, Deque, Dict, Iterable, Iterator, List, Set, FrozenSet, Tuple, Any
 
 import numpy as np
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
@@ -34,16 +45,28 @@ from PyQt6.QtWidgets import (
     QSplitter, QProgressDialog, QDialog, QInputDialog
 )
 from PyQt6.QtCore import Qt, QSettings, QTimer, QEvent
-from PyQt6.QtGui import QSurfaceFormat, QColor, QShortcut, QKeySequence, QPixmap, QImage
+from PyQt6.QtGui import QSurfaceFormat, QColor, QShortcut, QKeySequence, QPixmap, QImage, QPixmapCache
 from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 from OpenGL.GL import *
 import soundfile as sf
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    from numba import njit, prange  # type: ignore
+except Exception:
+    njit = None  # type: ignore
+    prange = range
+
 from core.data_structures import AnimationData, LayerData, KeyframeData, SpriteInfo
 from core.animation_player import AnimationPlayer
 from core.texture_atlas import TextureAtlas
 from core.audio_manager import AudioManager
+from utils.atlas_xml import rewrite_atlas_xml_root
 from utils.buddy_manifest import BuddyManifest
 from renderer.opengl_widget import OpenGLAnimationWidget
 from renderer.sprite_renderer import BlendMode
@@ -61,8 +84,448 @@ from .sprite_workshop_dialog import SpriteWorkshopDialog
 from .sprite_picker_dialog import SpritePickerDialog
 from utils.diagnostics import DiagnosticsManager, DiagnosticsConfig
 from utils.ffmpeg_installer import resolve_ffmpeg_path
+from utils.psd_rle import encode_psd_rle_channels, packbits_encode_kernel
 from utils.pytoshop_installer import PytoshopInstaller, PythonPackageInstaller
 from utils.shader_registry import ShaderRegistry
+from utils.unpremultiply import UNPREMULTIPLY_LUT, unpremultiply_array, unpremultiply_composite_kernel
+
+# Spritesheet imports with at least this many sprites copy patches on a thread pool.
+_PARALLEL_PATCH_MIN_JOBS = 16
+
+# Deferred UI refresh flags used by MSMAnimationViewer._batch_ui_updates().
+_UI_REFRESH_GL = 1 << 0
+_UI_REFRESH_THUMBNAILS = 1 << 1
+_UI_REFRESH_THUMBNAIL_CACHE = 1 << 2
+_UI_REFRESH_LAYER_PANEL = 1 << 3
+_UI_REFRESH_VARIANTS = 1 << 4
+_UI_REFRESH_SELECTION = 1 << 5
+_UI_REFRESH_TIMELINE = 1 << 6
+_UI_REFRESH_LAYER_ORDER = 1 << 7
+_UI_REFRESH_LAYER_VISIBILITY = 1 << 8
+_UI_REFRESH_MARKER_DELTA = 1 << 9
+# Work needed after the layer panel rows are rebuilt from scratch.
+_UI_REFRESH_LAYER_REBUILD = (
+    _UI_REFRESH_LAYER_PANEL
+    | _UI_REFRESH_VARIANTS
+    | _UI_REFRESH_SELECTION
+    | _UI_REFRESH_THUMBNAIL_CACHE
+)
+
+# Formats probed first when loading user-supplied sprite images.
+_SPRITE_IMAGE_FORMATS: Tuple[str, ...] = ("PNG", "WEBP", "JPEG", "BMP", "TIFF", "GIF")
+
+# Background colors tried first when suggesting a key color for exports.
+_PREFERRED_BACKGROUND_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    (255, 0, 255),
+    (0, 255, 0),
+    (0, 255, 255),
+    (255, 255, 0),
+    (0, 128, 255),
+    (255, 128, 0),
+    (0, 255, 180),
+    (255, 0, 180),
+)
+
+
+def _clamp_byte(value: Any) -> int:
+    """Clamp a color channel to 0-255 without the max/min call pair."""
+    value = int(value)
+    return 0 if value < 0 else 255 if value > 255 else value
+
+
+def _nearest_within(sorted_values: List[float], value: float, tolerance: float) -> Optional[float]:
+    """Return the entry of a sorted list closest to value if it lies within tolerance."""
+    idx = bisect_left(sorted_values, value)
+    best: Optional[float] = None
+    best_distance = tolerance
+    for candidate in sorted_values[max(0, idx - 1): idx + 1]:
+        distance = abs(candidate - value)
+        if distance <= best_distance:
+            best = candidate
+            best_distance = distance
+    return best
+
+
+def _nearest_sorted_indices(
+    values: np.ndarray,
+    sorted_targets: np.ndarray,
+    tolerance: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized _nearest_within.
+
+    Returns the index of the closest sorted target for every value plus a
+    mask of which values lie within tolerance of that target.
+    """
+    last = len(sorted_targets) - 1
+    upper = np.searchsorted(sorted_targets, values)
+    right = np.minimum(upper, last)
+    left = np.maximum(upper - 1, 0)
+    dist_left = np.abs(values - sorted_targets[left])
+    dist_right = np.abs(values - sorted_targets[right])
+    nearest = np.where(dist_right <= dist_left, right, left)
+    return nearest, np.minimum(dist_left, dist_right) <= tolerance
+
+
+def _world_delta_to_local_kernel(
+    pm00: float,
+    pm01: float,
+    pm10: float,
+    pm11: float,
+    world_dx: float,
+    world_dy: float,
+) -> Tuple[float, float]:
+    """Map a world-space delta through the inverse of a parent's 2x2 matrix."""
+    det = pm00 * pm11 - pm01 * pm10
+    if abs(det) < 1e-6:
+        return world_dx, world_dy
+    inv00 = pm11 / det
+    inv01 = -pm01 / det
+    inv10 = -pm10 / det
+    inv11 = pm00 / det
+    return inv00 * world_dx + inv01 * world_dy, inv10 * world_dx + inv11 * world_dy
+
+
+if njit is not None:  # pragma: no cover - optional dependency
+    # Eager signature: compiled (or loaded from cache) at import, not on first use.
+    _world_delta_to_local_kernel = njit(
+        "UniTuple(float64, 2)(float64, float64, float64, float64, float64, float64)",
+        cache=True,
+    )(_world_delta_to_local_kernel)
+
+
+def _keyframe_times(keyframes: List[KeyframeData]) -> np.ndarray:
+    """Return keyframe times as a float64 array."""
+    return np.fromiter((frame.time for frame in keyframes), dtype=np.float64, count=len(keyframes))
+
+
+_keyframe_time = attrgetter("time")
+# Field values in declaration order, so ``KeyframeData(*_keyframe_fields(kf))`` round-trips.
+_keyframe_fields = attrgetter(*(f.name for f in fields(KeyframeData)))
+
+
+_ATOMIC_JSON_TYPES = (str, int, float, bool, type(None))
+
+# Layer JSON keys that _export_animation_dict always rewrites from LayerData.
+_LAYER_VOLATILE_KEYS = frozenset({
+    "name", "id", "parent", "anchor_x", "anchor_y", "blend", "visible",
+    "shader", "color_tint", "color_tint_hdr", "color_gradient",
+    "color_animator", "color_metadata", "render_tags", "mask_role",
+    "mask_key", "frames",
+})
+
+
+def _layer_source_template(source: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow view of a layer source without the exported-from-LayerData keys."""
+    return {key: value for key, value in source.items() if key not in _LAYER_VOLATILE_KEYS}
+
+
+def _assign_color_field(
+    layer_dict: Dict[str, Any],
+    field_name: str,
+    value: Optional[Tuple[float, float, float, float]],
+) -> None:
+    """Write an RGBA color as a float list, or drop the key when unset."""
+    if value is None:
+        layer_dict.pop(field_name, None)
+    else:
+        layer_dict[field_name] = [float(component) for component in value]
+
+
+def _fast_clone(obj: Any) -> Any:
+    """
+    Deep-copy JSON-shaped data (dicts, lists, tuples, scalars).
+
+    Skips ``copy.deepcopy``'s memo and dispatch machinery; any other type
+    falls back to ``copy.deepcopy`` so the result is always independent.
+    """
+    obj_type = type(obj)
+    # Scalar leaves are tested inline so the common case (numbers, strings,
+    # color components) costs no recursive call.
+    if obj_type is dict:
+        return {
+            key: value if type(value) in _ATOMIC_JSON_TYPES else _fast_clone(value)
+            for key, value in obj.items()
+        }
+    if obj_type is list:
+        return [value if type(value) in _ATOMIC_JSON_TYPES else _fast_clone(value) for value in obj]
+    if obj_type in _ATOMIC_JSON_TYPES:
+        return obj
+    if obj_type is tuple:
+        return tuple(_fast_clone(value) for value in obj)
+    return copy.deepcopy(obj)
+
+
+# Above this many local vertices, _compute_frame_bounds transforms with numpy.
+_BOUNDS_NUMPY_VERTEX_THRESHOLD = 8
+# Below this many layers, _gather_pose_offsets uses scalar math per layer.
+_POSE_OFFSETS_NUMPY_THRESHOLD = 32
+# Cap for the per-frame bounds memo; oldest entries are evicted first.
+_FRAME_BOUNDS_CACHE_LIMIT = 2048
+# Coarse frame stride for _compute_animation_bounds; layers keyed more densely
+# than this force a full per-frame pass.
+_BOUNDS_COARSE_STRIDE = 8
+
+
+def _rasterize_polygon_rows(
+    vertices: np.ndarray,
+    texcoords: np.ndarray,
+    triangles: np.ndarray,
+    atlas: np.ndarray,
+    out: np.ndarray,
+    factors: np.ndarray,
+) -> None:
+    """
+    Barycentric-rasterize textured triangles into a uint8 RGBA layer buffer.
+
+    ``vertices`` are layer-space (n, 2), ``texcoords`` atlas pixels (n, 2),
+    ``triangles`` pre-validated (m, 3) indices, ``atlas`` uint8 RGBA and
+    ``factors`` the RGBA tint/opacity multipliers. Rows run in parallel;
+    within a row triangles are visited in order, so a later triangle
+    overwrites an earlier one on shared edges just like the NumPy path.
+    Bilinear fetch, tint and rounding happen per written pixel.
+    """
+    height = out.shape[0]
+    width = out.shape[1]
+    atlas_height = atlas.shape[0]
+    atlas_width = atlas.shape[1]
+    epsilon = 1e-5
+    # Per-triangle setup is row-invariant: clipped bbox (min_y, max_y, min_x,
+    # max_x) and denominator, computed once instead of once per row.
+    # Degenerate triangles get an empty row range.
+    tri_count = triangles.shape[0]
+    tri_bounds = np.empty((tri_count, 4), dtype=np.int64)
+    tri_denoms = np.empty(tri_count, dtype=np.float64)
+    for tri in range(tri_count):
+        idx0 = triangles[tri, 0]
+        idx1 = triangles[tri, 1]
+        idx2 = triangles[tri, 2]
+        dx0 = vertices[idx0, 0]
+        dy0 = vertices[idx0, 1]
+        dx1 = vertices[idx1, 0]
+        dy1 = vertices[idx1, 1]
+        dx2 = vertices[idx2, 0]
+        dy2 = vertices[idx2, 1]
+        denom = (dy1 - dy2) * (dx0 - dx2) + (dx2 - dx1) * (dy0 - dy2)
+        tri_denoms[tri] = denom
+        if abs(denom) < epsilon:
+            tri_bounds[tri, 0] = 0
+            tri_bounds[tri, 1] = 0
+        else:
+            tri_bounds[tri, 0] = max(0, int(math.floor(min(dy0, dy1, dy2))))
+            tri_bounds[tri, 1] = min(height, int(math.ceil(max(dy0, dy1, dy2))))
+        tri_bounds[tri, 2] = max(0, int(math.floor(min(dx0, dx1, dx2))))
+        tri_bounds[tri, 3] = min(width, int(math.ceil(max(dx0, dx1, dx2))))
+    for y in prange(height):
+        sample_y = y + 0.5
+        for tri in range(tri_count):
+            if y < tri_bounds[tri, 0] or y >= tri_bounds[tri, 1]:
+                continue
+            idx0 = triangles[tri, 0]
+            idx1 = triangles[tri, 1]
+            idx2 = triangles[tri, 2]
+            dx0 = vertices[idx0, 0]
+            dy0 = vertices[idx0, 1]
+            dx1 = vertices[idx1, 0]
+            dy1 = vertices[idx1, 1]
+            dx2 = vertices[idx2, 0]
+            dy2 = vertices[idx2, 1]
+            denom = tri_denoms[tri]
+            tri_min_x = tri_bounds[tri, 2]
+            tri_max_x = tri_bounds[tri, 3]
+            sx0 = texcoords[idx0, 0]
+            sy0 = texcoords[idx0, 1]
+            sx1 = texcoords[idx1, 0]
+            sy1 = texcoords[idx1, 1]
+            sx2 = texcoords[idx2, 0]
+            sy2 = texcoords[idx2, 1]
+            for x in range(tri_min_x, tri_max_x):
+                sample_x = x + 0.5
+                w0 = ((dy1 - dy2) * (sample_x - dx2) + (dx2 - dx1) * (sample_y - dy2)) / denom
+                w1 = ((dy2 - dy0) * (sample_x - dx2) + (dx0 - dx2) * (sample_y - dy2)) / denom
+                w2 = 1.0 - w0 - w1
+                if w0 < -epsilon or w1 < -epsilon or w2 < -epsilon:
+                    continue
+                src_x = min(max(w0 * sx0 + w1 * sx1 + w2 * sx2, 0.0), atlas_width - 1.0)
+                src_y = min(max(w0 * sy0 + w1 * sy1 + w2 * sy2, 0.0), atlas_height - 1.0)
+                x0 = int(math.floor(src_x))
+                y0 = int(math.floor(src_y))
+                x1 = min(x0 + 1, atlas_width - 1)
+                y1 = min(y0 + 1, atlas_height - 1)
+                fx = src_x - x0
+                fy = src_y - y0
+                for channel in range(4):
+                    top = atlas[y0, x0, channel] * (1.0 - fx) + atlas[y0, x1, channel] * fx
+                    bottom = atlas[y1, x0, channel] * (1.0 - fx) + atlas[y1, x1, channel] * fx
+                    value = (top * (1.0 - fy) + bottom * fy) * factors[channel]
+                    out[y, x, channel] = int(min(max(value, 0.0), 255.0) + 0.5)
+
+
+# Only worth calling when compiled, like the unpremultiply kernel.
+_rasterize_polygon_kernel = (
+    njit(parallel=True, cache=True)(_rasterize_polygon_rows) if njit is not None else None
+)
+
+
+# numba's default threading layer is not safe to enter from several threads
+# at once, and export post-processing and PSD layer rendering run on pools;
+# every parallel=True kernel call holds this.
+_numba_parallel_lock = threading.Lock()
+# Upper bound on export post-processing/encode threads.
+_EXPORT_POSTPROCESS_WORKERS = 8
+# Rough memory budget for frames queued or in flight on those threads; each
+# holds the readback plus its converted image.
+_EXPORT_IN_FLIGHT_BYTES = 512 * 1024 * 1024
+# Minimum seconds between export progress-dialog refreshes.
+_EXPORT_PROGRESS_INTERVAL = 0.05
+# Budget for atlas images/pixel arrays kept between PSD exports.
+_EXPORT_ATLAS_CACHE_BYTES = 512 * 1024 * 1024
+# Largest single PSD layer raster (1 GiB of RGBA); bigger layers are skipped
+# with a warning instead of exhausting memory.
+_PSD_LAYER_MAX_PIXELS = 1 << 28
+
+
+class _PixelPackPipeline:
+    """
+    Two ping-ponged pixel-pack buffers for pipelined framebuffer readback.
+
+    ``submit`` queues an asynchronous read of the current read buffer and
+    hands back the frame queued before it, so the GPU->CPU copy of frame N
+    overlaps rendering frame N+1. Mapped pixels are copied into one reused
+    host array per slot, so a returned array is only valid until that slot
+    is collected again; pass ``reuse_host_buffers=False`` to get a fresh
+    array per frame instead. Every method needs a current GL context.
+    """
+
+    def __init__(self, width: int, height: int, reuse_host_buffers: bool = True):
+        self.width = width
+        self.height = height
+        self.size = width * height * 4
+        self.buffers: Optional[List[int]] = None
+        self.host_buffers: Optional[List[np.ndarray]] = (
+            [np.empty(self.size, dtype=np.uint8) for _ in range(2)] if reuse_host_buffers else None
+        )
+        self.slot = 0
+        self.pending: List[Optional[int]] = [None, None]
+
+    def submit(self, tag: int) -> List[Tuple[int, Optional[np.ndarray]]]:
+        """Queue a readback tagged ``tag``; return the previously queued frame, if any."""
+        if self.buffers is None:
+            self.buffers = [int(buffer) for buffer in glGenBuffers(2)]
+            for buffer in self.buffers:
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, buffer)
+                glBufferData(GL_PIXEL_PACK_BUFFER, self.size, None, GL_STREAM_READ)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.buffers[self.slot])
+        try:
+            glReadPixels(0, 0, self.width, self.height, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        finally:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self.pending[self.slot] = tag
+        self.slot ^= 1
+        return self._collect(self.slot)
+
+    def drain(self) -> List[Tuple[int, Optional[np.ndarray]]]:
+        """Return every frame still in flight, oldest first."""
+        return self._collect(self.slot) + self._collect(self.slot ^ 1)
+
+    def release(self) -> None:
+        if self.buffers is not None:
+            glDeleteBuffers(2, self.buffers)
+            self.buffers = None
+        self.pending = [None, None]
+
+    def _collect(self, slot: int) -> List[Tuple[int, Optional[np.ndarray]]]:
+        tag = self.pending[slot]
+        if tag is None or self.buffers is None:
+            return []
+        self.pending[slot] = None
+        pixels: Optional[np.ndarray] = None
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.buffers[slot])
+        try:
+            pointer = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+            if pointer:
+                try:
+                    if self.host_buffers is not None:
+                        pixels = self.host_buffers[slot]
+                    else:
+                        pixels = np.empty(self.size, dtype=np.uint8)
+                    ctypes.memmove(pixels.ctypes.data, pointer, self.size)
+                finally:
+                    glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        finally:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        return [(tag, pixels)]
+
+
+def _to_int(value: Any, default: int = 0) -> int:
+    """Coerce a keyframe flag to int, falling back to ``default`` on bad input."""
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _layer_sorted_render_tags(layer: LayerData) -> Tuple[str, ...]:
+    """Return the layer's string render tags in sorted order, memoized on the layer."""
+    tags = layer.sorted_render_tags
+    if tags is None:
+        tags = tuple(sorted(tag for tag in layer.render_tags if isinstance(tag, str)))
+        layer.sorted_render_tags = tags
+    return tags
+
+
+def _layer_sprite_signature(layer: LayerData) -> FrozenSet[str]:
+    """Return the sprite names used by a layer's keyframes, memoized on the layer."""
+    signature = layer.sprite_signature
+    if signature is None:
+        signature = frozenset(frame.sprite_name for frame in layer.keyframes if frame.sprite_name)
+        layer.sprite_signature = signature
+    return signature
+
+
+def _set_value_silently(widget, value: int) -> bool:
+    """Set a widget value without emitting signals; skip no-op updates."""
+    if widget.value() == value:
+        return False
+    was_blocked = widget.blockSignals(True)
+    try:
+        widget.setValue(value)
+    finally:
+        widget.blockSignals(was_blocked)
+    return True
+
+
+def _insort_keyframe(keyframes: List[KeyframeData], frame: KeyframeData) -> None:
+    """Insert a keyframe into a time-sorted track, after any frames at the same time."""
+    insort_right(keyframes, frame, key=_keyframe_time)
+
+
+def _keyframes_sorted(keyframes: List[KeyframeData]) -> bool:
+    """Return True when keyframes are already in non-decreasing time order."""
+    return all(a.time <= b.time for a, b in zip(keyframes, keyframes[1:]))
+
+
+def _ensure_keyframes_sorted(keyframes: List[KeyframeData]) -> None:
+    """Sort a keyframe track in place only if an edit left it out of order."""
+    if not _keyframes_sorted(keyframes):
+        keyframes.sort(key=_keyframe_time)
+
+
+def _merge_keyframes(existing: List[KeyframeData], additions: List[KeyframeData]) -> List[KeyframeData]:
+    """
+    Merge new keyframes into an existing track, returning a time-sorted list.
+
+    Both inputs are merged in linear time when already sorted; ties keep
+    existing frames first, matching a stable sort of ``existing + additions``.
+    """
+    additions = sorted(additions, key=_keyframe_time)
+    if not _keyframes_sorted(existing):
+        merged = existing + additions
+        merged.sort(key=_keyframe_time)
+        return merged
+    return list(heapq.merge(existing, additions, key=_keyframe_time))
 
 
 @dataclass
@@ -72,6 +535,33 @@ class SpriteReplacementRecord:
     sprite_name: str
     source_path: Optional[str]
     applied_at: str
+
+
+@dataclass(slots=True)
+class SpriteManifestEntry:
+    """One sprite written by the Sprite Workshop segment exporter."""
+    name: str
+    file: str
+    size: Tuple[int, int]
+    atlas_region: Dict[str, Any]
+    offset: Tuple[float, float]
+    original_size: Tuple[float, float]
+    pivot: Tuple[float, float]
+
+    @staticmethod
+    def json_default(value: Any) -> Dict[str, Any]:
+        """json.dump hook that serializes manifest entries without a dict pre-pass."""
+        if isinstance(value, SpriteManifestEntry):
+            return {
+                "name": value.name,
+                "file": value.file,
+                "size": value.size,
+                "atlas_region": value.atlas_region,
+                "offset": value.offset,
+                "original_size": value.original_size,
+                "pivot": value.pivot,
+            }
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 from Resources.bin2json.parse_costume_bin import parse_costume_file
 
 
@@ -174,6 +664,8 @@ class MSMAnimationViewer(QMainWindow):
         self.canonical_layer_names: Set[str] = set()
         self.active_costume_key: Optional[str] = None
         self.base_layer_cache: Optional[List[LayerData]] = None
+        # layer_id -> entry of base_layer_cache; rebuilt whenever the cache is.
+        self._base_layer_cache_by_id: Dict[int, LayerData] = {}
         self.base_texture_atlases: List[TextureAtlas] = []
         self.costume_atlas_cache: Dict[str, TextureAtlas] = {}
         self.active_costume_attachments: List[Dict[str, Any]] = []
@@ -189,14 +681,50 @@ class MSMAnimationViewer(QMainWindow):
         self._default_hidden_layer_ids: Set[int] = set()
         self.pose_influence_mode: str = "current"
         self.layer_source_lookup: Dict[int, Dict[str, Any]] = {}
+        # Per-layer sources minus _LAYER_VOLATILE_KEYS; nested values are shared
+        # with layer_source_lookup so in-place edits stay visible.
+        self._layer_source_templates: Dict[int, Dict[str, Any]] = {}
+        # Export reuse: layer_id -> (layer, signature, exported dict). Keyframe
+        # edits mark ids dirty; export clears the set.
+        self._last_exported_layers: Dict[int, Tuple[LayerData, Tuple[Any, ...], Dict[str, Any]]] = {}
+        self._dirty_layer_ids: Set[int] = set()
         self.source_atlas_lookup: Dict[Any, TextureAtlas] = {}
         self._pose_baseline_player: Optional[AnimationPlayer] = None
         self._pose_baseline_lookup: Dict[int, LayerData] = {}
+        self._layer_index_cache: Dict[int, LayerData] = {}
+        self._layer_index_source: Optional[List[LayerData]] = None
+        self._layer_index_size: int = 0
+        self._all_layer_ids_cache: FrozenSet[int] = frozenset()
+        self._layer_name_index_cache: Dict[str, LayerData] = {}
+        self._layer_name_index_source: Optional[List[LayerData]] = None
+        self._layer_name_index_size: int = 0
+        self._sprite_variant_rev: int = 0
+        self._sprite_variant_cache: Optional[Tuple[int, List[LayerData], int, Set[int]]] = None
         self._history_stack: List[Dict[str, Any]] = []
         self._history_redo_stack: List[Dict[str, Any]] = []
         self._pending_keyframe_action: Optional[Dict[str, Any]] = None
         self._timeline_user_scrubbing: bool = False
+        self._ui_batch_depth: int = 0
+        self._pending_ui_flags: int = 0
+        self._pending_marker_delta: Optional[Tuple[List[float], List[float]]] = None
         self._resume_audio_after_scrub: bool = False
+        # (width, height) -> (fbo, texture) offscreen export target, reused
+        # across frames; only the most recent size is kept.
+        self._export_fbo_cache: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        # (width, height) -> host array glReadPixels writes into, kept in step
+        # with the export target above.
+        self._readback_buffers: Dict[Tuple[int, int], np.ndarray] = {}
+        # (view key, projection, modelview) for the most recent export view.
+        self._export_view_matrix_cache: Optional[Tuple[Tuple[Any, ...], np.ndarray, np.ndarray]] = None
+        # atlas path -> [file stamp, RGBA image, uint8 pixels or None, sprite
+        # crops, entry bytes], shared across PSD exports; least recently used
+        # entries go first past the byte budget.
+        self._export_atlas_cache: OrderedDict[str, List[Any]] = OrderedDict()
+        self._export_atlas_cache_bytes: int = 0
+        # (include_hidden, quantized time) -> frame bounds, valid while the
+        # view-state token matches; edits clear it via _invalidate_frame_bounds_cache.
+        self._frame_bounds_cache: Dict[Tuple[bool, int], Optional[Tuple[float, float, float, float]]] = {}
+        self._frame_bounds_token: Optional[Tuple[Any, ...]] = None
         self.solid_bg_enabled: bool = self.settings.value('export/solid_bg_enabled', False, type=bool)
         solid_bg_hex = self.settings.value('export/solid_bg_color', '#000000FF', type=str) or '#000000FF'
         self.solid_bg_color: Tuple[int, int, int, int] = self._parse_rgba_hex(solid_bg_hex, (0, 0, 0, 255))
@@ -204,11 +732,24 @@ class MSMAnimationViewer(QMainWindow):
         self._layer_thumbnail_cache: Dict[str, Optional[QPixmap]] = {}
         self._atlas_image_cache: Dict[str, Optional[Image.Image]] = {}
         self._layer_sprite_preview_state: Dict[int, Optional[str]] = {}
-        self._selected_marker_times: Set[float] = set()
+        # Sprite picker thumbnails live in QPixmapCache under a revisioned key so
+        # they survive layer-panel thumbnail resets but not atlas changes.
+        self._sprite_pixmap_atlas_rev: int = 0
+        self._sprite_pixmap_missing: Set[str] = set()
+        # Flat sprite name -> (sprite, atlas) map over gl_widget.texture_atlases,
+        # rebuilt when the atlas list or _sprite_pixmap_atlas_rev changes.
+        self._sprite_lookup: Dict[str, Tuple[SpriteInfo, TextureAtlas]] = {}
+        self._sprite_lookup_source: Optional[List[TextureAtlas]] = None
+        self._sprite_lookup_key: Optional[Tuple[int, int]] = None
+        # Sorted, tolerance-deduplicated marker times; every writer stores a fresh list.
+        self._selected_marker_times: List[float] = []
         self._atlas_original_image_cache: Dict[str, Optional[Image.Image]] = {}
         self._atlas_modified_images: Dict[str, Image.Image] = {}
+        self._atlas_modified_arrays: Dict[str, np.ndarray] = {}
         self._sprite_replacements: Dict[Tuple[str, str], SpriteReplacementRecord] = {}
+        self._sprite_replacements_per_atlas: Dict[str, int] = {}
         self._atlas_dirty_flags: Dict[str, bool] = {}
+        self._atlas_preferred_color_bits: Dict[str, Tuple[int, int]] = {}
         self._sprite_workshop_dialog: Optional[SpriteWorkshopDialog] = None
         self._keyframe_clipboard: Optional[Dict[str, Any]] = None
         self._hang_watchdog_active: bool = False
@@ -295,6 +836,11 @@ class MSMAnimationViewer(QMainWindow):
         self.gl_widget.animation_looped.connect(self.on_animation_looped)
         self.gl_widget.playback_state_changed.connect(self.on_playback_state_changed)
         self.gl_widget.transform_action_committed.connect(self._record_transform_action)
+        # Caps viewer repaints from continuous spinbox/slider drags at ~60 Hz.
+        self._gl_update_throttle = QTimer(self)
+        self._gl_update_throttle.setSingleShot(True)
+        self._gl_update_throttle.setInterval(16)
+        self._gl_update_throttle.timeout.connect(self.gl_widget.update)
         splitter.addWidget(self.gl_widget)
         
         # Right panel - Layer visibility
@@ -424,6 +970,7 @@ class MSMAnimationViewer(QMainWindow):
         return True
 
     def _apply_history_action(self, action: Dict[str, Any], *, undo: bool):
+        self._invalidate_frame_bounds_cache()
         action_type = action.get('type')
         label = action.get('label') or action_type or "edit"
         if action_type == 'transform':
@@ -440,6 +987,7 @@ class MSMAnimationViewer(QMainWindow):
         self.log_widget.log(f"{message} {label}", "INFO")
 
     def _push_history_action(self, action: Dict[str, Any]):
+        self._invalidate_frame_bounds_cache()
         self._history_stack.append(action)
         self._history_redo_stack.clear()
         self._update_keyframe_history_controls()
@@ -1668,10 +2216,10 @@ class MSMAnimationViewer(QMainWindow):
             visible=layer.visible,
             shader_name=layer.shader_name,
             color_tint=copy.deepcopy(layer.color_tint),
-            color_tint_hdr=copy.deepcopy(getattr(layer, "color_tint_hdr", None)),
-            color_gradient=copy.deepcopy(getattr(layer, "color_gradient", None)),
-            color_animator=copy.deepcopy(getattr(layer, "color_animator", None)),
-            color_metadata=copy.deepcopy(getattr(layer, "color_metadata", None)),
+            color_tint_hdr=copy.deepcopy(layer.color_tint_hdr),
+            color_gradient=copy.deepcopy(layer.color_gradient),
+            color_animator=copy.deepcopy(layer.color_animator),
+            color_metadata=copy.deepcopy(layer.color_metadata),
             render_tags=set(layer.render_tags)
         )
 
@@ -1885,6 +2433,7 @@ class MSMAnimationViewer(QMainWindow):
                 layer_remap_overrides[new_layer.layer_id] = remap_info
                 if source_layer:
                     source_layer.render_tags.add("neutral_color")
+                    source_layer.sorted_render_tags = None
                 if self._remap_targets_costume_sheet(remap_info):
                     base_opacity = self._layer_default_opacity(source_layer)
                     if base_opacity is not None and base_opacity < 99.5:
@@ -2029,6 +2578,7 @@ class MSMAnimationViewer(QMainWindow):
 
         if entry is None:
             animation.layers = self._clone_layers(self.base_layer_cache)
+            self._invalidate_layer_index()
             self.gl_widget.texture_atlases = list(self.base_texture_atlases)
             self.gl_widget.set_layer_atlas_overrides({})
             self.gl_widget.set_layer_pivot_context({})
@@ -2095,6 +2645,7 @@ class MSMAnimationViewer(QMainWindow):
         self.gl_widget.texture_atlases = combined_atlases
 
         animation.layers = layers
+        self._invalidate_layer_index()
         self._record_layer_defaults(animation.layers)
         self.active_costume_key = entry.key
         overrides, pivot_context = self._build_layer_atlas_overrides(
@@ -2279,8 +2830,9 @@ class MSMAnimationViewer(QMainWindow):
         layer_remap_overrides: Dict[int, Dict[str, Any]]
     ):
         """Mutate keyframes according to per-layer remap definitions."""
+        self._bump_sprite_variant_rev()
         for layer in layers:
-            render_tags = getattr(layer, "render_tags", set())
+            render_tags = layer.render_tags
             force_full_opacity = (
                 isinstance(render_tags, set)
                 and "overlay_force_opaque" in render_tags
@@ -2293,6 +2845,8 @@ class MSMAnimationViewer(QMainWindow):
             has_custom_color = self._layer_has_costume_color(layer)
             if not has_custom_color:
                 render_tags.add("neutral_color")
+                layer.sorted_render_tags = None
+            layer.sprite_signature = None
             for keyframe in layer.keyframes:
                 sprite_name = keyframe.sprite_name or ""
                 remapped = self._remap_sprite(sprite_name, remap_info)
@@ -2450,9 +3004,9 @@ class MSMAnimationViewer(QMainWindow):
 
     def _layer_has_costume_color(self, layer: LayerData) -> bool:
         """Return True if the costume authored a tint/gradient for this layer."""
-        if getattr(layer, "color_gradient", None) or getattr(layer, "color_animator", None):
+        if layer.color_gradient or layer.color_animator:
             return True
-        metadata = getattr(layer, "color_metadata", None)
+        metadata = layer.color_metadata
         if not isinstance(metadata, dict):
             return False
         profile = metadata.get("_color_profile")
@@ -2514,7 +3068,7 @@ class MSMAnimationViewer(QMainWindow):
     @staticmethod
     def _overlay_anchor_name(layer: LayerData) -> Optional[str]:
         """Return the overlay anchor stored in render tags, if any."""
-        for tag in getattr(layer, "render_tags", set()):
+        for tag in layer.render_tags:
             if tag.startswith("overlay_ref:"):
                 anchor = tag.split(":", 1)[1].strip().lower()
                 if anchor:
@@ -2524,7 +3078,7 @@ class MSMAnimationViewer(QMainWindow):
     @staticmethod
     def _overlay_reference_name(layer: LayerData) -> Optional[str]:
         """Return the shading/mask reference stored in render tags, if any."""
-        for tag in getattr(layer, "render_tags", set()):
+        for tag in layer.render_tags:
             if tag.startswith("overlay_ref_source:"):
                 ref = tag.split(":", 1)[1].strip().lower()
                 if ref:
@@ -4148,6 +4702,7 @@ class MSMAnimationViewer(QMainWindow):
         preserved_costume_entry: Optional[CostumeEntry] = None
         previous_costume_key = self.active_costume_key
         self.layer_source_lookup = {}
+        self._layer_source_templates = {}
 
         self.control_panel.set_pose_controls_enabled(False)
         self._start_hang_watchdog("load_animation")
@@ -4160,6 +4715,10 @@ class MSMAnimationViewer(QMainWindow):
             self.layer_source_lookup = {
                 layer.get('id', idx): layer for idx, layer in enumerate(raw_layers)
             }
+            self._layer_source_templates = {
+                layer_id: _layer_source_template(layer)
+                for layer_id, layer in self.layer_source_lookup.items()
+            }
             
             self.log_widget.log(f"Loading animation: {anim_data['name']}", "INFO")
             self.current_animation_name = anim_data.get('name')
@@ -4192,9 +4751,13 @@ class MSMAnimationViewer(QMainWindow):
             self._record_layer_defaults(layers)
             self._apply_cached_layer_visibility(layers)
             self.base_layer_cache = self._clone_layers(layers)
+            self._base_layer_cache_by_id = {
+                cached.layer_id: cached for cached in self.base_layer_cache
+            }
             self._configure_costume_shaders(None, None)
 
             self.gl_widget.player.load_animation(animation)
+            self._invalidate_layer_index()
             self.gl_widget.set_layer_atlas_overrides({})
             self.gl_widget.set_layer_pivot_context({})
             self._reset_costume_runtime_state(animation.layers)
@@ -4648,10 +5211,77 @@ class MSMAnimationViewer(QMainWindow):
             return 0.35
         return 1.0
     
+    @contextmanager
+    def _batch_ui_updates(self):
+        """Defer panel/thumbnail/timeline/GL refreshes until the outermost batch exits."""
+        self._ui_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._ui_batch_depth -= 1
+            if self._ui_batch_depth == 0:
+                self._flush_ui_updates()
+
+    def _request_ui_refresh(self, flags: int) -> None:
+        """Queue UI refresh work, running it immediately outside of a batch."""
+        self._pending_ui_flags |= flags
+        if self._ui_batch_depth == 0:
+            self._flush_ui_updates()
+
+    def _queue_marker_delta(self, added: List[float], removed: List[float]) -> None:
+        """
+        Queue an incremental timeline marker update.
+
+        ``removed`` times drop every marker within the marker tolerance, so
+        callers must only pass times whose keyframes were cleared from all
+        layers the timeline shows. A second delta in the same batch falls back
+        to a full marker rebuild.
+        """
+        if self._pending_marker_delta is not None:
+            self._request_ui_refresh(_UI_REFRESH_TIMELINE)
+            return
+        self._pending_marker_delta = (list(added), list(removed))
+        self._request_ui_refresh(_UI_REFRESH_MARKER_DELTA)
+
+    def _flush_ui_updates(self) -> None:
+        """Run each queued UI refresh once, in dependency order."""
+        flags = self._pending_ui_flags
+        self._pending_ui_flags = 0
+        if not flags:
+            return
+        animation = self.gl_widget.player.animation
+        if animation and flags & _UI_REFRESH_LAYER_ORDER and not flags & _UI_REFRESH_LAYER_PANEL:
+            if not self.layer_panel.set_order(animation.layers):
+                flags |= _UI_REFRESH_LAYER_REBUILD
+        if animation and flags & _UI_REFRESH_LAYER_PANEL:
+            self.layer_panel.update_layers(animation.layers)
+        elif animation and flags & _UI_REFRESH_LAYER_VISIBILITY:
+            self.layer_panel.set_visibility_bits(
+                {layer.layer_id: layer.visible for layer in animation.layers}
+            )
+        if animation and flags & _UI_REFRESH_VARIANTS:
+            variant_layers = self._detect_layers_with_sprite_variants(animation.layers)
+            self.layer_panel.set_layers_with_sprite_variants(variant_layers)
+        if flags & _UI_REFRESH_SELECTION:
+            self.layer_panel.set_selection_state(self.selected_layer_ids)
+        marker_delta = self._pending_marker_delta
+        self._pending_marker_delta = None
+        if flags & _UI_REFRESH_TIMELINE or (marker_delta is None and flags & _UI_REFRESH_MARKER_DELTA):
+            self.update_timeline()
+        elif marker_delta is not None:
+            self._apply_timeline_marker_delta(*marker_delta)
+        if flags & _UI_REFRESH_THUMBNAIL_CACHE:
+            self._reset_layer_thumbnail_cache()
+        if flags & (_UI_REFRESH_THUMBNAILS | _UI_REFRESH_THUMBNAIL_CACHE):
+            self._refresh_layer_thumbnails()
+        if flags & _UI_REFRESH_GL:
+            self.gl_widget.update()
+
     def update_layer_panel(self):
         """Update the layer visibility panel"""
         animation = self.gl_widget.player.animation
         self._reset_layer_thumbnail_cache()
+        self._invalidate_sprite_pixmaps()
         if animation:
             self.layer_panel.set_default_hidden_layers(self._default_hidden_layer_ids)
             self.layer_panel.update_layers(animation.layers)
@@ -4710,10 +5340,54 @@ class MSMAnimationViewer(QMainWindow):
         base = self._load_atlas_image(atlas)
         if base is None:
             return None
-        mutable = base.copy()
+        # The NumPy array owns the pixels and the PIL image is a zero-copy view
+        # of it, so patches written into the array are visible to crops and
+        # exports without re-serializing the atlas.
+        pixels = np.array(base, dtype=np.uint8)
+        mutable = Image.frombuffer("RGBA", base.size, pixels, "raw", "RGBA", 0, 1)
+        self._atlas_modified_arrays[key] = pixels
         self._atlas_modified_images[key] = mutable
         return mutable
 
+    def _mutable_atlas_pixels(self, atlas: TextureAtlas) -> Optional[np.ndarray]:
+        """Return the writable (H, W, 4) pixel array backing an atlas's mutable bitmap."""
+        if self._ensure_mutable_atlas_bitmap(atlas) is None:
+            return None
+        return self._atlas_modified_arrays.get(self._atlas_cache_key(atlas))
+
+    @staticmethod
+    def _write_atlas_region(pixels: np.ndarray, x: int, y: int, patch: Any) -> np.ndarray:
+        """
+        Copy patch pixels into the atlas array at (x, y) and return the written view.
+
+        The patch is clipped to the canvas like ``Image.paste``; the view starts
+        at the clamped origin and is empty when the patch lies fully outside.
+        """
+        patch_pixels = np.asarray(patch, dtype=np.uint8)
+        height, width = patch_pixels.shape[:2]
+        canvas_height, canvas_width = pixels.shape[:2]
+        left, top = max(0, x), max(0, y)
+        right, bottom = min(canvas_width, x + width), min(canvas_height, y + height)
+        if right <= left or bottom <= top:
+            return pixels[0:0, 0:0]
+        region = pixels[top:bottom, left:right]
+        region[...] = patch_pixels[top - y:bottom - y, left - x:right - x]
+        return region
+
+    @staticmethod
+    def _atlas_rects_disjoint(rects: List[Tuple[int, int, int, int]]) -> bool:
+        """Return True when no two (x, y, w, h) atlas rects share a pixel."""
+        ordered = sorted(rect for rect in rects if rect[2] > 0 and rect[3] > 0)
+        active: List[Tuple[int, int, int, int]] = []
+        for x, y, w, h in ordered:
+            # Sweep left to right; only rects still spanning column x can collide.
+            active = [rect for rect in active if rect[0] + rect[2] > x]
+            for _, other_y, _, other_h in active:
+                if y < other_y + other_h and other_y < y + h:
+                    return False
+            active.append((x, y, w, h))
+        return True
+
     def _original_atlas_bitmap(self, atlas: TextureAtlas) -> Optional[Image.Image]:
         """Return the pristine atlas bitmap saved when it was first loaded."""
         key = self._atlas_cache_key(atlas)
@@ -4729,9 +5403,15 @@ class MSMAnimationViewer(QMainWindow):
         self._atlas_original_image_cache[key] = backup
         return backup
 
-    def _extract_sprite_bitmap(self, atlas: TextureAtlas, sprite: SpriteInfo) -> Optional[Image.Image]:
+    def _extract_sprite_bitmap(
+        self,
+        atlas: TextureAtlas,
+        sprite: SpriteInfo,
+        atlas_image: Optional[Image.Image] = None,
+    ) -> Optional[Image.Image]:
         """Return a PIL image for a sprite, un-rotated for editing."""
-        atlas_image = self._load_atlas_image(atlas)
+        if atlas_image is None:
+            atlas_image = self._load_atlas_image(atlas)
         if not atlas_image:
             return None
         box = (
@@ -4777,7 +5457,7 @@ class MSMAnimationViewer(QMainWindow):
         edited_image: Image.Image,
     ) -> Tuple[Optional[Image.Image], Optional[str]]:
         """Return an atlas-oriented patch for a sprite edit, or an error message."""
-        image = edited_image.convert("RGBA")
+        image = edited_image if edited_image.mode == "RGBA" else edited_image.convert("RGBA")
         expected_w = int(sprite.w)
         expected_h = int(sprite.h)
         tolerance_px = 2
@@ -4805,9 +5485,19 @@ class MSMAnimationViewer(QMainWindow):
         patch = patch.crop((0, 0, expected_w, expected_h))
         return patch, None
 
-    def _upload_sprite_patch(self, atlas: TextureAtlas, sprite: SpriteInfo, patch: Image.Image):
-        """Upload a sprite region patch to the GPU texture."""
-        if not patch:
+    def _upload_sprite_patch(self, atlas: TextureAtlas, sprite: SpriteInfo, patch: Any):
+        """Upload a sprite region patch (PIL image or RGBA array) to the GPU texture."""
+        if patch is None:
+            return
+        self._upload_sprite_patches(atlas, [(sprite, patch)])
+
+    def _upload_sprite_patches(
+        self,
+        atlas: TextureAtlas,
+        patches: List[Tuple[SpriteInfo, Any]],
+    ) -> None:
+        """Upload several sprite region patches under a single context switch."""
+        if not patches:
             return
         if not atlas.texture_id:
             self.gl_widget.makeCurrent()
@@ -4817,24 +5507,29 @@ class MSMAnimationViewer(QMainWindow):
                 self.gl_widget.doneCurrent()
         if not atlas.texture_id:
             return
-        arr = np.array(patch, dtype=np.float32) / 255.0
-        alpha = arr[..., 3:4]
-        arr[..., :3] *= alpha
-        arr = (arr * 255.0).astype(np.uint8)
         self.gl_widget.makeCurrent()
         try:
             glBindTexture(GL_TEXTURE_2D, atlas.texture_id)
-            glTexSubImage2D(
-                GL_TEXTURE_2D,
-                0,
-                int(sprite.x),
-                int(sprite.y),
-                patch.width,
-                patch.height,
-                GL_RGBA,
-                GL_UNSIGNED_BYTE,
-                arr.tobytes(),
-            )
+            for sprite, patch in patches:
+                pixels = np.asarray(patch, dtype=np.uint8)
+                if pixels.size == 0:
+                    continue
+                arr = pixels.astype(np.float32) / 255.0
+                alpha = arr[..., 3:4]
+                arr[..., :3] *= alpha
+                arr = np.ascontiguousarray((arr * 255.0).astype(np.uint8))
+                # Patches are clipped to the atlas, so negative origins start at 0.
+                glTexSubImage2D(
+                    GL_TEXTURE_2D,
+                    0,
+                    max(0, int(sprite.x)),
+                    max(0, int(sprite.y)),
+                    arr.shape[1],
+                    arr.shape[0],
+                    GL_RGBA,
+                    GL_UNSIGNED_BYTE,
+                    arr,
+                )
         finally:
             self.gl_widget.doneCurrent()
 
@@ -4846,23 +5541,55 @@ class MSMAnimationViewer(QMainWindow):
         source_path: Optional[str] = None,
     ) -> bool:
         """Paste a prepared patch into the atlas bitmap and upload it."""
-        atlas_bitmap = self._ensure_mutable_atlas_bitmap(atlas)
-        if atlas_bitmap is None or patch is None:
+        atlas_pixels = self._mutable_atlas_pixels(atlas)
+        if atlas_pixels is None or patch is None:
             return False
-        atlas_bitmap.paste(patch, (int(sprite.x), int(sprite.y)))
-        self._upload_sprite_patch(atlas, sprite, patch)
+        region = self._write_atlas_region(atlas_pixels, int(sprite.x), int(sprite.y), patch)
+        self._upload_sprite_patch(atlas, sprite, region)
+        self._record_sprite_replacement(atlas, sprite, source_path)
+        self._reset_layer_thumbnail_cache()
+        self.gl_widget.update()
+        return True
+
+    def _record_sprite_replacement(
+        self,
+        atlas: TextureAtlas,
+        sprite: SpriteInfo,
+        source_path: Optional[str],
+    ) -> None:
+        """Mark a sprite as overridden and its atlas as dirty."""
         key = self._sprite_workshop_key(atlas, sprite.name)
         atlas_key = key[0]
         self._atlas_dirty_flags[atlas_key] = True
+        self._atlas_preferred_color_bits.pop(atlas_key, None)
+        self._invalidate_sprite_pixmaps()
+        if key not in self._sprite_replacements:
+            self._sprite_replacements_per_atlas[atlas_key] = (
+                self._sprite_replacements_per_atlas.get(atlas_key, 0) + 1
+            )
         self._sprite_replacements[key] = SpriteReplacementRecord(
             atlas_key=atlas_key,
             sprite_name=sprite.name,
-            source_path=os.path.abspath(source_path) if source_path else None,
+            source_path=(
+                source_path if not source_path or os.path.isabs(source_path)
+                else os.path.abspath(source_path)
+            ),
             applied_at=datetime.now().isoformat(timespec="seconds"),
         )
-        self._reset_layer_thumbnail_cache()
-        self.gl_widget.update()
-        return True
+
+    @staticmethod
+    def _open_rgba_image(file_path: str) -> Image.Image:
+        """Load an image from disk as RGBA, skipping the conversion copy when possible."""
+        try:
+            image = Image.open(file_path, formats=_SPRITE_IMAGE_FORMATS)
+        except UnidentifiedImageError:
+            # Fall back to every registered plugin (AVIF/HEIF sheets, etc.).
+            image = Image.open(file_path)
+        # Loading closes the underlying file handle for single-frame images.
+        image.load()
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        return image
 
     def replace_sprite_from_file(
         self,
@@ -4872,7 +5599,7 @@ class MSMAnimationViewer(QMainWindow):
     ) -> Tuple[bool, str]:
         """Replace a sprite region with pixels loaded from disk."""
         try:
-            edited = Image.open(file_path).convert("RGBA")
+            edited = self._open_rgba_image(file_path)
         except Exception as exc:
             return False, f"Failed to load image: {exc}"
         patch, error = self._prepare_patch_for_sprite(sprite, edited)
@@ -4892,7 +5619,7 @@ class MSMAnimationViewer(QMainWindow):
         if key not in self._sprite_replacements:
             return False
         original = self._original_atlas_bitmap(atlas)
-        target = self._ensure_mutable_atlas_bitmap(atlas)
+        target = self._mutable_atlas_pixels(atlas)
         if original is None or target is None:
             return False
         region = (
@@ -4901,15 +5628,19 @@ class MSMAnimationViewer(QMainWindow):
             int(sprite.x + sprite.w),
             int(sprite.y + sprite.h),
         )
-        patch = original.crop(region)
-        target.paste(patch, (region[0], region[1]))
-        self._upload_sprite_patch(atlas, sprite, patch)
+        restored = self._write_atlas_region(target, region[0], region[1], original.crop(region))
+        self._upload_sprite_patch(atlas, sprite, restored)
         del self._sprite_replacements[key]
         atlas_key = key[0]
-        still_dirty = any(k[0] == atlas_key for k in self._sprite_replacements.keys())
-        if not still_dirty:
+        self._atlas_preferred_color_bits.pop(atlas_key, None)
+        remaining = self._sprite_replacements_per_atlas.get(atlas_key, 0) - 1
+        if remaining > 0:
+            self._sprite_replacements_per_atlas[atlas_key] = remaining
+        else:
+            self._sprite_replacements_per_atlas.pop(atlas_key, None)
             self._atlas_dirty_flags.pop(atlas_key, None)
         self._reset_layer_thumbnail_cache()
+        self._invalidate_sprite_pixmaps()
         self.gl_widget.update()
         self.log_widget.log(
             f"Sprite '{sprite.name}' restored to atlas defaults.",
@@ -4959,46 +5690,54 @@ class MSMAnimationViewer(QMainWindow):
         atlas_label = self._atlas_display_name(atlas)
         atlas_dir = os.path.join(destination, self._sanitize_filename(atlas_label))
         os.makedirs(atlas_dir, exist_ok=True)
-        manifest_entries: List[Dict[str, Any]] = []
+        atlas_image = self._load_atlas_image(atlas)
+        if atlas_image is None:
+            return False, "Unable to load atlas pixels."
+        # Resolve the directory prefix once; per-sprite paths are plain concatenation.
+        path_prefix = os.path.join(atlas_dir, "")
+        sanitize = self._sanitize_filename
+        manifest_entries: List[Optional[SpriteManifestEntry]] = [None] * len(sprite_names)
         exported = 0
         for name in sprite_names:
             sprite = atlas.sprites.get(name)
             if not sprite:
                 continue
-            image = self._extract_sprite_bitmap(atlas, sprite)
+            image = self._extract_sprite_bitmap(atlas, sprite, atlas_image)
             if not image:
                 continue
-            filename = f"{self._sanitize_filename(sprite.name)}.png"
-            export_path = os.path.join(atlas_dir, filename)
-            image.save(export_path, "PNG")
-            exported += 1
-            manifest_entries.append(
-                {
-                    "name": sprite.name,
-                    "file": filename,
-                    "size": [image.width, image.height],
-                    "atlas_region": {
-                        "x": int(sprite.x),
-                        "y": int(sprite.y),
-                        "w": int(sprite.w),
-                        "h": int(sprite.h),
-                        "rotated": bool(sprite.rotated),
-                    },
-                    "offset": [sprite.offset_x, sprite.offset_y],
-                    "original_size": [sprite.original_w, sprite.original_h],
-                    "pivot": [sprite.pivot_x, sprite.pivot_y],
-                }
+            filename = f"{sanitize(sprite.name)}.png"
+            image.save(path_prefix + filename, "PNG")
+            manifest_entries[exported] = SpriteManifestEntry(
+                name=sprite.name,
+                file=filename,
+                size=(image.width, image.height),
+                atlas_region={
+                    "x": int(sprite.x),
+                    "y": int(sprite.y),
+                    "w": int(sprite.w),
+                    "h": int(sprite.h),
+                    "rotated": bool(sprite.rotated),
+                },
+                offset=(sprite.offset_x, sprite.offset_y),
+                original_size=(sprite.original_w, sprite.original_h),
+                pivot=(sprite.pivot_x, sprite.pivot_y),
             )
+            exported += 1
         if exported == 0:
             return False, "No sprites could be exported."
+        del manifest_entries[exported:]
         manifest = {
             "atlas": atlas_label,
             "image_size": [atlas.image_width, atlas.image_height],
             "sprites": manifest_entries,
         }
-        manifest_path = os.path.join(atlas_dir, "manifest.json")
-        with open(manifest_path, "w", encoding="utf-8") as handle:
-            json.dump(manifest, handle, indent=2)
+        manifest_path = path_prefix + "manifest.json"
+        if orjson is not None:
+            with open(manifest_path, "wb") as handle:
+                handle.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        else:
+            with open(manifest_path, "w", encoding="utf-8") as handle:
+                json.dump(manifest, handle, indent=2, default=SpriteManifestEntry.json_default)
         self.log_widget.log(
             f"Exported {exported} sprite{'s' if exported != 1 else ''} from {atlas_label} to {atlas_dir}.",
             "SUCCESS",
@@ -5017,6 +5756,9 @@ class MSMAnimationViewer(QMainWindow):
         )
         if atlas.is_hires:
             root.set("hires", "true")
+        # Bound formatter avoids per-value f-string dispatch on large atlases.
+        fmt = "{:.6f}".format
+        uv_scale = np.array([atlas.image_width, atlas.image_height], dtype=np.float64)
         for sprite in sorted(atlas.sprites.values(), key=lambda info: info.name.lower()):
             elem = ET.SubElement(
                 root,
@@ -5027,29 +5769,58 @@ class MSMAnimationViewer(QMainWindow):
                     "y": str(int(sprite.y)),
                     "w": str(int(sprite.w)),
                     "h": str(int(sprite.h)),
-                    "pX": f"{float(sprite.pivot_x):.6f}",
-                    "pY": f"{float(sprite.pivot_y):.6f}",
-                    "oX": f"{float(sprite.offset_x):.6f}",
-                    "oY": f"{float(sprite.offset_y):.6f}",
-                    "oW": f"{float(sprite.original_w):.6f}",
-                    "oH": f"{float(sprite.original_h):.6f}",
+                    "pX": fmt(float(sprite.pivot_x)),
+                    "pY": fmt(float(sprite.pivot_y)),
+                    "oX": fmt(float(sprite.offset_x)),
+                    "oY": fmt(float(sprite.offset_y)),
+                    "oW": fmt(float(sprite.original_w)),
+                    "oH": fmt(float(sprite.original_h)),
                 },
             )
             if sprite.rotated:
                 elem.set("r", "y")
             if sprite.vertices:
-                verts = " ".join(f"{x:.6f} {y:.6f}" for x, y in sprite.vertices)
-                ET.SubElement(elem, "vertices").text = verts
+                flat = np.asarray(sprite.vertices, dtype=np.float64).ravel()
+                ET.SubElement(elem, "vertices").text = " ".join(map(fmt, flat.tolist()))
             if sprite.vertices_uv:
                 # Convert normalized UV data back to pixel coordinates.
-                uv_pairs = []
-                for u, v in sprite.vertices_uv:
-                    uv_pairs.append(f"{u * atlas.image_width:.6f} {v * atlas.image_height:.6f}")
-                ET.SubElement(elem, "verticesUV").text = " ".join(uv_pairs)
+                uv_pixels = np.asarray(sprite.vertices_uv, dtype=np.float64) * uv_scale
+                ET.SubElement(elem, "verticesUV").text = " ".join(map(fmt, uv_pixels.ravel().tolist()))
             if sprite.triangles:
                 ET.SubElement(elem, "triangles").text = " ".join(str(idx) for idx in sprite.triangles)
         return ET.ElementTree(root)
 
+    def _build_atlas_xml_text(self, atlas: TextureAtlas, image_name: str) -> Optional[str]:
+        """
+        Return the atlas XML as a string for atlases made of plain quads.
+
+        The schema is fixed, so the document is emitted directly instead of
+        through ElementTree. Returns None when any sprite carries mesh data so
+        callers can use _build_atlas_xml_tree for those atlases.
+        """
+        sprites = sorted(atlas.sprites.values(), key=lambda info: info.name.lower())
+        if any(sprite.vertices or sprite.vertices_uv or sprite.triangles for sprite in sprites):
+            return None
+        fmt = "{:.6f}".format
+        hires = ' hires="true"' if atlas.is_hires else ""
+        parts = [
+            "<?xml version='1.0' encoding='utf-8'?>\n",
+            f"<TextureAtlas imagePath={quoteattr(image_name)} "
+            f'width="{atlas.image_width}" height="{atlas.image_height}"{hires}>\n',
+        ]
+        append = parts.append
+        for sprite in sprites:
+            rotated = ' r="y"' if sprite.rotated else ""
+            append(
+                f'  <sprite n={quoteattr(sprite.name)} x="{int(sprite.x)}" y="{int(sprite.y)}" '
+                f'w="{int(sprite.w)}" h="{int(sprite.h)}" '
+                f'pX="{fmt(float(sprite.pivot_x))}" pY="{fmt(float(sprite.pivot_y))}" '
+                f'oX="{fmt(float(sprite.offset_x))}" oY="{fmt(float(sprite.offset_y))}" '
+                f'oW="{fmt(float(sprite.original_w))}" oH="{fmt(float(sprite.original_h))}"{rotated} />\n'
+            )
+        append("</TextureAtlas>\n")
+        return "".join(parts)
+
     def export_modified_spritesheet(self, atlas: TextureAtlas, output_png: str) -> Tuple[bool, str]:
         """Write the current atlas bitmap plus an updated XML manifest."""
         os.makedirs(os.path.dirname(output_png) or ".", exist_ok=True)
@@ -5060,6 +5831,23 @@ class MSMAnimationViewer(QMainWindow):
         atlas_image.save(output_png, "PNG")
         xml_output = os.path.splitext(output_png)[0] + ".xml"
         existing_xml = getattr(atlas, "xml_path", None)
+        root_attrs = {
+            "imagePath": os.path.basename(output_png),
+            "width": str(atlas.image_width),
+            "height": str(atlas.image_height),
+        }
+        if atlas.is_hires:
+            root_attrs["hires"] = "true"
+        if (
+            existing_xml
+            and os.path.exists(existing_xml)
+            and rewrite_atlas_xml_root(existing_xml, xml_output, root_attrs)
+        ):
+            self.log_widget.log(
+                f"Exported spritesheet '{self._atlas_display_name(atlas)}' to {output_png} and {xml_output}.",
+                "SUCCESS",
+            )
+            return True, xml_output
         xml_tree: Optional[ET.ElementTree] = None
         if existing_xml and os.path.exists(existing_xml):
             try:
@@ -5072,9 +5860,18 @@ class MSMAnimationViewer(QMainWindow):
                     xml_root.set("hires", "true")
             except Exception:
                 xml_tree = None
-        if xml_tree is None:
-            xml_tree = self._build_atlas_xml_tree(atlas, os.path.basename(output_png))
-        xml_tree.write(xml_output, encoding="utf-8", xml_declaration=True)
+        if xml_tree is not None:
+            xml_tree.write(xml_output, encoding="utf-8", xml_declaration=True)
+        else:
+            image_name = os.path.basename(output_png)
+            xml_text = self._build_atlas_xml_text(atlas, image_name)
+            if xml_text is not None:
+                with open(xml_output, "w", encoding="utf-8") as handle:
+                    handle.write(xml_text)
+            else:
+                self._build_atlas_xml_tree(atlas, image_name).write(
+                    xml_output, encoding="utf-8", xml_declaration=True
+                )
         self.log_widget.log(
             f"Exported spritesheet '{self._atlas_display_name(atlas)}' to {output_png} and {xml_output}.",
             "SUCCESS",
@@ -5102,40 +5899,72 @@ class MSMAnimationViewer(QMainWindow):
             return False, "Failed to parse spritesheet XML."
 
         try:
-            with Image.open(import_atlas.image_path) as raw_sheet:
-                sheet_image = raw_sheet.convert("RGBA")
+            sheet_image = self._open_rgba_image(import_atlas.image_path)
         except Exception as exc:
             return False, f"Failed to open spritesheet image: {exc}"
 
-        imported = 0
+        atlas_pixels = self._mutable_atlas_pixels(atlas)
+        if atlas_pixels is None:
+            return False, "Unable to update atlas texture."
+        sheet_pixels = np.asarray(sheet_image, dtype=np.uint8)
+        sheet_h, sheet_w = sheet_pixels.shape[:2]
+
+        # Resolved once so per-sprite bookkeeping does not re-normalize the path.
+        source_path = os.path.abspath(image_path)
         skipped: List[str] = []
+        jobs: List[Tuple[SpriteInfo, np.ndarray]] = []
         for sprite_name, source_sprite in import_atlas.sprites.items():
             target_sprite = atlas.sprites.get(sprite_name)
             if not target_sprite:
                 continue
-            region = (
-                int(source_sprite.x),
-                int(source_sprite.y),
-                int(source_sprite.x + source_sprite.w),
-                int(source_sprite.y + source_sprite.h),
-            )
-            try:
-                patch = sheet_image.crop(region)
-            except Exception:
-                skipped.append(sprite_name)
-                continue
-            expected_size = (int(target_sprite.w), int(target_sprite.h))
-            if patch.size != expected_size:
-                skipped.append(sprite_name)
-                continue
-            if not self._apply_sprite_patch(atlas, target_sprite, patch, source_path=image_path):
+            x0 = int(source_sprite.x)
+            y0 = int(source_sprite.y)
+            width = int(source_sprite.x + source_sprite.w) - x0
+            height = int(source_sprite.y + source_sprite.h) - y0
+            if (width, height) != (int(target_sprite.w), int(target_sprite.h)):
                 skipped.append(sprite_name)
                 continue
-            imported += 1
+            if x0 >= 0 and y0 >= 0 and x0 + width <= sheet_w and y0 + height <= sheet_h:
+                patch = sheet_pixels[y0:y0 + height, x0:x0 + width]
+            else:
+                # Regions hanging off the sheet are padded with transparency by PIL.
+                try:
+                    patch = np.asarray(sheet_image.crop((x0, y0, x0 + width, y0 + height)), dtype=np.uint8)
+                except Exception:
+                    skipped.append(sprite_name)
+                    continue
+            jobs.append((target_sprite, patch))
 
-        if imported == 0:
+        if not jobs:
             return False, "No matching sprites from the spritesheet could be imported."
 
+        # Disjoint target rects can be copied concurrently; NumPy releases the
+        # GIL for the memcpy. Overlapping or duplicate regions keep the ordered
+        # serial copy so the last sprite deterministically wins. GL uploads
+        # stay on this thread.
+        def copy_patch(job: Tuple[SpriteInfo, np.ndarray]) -> np.ndarray:
+            sprite, patch = job
+            return self._write_atlas_region(atlas_pixels, int(sprite.x), int(sprite.y), patch)
+
+        if len(jobs) >= _PARALLEL_PATCH_MIN_JOBS and self._atlas_rects_disjoint(
+            [(int(sprite.x), int(sprite.y), patch.shape[1], patch.shape[0]) for sprite, patch in jobs]
+        ):
+            workers = min(len(jobs), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                regions = list(executor.map(copy_patch, jobs))
+        else:
+            regions = [copy_patch(job) for job in jobs]
+
+        self._upload_sprite_patches(
+            atlas,
+            [(sprite, region) for (sprite, _), region in zip(jobs, regions)],
+        )
+        for sprite, _ in jobs:
+            self._record_sprite_replacement(atlas, sprite, source_path)
+        self._reset_layer_thumbnail_cache()
+        self.gl_widget.update()
+        imported = len(jobs)
+
         if skipped:
             self.log_widget.log(
                 f"Imported {imported} sprite(s) from {os.path.basename(image_path)} "
@@ -5164,9 +5993,7 @@ class MSMAnimationViewer(QMainWindow):
                     "label": self._atlas_display_name(atlas),
                     "atlas": atlas,
                     "sprite_count": len(atlas.sprites),
-                    "modified": sum(
-                        1 for sprite_key in self._sprite_replacements.keys() if sprite_key[0] == key
-                    ),
+                    "modified": self._sprite_replacements_per_atlas.get(key, 0),
                 }
             )
         return entries
@@ -5193,11 +6020,8 @@ class MSMAnimationViewer(QMainWindow):
 
     def _apply_solid_bg_color(self, rgba: Tuple[int, int, int, int], *, announce: bool):
         """Persist the active export background color."""
-        r = max(0, min(255, int(rgba[0])))
-        g = max(0, min(255, int(rgba[1])))
-        b = max(0, min(255, int(rgba[2])))
-        a = max(0, min(255, int(rgba[3])))
-        self.solid_bg_color = (r, g, b, a)
+        clamp = _clamp_byte
+        self.solid_bg_color = (clamp(rgba[0]), clamp(rgba[1]), clamp(rgba[2]), clamp(rgba[3]))
         self.settings.setValue('export/solid_bg_color', self._rgba_to_hex(self.solid_bg_color))
         if announce:
             self.log_widget.log(
@@ -5234,43 +6058,66 @@ class MSMAnimationViewer(QMainWindow):
 
     def _suggest_unused_background_color(self) -> Optional[Tuple[int, int, int, int]]:
         """Return a color that does not appear in the active atlases, if possible."""
-        atlas_arrays: List[np.ndarray] = []
+        atlases: List[Tuple[str, TextureAtlas]] = []
+        seen_keys: Set[str] = set()
         for atlas in self._iter_active_atlases():
-            image = self._load_atlas_image(atlas)
-            if image is None:
-                continue
-            try:
-                atlas_arrays.append(np.asarray(image, dtype=np.uint8))
-            except Exception:
+            key = self._atlas_cache_key(atlas)
+            if not key or key in seen_keys:
                 continue
-        if not atlas_arrays:
-            return (255, 0, 255, 255)
-
-        def color_exists(rgb: Tuple[int, int, int]) -> bool:
-            target = np.array(rgb, dtype=np.uint8)
-            for arr in atlas_arrays:
-                if arr.ndim < 3 or arr.shape[2] < 3:
-                    continue
-                if np.any(np.all(arr[..., :3] == target, axis=-1)):
-                    return True
-            return False
+            seen_keys.add(key)
+            atlases.append((key, atlas))
+        atlas_arrays: Dict[str, Optional[np.ndarray]] = {}
+
+        def atlas_array(key: str, atlas: TextureAtlas) -> Optional[np.ndarray]:
+            if key not in atlas_arrays:
+                arr: Optional[np.ndarray] = self._atlas_modified_arrays.get(key)
+                image = self._load_atlas_image(atlas) if arr is None else None
+                if image is not None:
+                    try:
+                        arr = np.asarray(image, dtype=np.uint8)
+                    except Exception:
+                        arr = None
+                if arr is not None and (arr.ndim < 3 or arr.shape[2] < 3):
+                    arr = None
+                atlas_arrays[key] = arr
+            return atlas_arrays[key]
+
+        def array_has_color(arr: np.ndarray, rgb: Tuple[int, int, int]) -> bool:
+            r, g, b = rgb
+            return bool(np.any((arr[..., 0] == r) & (arr[..., 1] == g) & (arr[..., 2] == b)))
+
+        # Preferred colors are answered from cached per-atlas bitmasks so the
+        # atlases only need to be decoded the first time they are inspected.
+        for index, rgb in enumerate(_PREFERRED_BACKGROUND_COLORS):
+            bit = 1 << index
+            found = False
+            for key, atlas in atlases:
+                checked, present = self._atlas_preferred_color_bits.get(key, (0, 0))
+                if not checked & bit:
+                    arr = atlas_array(key, atlas)
+                    if arr is None:
+                        continue
+                    checked |= bit
+                    if array_has_color(arr, rgb):
+                        present |= bit
+                    self._atlas_preferred_color_bits[key] = (checked, present)
+                if present & bit:
+                    found = True
+                    break
+            if not found:
+                return (rgb[0], rgb[1], rgb[2], 255)
 
-        preferred_colors = [
-            (255, 0, 255),
-            (0, 255, 0),
-            (0, 255, 255),
-            (255, 255, 0),
-            (0, 128, 255),
-            (255, 128, 0),
-            (0, 255, 180),
-            (255, 0, 180),
+        loaded_arrays = [
+            arr
+            for arr in (atlas_array(key, atlas) for key, atlas in atlases)
+            if arr is not None
         ]
-        for rgb in preferred_colors:
-            if not color_exists(rgb):
-                return (rgb[0], rgb[1], rgb[2], 255)
+
+        def color_exists(rgb: Tuple[int, int, int]) -> bool:
+            return any(array_has_color(arr, rgb) for arr in loaded_arrays)
 
         rng = random.Random()
-        rng.seed(len(atlas_arrays))
+        rng.seed(len(loaded_arrays))
         for _ in range(96):
             rgb = (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255))
             if not color_exists(rgb):
@@ -5281,6 +6128,9 @@ class MSMAnimationViewer(QMainWindow):
         """Update per-layer sprite thumbnails based on the current time."""
         if not hasattr(self, "layer_panel") or not self.layer_panel:
             return
+        if self._ui_batch_depth:
+            self._pending_ui_flags |= _UI_REFRESH_THUMBNAILS
+            return
         animation = getattr(self.gl_widget.player, "animation", None)
         if not animation:
             self.layer_panel.clear_layer_thumbnails()
@@ -5330,6 +6180,27 @@ class MSMAnimationViewer(QMainWindow):
         self._layer_thumbnail_cache[sprite_name] = pixmap
         return pixmap
 
+    def _sprite_picker_pixmap(self, sprite_name: str) -> Optional[QPixmap]:
+        """Return a sprite picker thumbnail, reusing it until the atlases change."""
+        if sprite_name in self._sprite_pixmap_missing:
+            return None
+        key = f"sprite-picker:{self._sprite_pixmap_atlas_rev}:{sprite_name}"
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            return cached
+        pixmap = self._get_layer_thumbnail_pixmap(sprite_name)
+        if pixmap is None or pixmap.isNull():
+            self._sprite_pixmap_missing.add(sprite_name)
+            return None
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _invalidate_sprite_pixmaps(self) -> None:
+        """Retire cached sprite picker thumbnails after atlas contents change."""
+        self._sprite_pixmap_atlas_rev += 1
+        self._sprite_pixmap_missing.clear()
+        self._invalidate_frame_bounds_cache()
+
     def _pil_image_to_qpixmap(self, image: Optional[Image.Image]) -> Optional[QPixmap]:
         """Convert a PIL Image into a QPixmap without relying on ImageQt (Pillow 10+ compatibility)."""
         if image is None:
@@ -5342,7 +6213,12 @@ class MSMAnimationViewer(QMainWindow):
         try:
             buffer = image.tobytes("raw", "BGRA")
             qimage = QImage(buffer, width, height, QImage.Format.Format_ARGB32)
-            return QPixmap.fromImage(qimage.copy())
+            # fromImage converts ARGB32 into the pixmap's premultiplied storage,
+            # so the pixmap never aliases `buffer` and no defensive copy is
+            # needed; `buffer` only has to outlive this call.
+            pixmap = QPixmap.fromImage(qimage)
+            del qimage
+            return pixmap
         except Exception:
             return None
 
@@ -5359,9 +6235,8 @@ class MSMAnimationViewer(QMainWindow):
         if cached is not None:
             return cached
         try:
-            atlas_image = Image.open(path)
-            atlas_image = atlas_image.convert("RGBA")
-            atlas_image.load()
+            # Shares the decode with exports; the cached image is never mutated.
+            atlas_image = self._export_atlas_entry(path)[1]
         except Exception as exc:
             self._atlas_image_cache[key] = None
             self.log_widget.log(
@@ -5412,8 +6287,8 @@ class MSMAnimationViewer(QMainWindow):
         if not atlas_map:
             return
         for (atlas_key, sprite_name) in list(self._sprite_replacements.keys()):
-            patched_bitmap = self._atlas_modified_images.get(atlas_key)
-            if patched_bitmap is None:
+            patched_pixels = self._atlas_modified_arrays.get(atlas_key)
+            if patched_pixels is None:
                 continue
             atlases = atlas_map.get(atlas_key)
             if not atlases:
@@ -5422,16 +6297,8 @@ class MSMAnimationViewer(QMainWindow):
                 sprite = atlas.sprites.get(sprite_name)
                 if not sprite:
                     continue
-                region = (
-                    int(sprite.x),
-                    int(sprite.y),
-                    int(sprite.x + sprite.w),
-                    int(sprite.y + sprite.h),
-                )
-                try:
-                    patch = patched_bitmap.crop(region)
-                except Exception:
-                    continue
+                x, y = int(sprite.x), int(sprite.y)
+                patch = patched_pixels[max(0, y):y + int(sprite.h), max(0, x):x + int(sprite.w)]
                 self._upload_sprite_patch(atlas, sprite, patch)
 
     # ------------------------------------------------------------------ #
@@ -5469,20 +6336,37 @@ class MSMAnimationViewer(QMainWindow):
         return sorted(sprites, key=lambda value: value.lower())
 
     def _detect_layers_with_sprite_variants(self, layers: List[LayerData]) -> Set[int]:
-        """Return layer ids whose keyframes already swap between multiple sprites."""
-        variant_ids: Set[int] = set()
-        for layer in layers:
-            if layer.layer_id is None:
-                continue
-            sprite_names = {
-                frame.sprite_name
-                for frame in layer.keyframes
-                if frame.sprite_name
-            }
-            if len(sprite_names) > 1:
-                variant_ids.add(layer.layer_id)
+        """
+        Return layer ids whose keyframes already swap between multiple sprites.
+
+        The result is memoized against ``_sprite_variant_rev`` and the layer
+        list it was computed from; reorders and visibility changes reuse it.
+        Callers must treat the returned set as read-only.
+        """
+        cached = self._sprite_variant_cache
+        if (
+            cached is not None
+            and cached[0] == self._sprite_variant_rev
+            and cached[1] is layers
+            and cached[2] == len(layers)
+        ):
+            return cached[3]
+        variant_ids = self._scan_layers_with_sprite_variants(layers)
+        self._sprite_variant_cache = (self._sprite_variant_rev, layers, len(layers), variant_ids)
         return variant_ids
 
+    def _bump_sprite_variant_rev(self) -> None:
+        """Mark cached sprite-variant results stale after sprite/keyframe edits."""
+        self._sprite_variant_rev += 1
+
+    @staticmethod
+    def _scan_layers_with_sprite_variants(layers: List[LayerData]) -> Set[int]:
+        return {
+            layer.layer_id
+            for layer in layers
+            if layer.layer_id is not None and len(_layer_sprite_signature(layer)) > 1
+        }
+
     def _gather_keyframes_for_times(
         self,
         layers: List[LayerData],
@@ -5493,15 +6377,28 @@ class MSMAnimationViewer(QMainWindow):
         matches: List[Tuple[LayerData, KeyframeData]] = []
         seen: Set[Tuple[int, float]] = set()
         for layer in layers:
-            for frame in layer.keyframes:
+            frames = layer.keyframes
+            frame_times = [frame.time for frame in frames]
+            if all(a <= b for a, b in zip(frame_times, frame_times[1:])):
+                # Keyframes are time-sorted, so each target only needs the
+                # slice that falls inside its tolerance window.
+                hits: Set[int] = set()
                 for target in times:
-                    if abs(frame.time - target) <= tolerance:
-                        key = (layer.layer_id, frame.time)
-                        if key in seen:
-                            continue
-                        seen.add(key)
-                        matches.append((layer, frame))
-                        break
+                    lo = bisect_left(frame_times, target - tolerance)
+                    hi = bisect_right(frame_times, target + tolerance)
+                    hits.update(range(lo, hi))
+                candidates = [frames[idx] for idx in sorted(hits)]
+            else:
+                candidates = [
+                    frame for frame in frames
+                    if any(abs(frame.time - target) <= tolerance for target in times)
+                ]
+            for frame in candidates:
+                key = (layer.layer_id, frame.time)
+                if key in seen:
+                    continue
+                seen.add(key)
+                matches.append((layer, frame))
         return matches
 
     def assign_sprite_to_keyframes(self, layer_ids: Optional[List[int]] = None):
@@ -5536,7 +6433,7 @@ class MSMAnimationViewer(QMainWindow):
         if not target_layers:
             self.log_widget.log("Select at least one layer to assign sprites.", "INFO")
             return
-        selected_times = sorted(self._selected_marker_times)
+        selected_times = self._selected_marker_times
         implicit_time = False
         if selected_times:
             target_times = selected_times
@@ -5583,15 +6480,16 @@ class MSMAnimationViewer(QMainWindow):
             else:
                 joined = ", ".join(sorted(atlas_labels))
                 description = f"Sprites from {joined} ({len(sprite_options)} available)."
-        sprite_entries: List[Tuple[str, Optional[QPixmap]]] = []
-        for name in sprite_options:
-            pixmap = self._get_layer_thumbnail_pixmap(name)
-            sprite_entries.append((name, pixmap))
+        # Thumbnails are fetched by the picker only for rows scrolled into view.
+        sprite_entries: List[Tuple[str, Optional[QPixmap]]] = [
+            (name, None) for name in sprite_options
+        ]
         current_sprite = next((frame.sprite_name for _, frame in matches if frame.sprite_name), None)
         picker = SpritePickerDialog(
             sprite_entries,
             current_sprite=current_sprite,
             description=description,
+            thumbnail_provider=self._sprite_picker_pixmap,
             parent=self,
         )
         if picker.exec() != QDialog.DialogCode.Accepted:
@@ -5603,7 +6501,7 @@ class MSMAnimationViewer(QMainWindow):
         if not layer_ids:
             self.log_widget.log("Unable to determine which layers to update.", "ERROR")
             return
-        self._begin_keyframe_action(layer_ids)
+        self._begin_keyframe_action(layer_ids, scope="keyframes")
         touched_layers: Set[int] = set()
         for layer, frame in matches:
             if frame.sprite_name == sprite_name:
@@ -5612,16 +6510,15 @@ class MSMAnimationViewer(QMainWindow):
             if frame.immediate_sprite == 0:
                 frame.immediate_sprite = 1
             touched_layers.add(layer.layer_id)
+        if touched_layers:
+            self._bump_sprite_variant_rev()
         for layer_id in touched_layers:
             synced_layer = self.gl_widget.get_layer_by_id(layer_id)
             if synced_layer:
                 self._sync_layer_source_frames(synced_layer)
         self._finalize_keyframe_action("assign_sprite")
         if touched_layers:
-            self.gl_widget.update()
-            self._refresh_layer_thumbnails()
-            variant_layers = self._detect_layers_with_sprite_variants(animation.layers)
-            self.layer_panel.set_layers_with_sprite_variants(variant_layers)
+            self._request_ui_refresh(_UI_REFRESH_GL | _UI_REFRESH_THUMBNAILS | _UI_REFRESH_VARIANTS)
             self.log_widget.log(
                 f"Assigned sprite '{sprite_name}' to {len(matches)} keyframe(s).",
                 "SUCCESS",
@@ -5629,6 +6526,56 @@ class MSMAnimationViewer(QMainWindow):
         else:
             self.log_widget.log("The selected keyframes already use that sprite.", "INFO")
 
+    def _layer_index(self, animation: AnimationData) -> Dict[int, LayerData]:
+        """
+        Return a cached layer_id -> layer map for the animation.
+
+        The cache remembers the ``animation.layers`` list it was built from,
+        so replacing the list (reorder, costume swap, reload) or changing its
+        length rebuilds it. Callers must treat the returned dict as read-only.
+        """
+        layers = animation.layers
+        if layers is not self._layer_index_source or len(layers) != self._layer_index_size:
+            self._layer_index_cache = {layer.layer_id: layer for layer in layers}
+            self._all_layer_ids_cache = frozenset(
+                layer_id for layer_id in self._layer_index_cache if layer_id is not None
+            )
+            self._layer_index_source = layers
+            self._layer_index_size = len(layers)
+        return self._layer_index_cache
+
+    def _all_layer_ids(self, animation: AnimationData) -> FrozenSet[int]:
+        """Return the animation's non-null layer ids, cached with ``_layer_index``."""
+        self._layer_index(animation)
+        return self._all_layer_ids_cache
+
+    def _layer_name_index(self, animation: AnimationData) -> Dict[str, LayerData]:
+        """
+        Return a cached lowercase name -> layer map for the animation.
+
+        Validated the same way as ``_layer_index``; layers without a name are
+        skipped. Callers must treat the returned dict as read-only.
+        """
+        layers = animation.layers
+        if layers is not self._layer_name_index_source or len(layers) != self._layer_name_index_size:
+            self._layer_name_index_cache = {layer.name.lower(): layer for layer in layers if layer.name}
+            self._layer_name_index_source = layers
+            self._layer_name_index_size = len(layers)
+        return self._layer_name_index_cache
+
+    def _invalidate_layer_index(self) -> None:
+        """Drop the cached layer_id/name -> layer maps after structural layer edits."""
+        self._bump_sprite_variant_rev()
+        self._invalidate_frame_bounds_cache()
+        self._last_exported_layers.clear()
+        self._layer_index_cache = {}
+        self._all_layer_ids_cache = frozenset()
+        self._layer_index_source = None
+        self._layer_index_size = 0
+        self._layer_name_index_cache = {}
+        self._layer_name_index_source = None
+        self._layer_name_index_size = 0
+
     def toggle_layer_visibility(self, layer: LayerData, state: int):
         """Toggle layer visibility"""
         layer.visible = (state == Qt.CheckState.Checked.value)
@@ -5647,38 +6594,27 @@ class MSMAnimationViewer(QMainWindow):
             if layer.layer_id in self._default_layer_visibility:
                 layer.visible = self._default_layer_visibility[layer.layer_id]
         self.layer_panel.set_default_hidden_layers(self._default_hidden_layer_ids)
-        self.layer_panel.update_layers(animation.layers)
-        variant_layers = self._detect_layers_with_sprite_variants(animation.layers)
-        self.layer_panel.set_layers_with_sprite_variants(variant_layers)
-        self.layer_panel.set_selection_state(self.selected_layer_ids)
-        self._reset_layer_thumbnail_cache()
-        self._refresh_layer_thumbnails()
-        self.gl_widget.update()
+        self._request_ui_refresh(_UI_REFRESH_LAYER_VISIBILITY | _UI_REFRESH_GL)
 
     def reset_layer_order_to_default(self):
         """Restore layer ordering to the recorded default order."""
         animation = self.gl_widget.player.animation
         if not animation or not self._default_layer_order:
             return
-        id_to_layer = {layer.layer_id: layer for layer in animation.layers}
+        id_to_layer = self._layer_index(animation)
+        default_ids = frozenset(self._default_layer_order)
         new_layers: List[LayerData] = []
         for layer_id in self._default_layer_order:
             layer = id_to_layer.get(layer_id)
             if layer:
                 new_layers.append(layer)
-        for layer_id, layer in id_to_layer.items():
-            if layer_id not in self._default_layer_order:
+        for layer in animation.layers:
+            if layer.layer_id not in default_ids:
                 new_layers.append(layer)
         if not new_layers:
             return
         animation.layers = new_layers
-        self.layer_panel.update_layers(animation.layers)
-        variant_layers = self._detect_layers_with_sprite_variants(animation.layers)
-        self.layer_panel.set_layers_with_sprite_variants(variant_layers)
-        self.layer_panel.set_selection_state(self.selected_layer_ids)
-        self._reset_layer_thumbnail_cache()
-        self._refresh_layer_thumbnails()
-        self.gl_widget.update()
+        self._request_ui_refresh(_UI_REFRESH_LAYER_ORDER | _UI_REFRESH_GL)
 
     def on_layer_order_changed(self, ordered_ids: List[int]):
         """Reorder animation layers to match the drag/drop order from the UI."""
@@ -5688,7 +6624,7 @@ class MSMAnimationViewer(QMainWindow):
         current_layers = animation.layers or []
         if len(ordered_ids) != len(current_layers):
             return
-        id_to_layer = {layer.layer_id: layer for layer in current_layers}
+        id_to_layer = self._layer_index(animation)
         try:
             new_layers = [id_to_layer[layer_id] for layer_id in ordered_ids]
         except KeyError:
@@ -5696,22 +6632,12 @@ class MSMAnimationViewer(QMainWindow):
         if new_layers == current_layers:
             return
         animation.layers = new_layers
-        self.layer_panel.update_layers(animation.layers)
-        variant_layers = self._detect_layers_with_sprite_variants(animation.layers)
-        self.layer_panel.set_layers_with_sprite_variants(variant_layers)
-        self.layer_panel.set_selection_state(self.selected_layer_ids)
-        self._reset_layer_thumbnail_cache()
-        self._refresh_layer_thumbnails()
-        self.gl_widget.update()
+        self._request_ui_refresh(_UI_REFRESH_LAYER_ORDER | _UI_REFRESH_GL)
     
     def update_timeline(self):
         """Update timeline slider range"""
         if self.gl_widget.player.animation:
-            duration = self.gl_widget.player.duration
-            slider_max = max(1, int(duration * 1000))
-            self.timeline.set_slider_maximum(slider_max)
-            self.timeline.set_time_label(f"{self.gl_widget.player.current_time:.2f} / {duration:.2f}s")
-            self.timeline.set_current_time(self.gl_widget.player.current_time)
+            self._update_timeline_range()
             self._refresh_timeline_keyframes()
         else:
             self.timeline.set_slider_maximum(1)
@@ -5719,25 +6645,55 @@ class MSMAnimationViewer(QMainWindow):
             self.timeline.set_current_time(0.0)
             self.timeline.set_keyframe_markers([], 0.0)
 
+    def _update_timeline_range(self):
+        """Sync slider range, time label and playhead with the player duration."""
+        player = self.gl_widget.player
+        duration = player.duration
+        slider_max = max(1, int(duration * 1000))
+        self.timeline.set_slider_maximum(slider_max)
+        self.timeline.set_time_label(f"{player.current_time:.2f} / {duration:.2f}s")
+        self.timeline.set_current_time(player.current_time)
+
+    def _apply_timeline_marker_delta(self, added: List[float], removed: List[float]):
+        """Patch timeline markers after a keyframe edit instead of rescanning layers."""
+        if not self.gl_widget.player.animation:
+            self.update_timeline()
+            return
+        self._update_timeline_range()
+        marker_list = self.timeline.apply_marker_delta(
+            added,
+            removed,
+            max(0.0, self.gl_widget.player.duration),
+            self._marker_time_tolerance(),
+        )
+        self._sync_marker_selection(marker_list)
+
     def _refresh_timeline_keyframes(self):
         """Update timeline markers to reflect current keyframes."""
-        animation = getattr(self.gl_widget.player, "animation", None)
+        player = self.gl_widget.player
+        timeline = self.timeline
+        animation = getattr(player, "animation", None)
         if not animation:
-            self.timeline.set_keyframe_markers([], 0.0)
+            timeline.set_keyframe_markers([], 0.0)
             return
-        duration = max(0.0, self.gl_widget.player.duration)
-        if self.selected_layer_ids:
-            target_ids = set(self.selected_layer_ids)
+        duration = max(0.0, player.duration)
+        selected_ids = self.selected_layer_ids
+        if selected_ids:
+            layer_index = self._layer_index(animation)
+            target_layers = [
+                layer_index[layer_id]
+                for layer_id in selected_ids
+                if layer_id in layer_index
+            ]
         else:
-            target_ids = {layer.layer_id for layer in animation.layers}
-        markers: Set[float] = set()
-        for layer in animation.layers:
-            if layer.layer_id not in target_ids:
-                continue
-            for keyframe in layer.keyframes:
-                markers.add(max(0.0, float(keyframe.time)))
+            target_layers = animation.layers
+        markers: Set[float] = {
+            max(0.0, float(keyframe.time))
+            for layer in target_layers
+            for keyframe in layer.keyframes
+        }
         marker_list = sorted(markers)
-        self.timeline.set_keyframe_markers(marker_list, duration)
+        timeline.set_keyframe_markers(marker_list, duration)
         self._sync_marker_selection(marker_list)
 
     def _marker_time_tolerance(self) -> float:
@@ -5748,11 +6704,13 @@ class MSMAnimationViewer(QMainWindow):
             return
         tolerance = self._marker_time_tolerance()
         retained: List[float] = []
-        for selected in sorted(self._selected_marker_times):
-            match = next((marker for marker in available_markers if abs(marker - selected) <= tolerance), None)
-            if match is not None and not any(abs(match - existing) <= tolerance for existing in retained):
+        # Both lists are sorted, so matches arrive in order and only the last
+        # retained entry can fall within tolerance of the next match.
+        for selected in self._selected_marker_times:
+            match = _nearest_within(available_markers, selected, tolerance)
+            if match is not None and not (retained and abs(match - retained[-1]) <= tolerance):
                 retained.append(match)
-        self._selected_marker_times = set(retained)
+        self._selected_marker_times = retained
         self.timeline.set_marker_selection(retained)
 
     def _replace_marker_selection(self, times: List[float]):
@@ -5763,7 +6721,7 @@ class MSMAnimationViewer(QMainWindow):
             if normalized and abs(clamped - normalized[-1]) <= tolerance:
                 continue
             normalized.append(clamped)
-        self._selected_marker_times = set(normalized)
+        self._selected_marker_times = normalized
         if hasattr(self, "timeline"):
             self.timeline.set_marker_selection(normalized)
 
@@ -5771,13 +6729,13 @@ class MSMAnimationViewer(QMainWindow):
         if not self._selected_marker_times:
             return
         tolerance = self._marker_time_tolerance()
-        removal = [max(0.0, float(value)) for value in times]
+        removal = sorted(max(0.0, float(value)) for value in times)
         remaining: List[float] = []
-        for existing in sorted(self._selected_marker_times):
-            if any(abs(existing - target) <= tolerance for target in removal):
+        for existing in self._selected_marker_times:
+            if _nearest_within(removal, existing, tolerance) is not None:
                 continue
             remaining.append(existing)
-        self._selected_marker_times = set(remaining)
+        self._selected_marker_times = remaining
         if hasattr(self, "timeline"):
             self.timeline.set_marker_selection(remaining)
     
@@ -5794,18 +6752,22 @@ class MSMAnimationViewer(QMainWindow):
     
     def on_timeline_changed(self, value: int):
         """Handle timeline slider change"""
-        if not self.gl_widget.player.animation:
+        gl_widget = self.gl_widget
+        player = gl_widget.player
+        if not player.animation:
             return
 
         time = value / 1000.0
-        self.gl_widget.set_time(time)
+        gl_widget.set_time(time)
 
-        if self.audio_manager.is_ready:
-            self.audio_manager.seek(time)
+        audio_manager = self.audio_manager
+        if audio_manager.is_ready:
+            audio_manager.seek(time)
 
-        duration = self.gl_widget.player.duration
-        self.timeline.set_time_label(f"{time:.2f} / {duration:.2f}s")
-        self.timeline.set_current_time(time)
+        duration = player.duration
+        timeline = self.timeline
+        timeline.set_time_label(f"{time:.2f} / {duration:.2f}s")
+        timeline.set_current_time(time)
         self._refresh_layer_thumbnails()
 
     def on_timeline_slider_pressed(self):
@@ -5826,19 +6788,20 @@ class MSMAnimationViewer(QMainWindow):
 
     def on_keyframe_marker_clicked(self, time_value: float):
         """Jump to a keyframe marker when the user clicks the marker bar."""
-        if not self.gl_widget.player.animation:
+        gl_widget = self.gl_widget
+        player = gl_widget.player
+        if not player.animation:
             return
-        duration = max(0.0, self.gl_widget.player.duration)
+        timeline = self.timeline
+        duration = max(0.0, player.duration)
         clamped = max(0.0, min(time_value, duration))
-        slider = self.timeline.timeline_slider
-        slider.blockSignals(True)
-        slider.setValue(int(clamped * 1000))
-        slider.blockSignals(False)
-        self.gl_widget.set_time(clamped)
-        if self.audio_manager.is_ready:
-            self.audio_manager.seek(clamped)
-        self.timeline.set_time_label(f"{clamped:.2f} / {duration:.2f}s")
-        self.timeline.set_current_time(clamped)
+        _set_value_silently(timeline.timeline_slider, int(clamped * 1000))
+        gl_widget.set_time(clamped)
+        audio_manager = self.audio_manager
+        if audio_manager.is_ready:
+            audio_manager.seek(clamped)
+        timeline.set_time_label(f"{clamped:.2f} / {duration:.2f}s")
+        timeline.set_current_time(clamped)
         self._refresh_layer_thumbnails()
 
     def on_keyframe_marker_remove_requested(self, time_values: List[float]):
@@ -5852,19 +6815,25 @@ class MSMAnimationViewer(QMainWindow):
         if self.selected_layer_ids:
             target_ids = sorted(self.selected_layer_ids)
         else:
-            target_ids = [layer.layer_id for layer in animation.layers]
+            target_ids = self._all_layer_ids(animation)
         if not target_ids:
             return
-        self._begin_keyframe_action(target_ids)
+        self._begin_keyframe_action(target_ids, scope="keyframes")
         removed = 0
         tolerance = self._marker_time_tolerance()
-        for layer in animation.layers:
-            if layer.layer_id not in target_ids:
+        removal_times = np.asarray(sanitized, dtype=np.float64)
+        layer_index = self._layer_index(animation)
+        for layer_id in target_ids:
+            layer = layer_index.get(layer_id)
+            if layer is None or not layer.keyframes:
                 continue
             original_count = len(layer.keyframes)
+            _, hits = _nearest_sorted_indices(_keyframe_times(layer.keyframes), removal_times, tolerance)
+            if not hits.any():
+                continue
             kept_frames = [
-                frame for frame in layer.keyframes
-                if all(abs(frame.time - value) > tolerance for value in sanitized)
+                frame for frame, hit in zip(layer.keyframes, hits.tolist())
+                if not hit
             ]
             if len(kept_frames) != original_count:
                 layer.keyframes = kept_frames
@@ -5872,11 +6841,18 @@ class MSMAnimationViewer(QMainWindow):
                 self._sync_layer_source_frames(layer)
         self._finalize_keyframe_action("delete_keyframe")
         if removed:
-            self.gl_widget.player.calculate_duration()
-            self.update_timeline()
-            self.gl_widget.update()
+            self._bump_sprite_variant_rev()
+            with self._batch_ui_updates():
+                player = self.gl_widget.player
+                # Only removing a frame at the current end can shorten the animation.
+                player.recompute_duration_from(
+                    0.0, shrinkable=sanitized[-1] >= player.duration - tolerance
+                )
+                # Every shown layer lost its frames at these times.
+                self._queue_marker_delta([], sanitized)
+                self._request_ui_refresh(_UI_REFRESH_GL)
+                self._remove_marker_selection_times(sanitized)
             self.log_widget.log(f"Removed {removed} keyframe(s).", "SUCCESS")
-            self._remove_marker_selection_times(sanitized)
         else:
             self.log_widget.log("No keyframes found at the selected time to remove.", "INFO")
 
@@ -5892,10 +6868,10 @@ class MSMAnimationViewer(QMainWindow):
         if self.selected_layer_ids:
             target_ids = sorted(self.selected_layer_ids)
         else:
-            target_ids = [layer.layer_id for layer in animation.layers]
+            target_ids = self._all_layer_ids(animation)
         if not target_ids:
             return
-        self._begin_keyframe_action(target_ids)
+        self._begin_keyframe_action(target_ids, scope="keyframes")
         tolerance = self._marker_time_tolerance()
         duration = max(0.0, self.gl_widget.player.duration)
         pairs: List[Tuple[float, float]] = []
@@ -5904,26 +6880,37 @@ class MSMAnimationViewer(QMainWindow):
             proposed = old_time + float(delta)
             new_time = min(max(proposed, 0.0), duration)
             pairs.append((old_time, new_time))
+        retime = dict(pairs)
+        old_times = np.asarray(sorted(retime), dtype=np.float64)
+        new_times = np.asarray([retime[value] for value in old_times.tolist()], dtype=np.float64)
         moved = 0
-        for layer in animation.layers:
-            if layer.layer_id not in target_ids:
+        layer_index = self._layer_index(animation)
+        for layer_id in target_ids:
+            layer = layer_index.get(layer_id)
+            if layer is None or not layer.keyframes:
                 continue
-            updated = False
-            for frame in layer.keyframes:
-                for old_time, target_time in pairs:
-                    if abs(frame.time - old_time) <= tolerance:
-                        frame.time = target_time
-                        updated = True
+            # Match against each frame's original time only, so a frame moved
+            # onto another selected marker is not moved twice.
+            nearest, hits = _nearest_sorted_indices(_keyframe_times(layer.keyframes), old_times, tolerance)
+            updated = bool(hits.any())
             if updated:
-                layer.keyframes.sort(key=lambda frame: frame.time)
+                targets = new_times[nearest].tolist()
+                for frame, hit, target_time in zip(layer.keyframes, hits.tolist(), targets):
+                    if hit:
+                        frame.time = target_time
+                _ensure_keyframes_sorted(layer.keyframes)
                 self._sync_layer_source_frames(layer)
                 moved += 1
         self._finalize_keyframe_action("move_keyframe")
         if moved:
-            self.gl_widget.player.calculate_duration()
-            self.update_timeline()
-            self.gl_widget.update()
-            self._replace_marker_selection([pair[1] for pair in pairs])
+            with self._batch_ui_updates():
+                self.gl_widget.player.recompute_duration_from(
+                    float(new_times.max()),
+                    shrinkable=float(old_times[-1]) >= duration - tolerance,
+                )
+                self._queue_marker_delta(new_times.tolist(), old_times.tolist())
+                self._request_ui_refresh(_UI_REFRESH_GL)
+                self._replace_marker_selection([pair[1] for pair in pairs])
             self.log_widget.log(
                 f"Moved {len(pairs)} keyframe time(s) by {delta:.3f}s", "SUCCESS"
             )
@@ -5939,7 +6926,7 @@ class MSMAnimationViewer(QMainWindow):
             if normalized and abs(clamped - normalized[-1]) <= tolerance:
                 continue
             normalized.append(clamped)
-        self._selected_marker_times = set(normalized)
+        self._selected_marker_times = normalized
 
     def copy_selected_keyframes(self):
         """Copy keyframes anchored at the currently selected marker times."""
@@ -5947,15 +6934,15 @@ class MSMAnimationViewer(QMainWindow):
         if not animation:
             self.log_widget.log("Load an animation before copying keyframes.", "WARNING")
             return
-        selected_times = sorted(self._selected_marker_times)
+        selected_times = self._selected_marker_times
         if not selected_times:
             self.log_widget.log("Select keyframes in the timeline before copying.", "INFO")
             return
         tolerance = self._marker_time_tolerance()
         if self.selected_layer_ids:
-            target_ids = {layer_id for layer_id in self.selected_layer_ids}
+            target_ids = frozenset(self.selected_layer_ids)
         else:
-            target_ids = {layer.layer_id for layer in animation.layers if layer.layer_id is not None}
+            target_ids = self._all_layer_ids(animation)
         if not target_ids:
             self.log_widget.log("No layers available to copy keyframes from.", "WARNING")
             return
@@ -5967,11 +6954,13 @@ class MSMAnimationViewer(QMainWindow):
                 continue
             matches: List[Dict[str, Any]] = []
             for frame in layer.keyframes:
-                if any(abs(frame.time - marker) <= tolerance for marker in selected_times):
+                if _nearest_within(selected_times, frame.time, tolerance) is not None:
                     matches.append(
                         {
                             "time_offset": float(frame.time - base_time),
-                            "data": replace(frame),
+                            # KeyframeData only holds scalars, so a field
+                            # value tuple is an independent copy.
+                            "snapshot": _keyframe_fields(frame),
                         }
                     )
             if matches:
@@ -6008,7 +6997,7 @@ class MSMAnimationViewer(QMainWindow):
         if not clipboard_layers:
             self.log_widget.log("Clipboard is empty; copy keyframes before pasting.", "INFO")
             return
-        layer_lookup = {layer.name.lower(): layer for layer in animation.layers if layer.name}
+        layer_lookup = self._layer_name_index(animation)
         candidate_layers: Dict[int, LayerData] = {}
         total_candidate_frames = 0
         for entry in clipboard_layers:
@@ -6027,9 +7016,11 @@ class MSMAnimationViewer(QMainWindow):
                 "WARNING",
             )
             return
-        self._begin_keyframe_action(list(candidate_layers.keys()))
+        self._begin_keyframe_action(list(candidate_layers.keys()), scope="keyframes")
         inserted = 0
         new_marker_times: List[float] = []
+        shown_marker_times: List[float] = []
+        shown_layer_ids = self.selected_layer_ids
         target_start = max(0.0, float(self.gl_widget.player.current_time))
         for entry in clipboard_layers:
             frames = entry.get("keyframes") or []
@@ -6039,27 +7030,35 @@ class MSMAnimationViewer(QMainWindow):
             target_layer = layer_lookup.get(layer_name)
             if not target_layer or target_layer.layer_id is None:
                 continue
+            additions: List[KeyframeData] = []
             for payload in frames:
-                frame_copy: KeyframeData = replace(payload.get("data"))
                 offset = float(payload.get("time_offset", 0.0))
-                frame_copy.time = max(0.0, target_start + offset)
-                target_layer.keyframes.append(frame_copy)
-                inserted += 1
+                frame_copy = replace(
+                    KeyframeData(*payload["snapshot"]),
+                    time=max(0.0, target_start + offset),
+                )
+                additions.append(frame_copy)
                 new_marker_times.append(frame_copy.time)
-            target_layer.keyframes.sort(key=lambda frame: frame.time)
+            inserted += len(additions)
+            if not shown_layer_ids or target_layer.layer_id in shown_layer_ids:
+                shown_marker_times.extend(frame.time for frame in additions)
+            target_layer.keyframes = _merge_keyframes(target_layer.keyframes, additions)
             self._sync_layer_source_frames(target_layer)
+        if inserted:
+            self._bump_sprite_variant_rev()
         if inserted == 0:
             self._pending_keyframe_action = None
             self._update_keyframe_history_controls()
             self.log_widget.log("Pasting failed because no keyframes could be inserted.", "WARNING")
             return
         self._finalize_keyframe_action("paste_keyframes")
-        self.gl_widget.player.calculate_duration()
-        self.update_timeline()
-        self.gl_widget.update()
-        self._refresh_timeline_keyframes()
-        if new_marker_times:
-            self._replace_marker_selection(new_marker_times)
+        with self._batch_ui_updates():
+            # Pasting only adds frames, so the duration can only grow.
+            self.gl_widget.player.recompute_duration_from(max(new_marker_times))
+            self._queue_marker_delta(shown_marker_times, [])
+            self._request_ui_refresh(_UI_REFRESH_GL)
+            if new_marker_times:
+                self._replace_marker_selection(new_marker_times)
         self.log_widget.log(
             f"Pasted {inserted} keyframe(s) into {len(candidate_layers)} layer(s).",
             "SUCCESS",
@@ -6067,17 +7066,17 @@ class MSMAnimationViewer(QMainWindow):
 
     def on_animation_time_changed(self, current: float, duration: float):
         """Update the timeline UI when the renderer advances."""
-        if not self.gl_widget.player.animation:
-            return
-        if not self._timeline_user_scrubbing:
-            slider = self.timeline.timeline_slider
-            slider.blockSignals(True)
-            slider.setValue(int(current * 1000))
-            slider.blockSignals(False)
-        duration = duration if duration > 0 else self.gl_widget.player.duration
-        self.timeline.set_time_label(f"{current:.2f} / {duration:.2f}s")
-        self.timeline.set_current_time(current)
-        if not self.gl_widget.player.playing and not self._timeline_user_scrubbing:
+        player = self.gl_widget.player
+        if not player.animation:
+            return
+        timeline = self.timeline
+        scrubbing = self._timeline_user_scrubbing
+        if not scrubbing:
+            _set_value_silently(timeline.timeline_slider, int(current * 1000))
+        duration = duration if duration > 0 else player.duration
+        timeline.set_time_label(f"{current:.2f} / {duration:.2f}s")
+        timeline.set_current_time(current)
+        if not player.playing and not scrubbing:
             self._refresh_layer_thumbnails()
 
     def on_animation_looped(self):
@@ -6119,6 +7118,7 @@ class MSMAnimationViewer(QMainWindow):
         influence = self.pose_influence_mode or "current"
         applied = 0
         self._begin_keyframe_action(list(layer_ids))
+        pose_offsets = self._gather_pose_offsets(list(layer_ids), base_states_map, final_states_map)
         for layer_id in layer_ids:
             if self._record_pose_for_layer(
                 layer_id,
@@ -6127,6 +7127,7 @@ class MSMAnimationViewer(QMainWindow):
                 base_states_map,
                 final_states_map,
                 force=True,
+                pose_offsets=pose_offsets[layer_id],
             ):
                 applied += 1
 
@@ -6162,7 +7163,7 @@ class MSMAnimationViewer(QMainWindow):
         time_value = round(self.gl_widget.player.current_time, 5)
         influence = self.pose_influence_mode or "current"
         layer_ids = sorted(self.selected_layer_ids)
-        self._begin_keyframe_action(layer_ids)
+        self._begin_keyframe_action(layer_ids, scope="keyframes")
         applied = 0
         for layer_id in layer_ids:
             if self._reset_pose_for_layer(layer_id, time_value, influence):
@@ -6180,6 +7181,106 @@ class MSMAnimationViewer(QMainWindow):
             "SUCCESS"
         )
 
+    def _gather_pose_offsets(
+        self,
+        layer_ids: List[int],
+        base_states: Dict[int, Dict[str, Any]],
+        final_states: Dict[int, Dict[str, Any]],
+        tolerance: float = 1e-4,
+    ) -> Dict[int, Tuple[float, float, float, float, float, bool, bool, bool]]:
+        """
+        Compute gizmo deltas for many layers, vectorized for large batches.
+
+        Each row is ``(world_dx, world_dy, rotation, scale_x, scale_y,
+        has_translation, has_rotation, has_scale)``.
+        """
+        ids = list(layer_ids)
+        if not ids:
+            return {}
+        if len(ids) < _POSE_OFFSETS_NUMPY_THRESHOLD:
+            return {
+                layer_id: self._pose_offsets_for_layer(layer_id, base_states, final_states, tolerance)
+                for layer_id in ids
+            }
+        gl_widget = self.gl_widget
+        layer_offsets = gl_widget.layer_offsets
+        layer_rotations = gl_widget.layer_rotations
+        layer_scale_offsets = gl_widget.layer_scale_offsets
+        count = len(ids)
+        offsets = np.array(
+            [layer_offsets.get(layer_id, (0.0, 0.0)) for layer_id in ids], dtype=np.float64
+        ).reshape(count, 2)
+        rotations = np.array(
+            [layer_rotations.get(layer_id, 0.0) for layer_id in ids], dtype=np.float64
+        )
+        scales = np.array(
+            [layer_scale_offsets.get(layer_id, (1.0, 1.0)) for layer_id in ids], dtype=np.float64
+        ).reshape(count, 2)
+        # Columns: base anchor x/y, final anchor x/y.
+        anchors = np.zeros((count, 4), dtype=np.float64)
+        for row, layer_id in enumerate(ids):
+            base_state = base_states.get(layer_id)
+            final_state = final_states.get(layer_id)
+            if not base_state or not final_state:
+                continue
+            base_x = float(base_state.get("anchor_world_x", base_state.get("tx", 0.0)))
+            base_y = float(base_state.get("anchor_world_y", base_state.get("ty", 0.0)))
+            anchors[row] = (
+                base_x,
+                base_y,
+                float(final_state.get("anchor_world_x", base_x)),
+                float(final_state.get("anchor_world_y", base_y)),
+            )
+        world_delta = (anchors[:, 2:] - anchors[:, :2]) + offsets
+        has_translation = (np.abs(world_delta) > tolerance).any(axis=1)
+        has_rotation = np.abs(rotations) > tolerance
+        has_scale = (np.abs(scales - 1.0) > tolerance).any(axis=1)
+        rows = zip(
+            world_delta[:, 0].tolist(),
+            world_delta[:, 1].tolist(),
+            rotations.tolist(),
+            scales[:, 0].tolist(),
+            scales[:, 1].tolist(),
+            has_translation.tolist(),
+            has_rotation.tolist(),
+            has_scale.tolist(),
+        )
+        return dict(zip(ids, rows))
+
+    def _pose_offsets_for_layer(
+        self,
+        layer_id: int,
+        base_states: Dict[int, Dict[str, Any]],
+        final_states: Dict[int, Dict[str, Any]],
+        tolerance: float = 1e-4,
+    ) -> Tuple[float, float, float, float, float, bool, bool, bool]:
+        """Scalar ``_gather_pose_offsets`` row for a single layer."""
+        gl_widget = self.gl_widget
+        base_state = base_states.get(layer_id, {})
+        final_state = final_states.get(layer_id, {})
+        if not base_state or not final_state:
+            base_state = {}
+            final_state = {}
+        offset_x, offset_y = gl_widget.layer_offsets.get(layer_id, (0.0, 0.0))
+        rot_offset = float(gl_widget.layer_rotations.get(layer_id, 0.0))
+        scale_offset_x, scale_offset_y = gl_widget.layer_scale_offsets.get(layer_id, (1.0, 1.0))
+        base_anchor_x = float(base_state.get("anchor_world_x", base_state.get("tx", 0.0)))
+        base_anchor_y = float(base_state.get("anchor_world_y", base_state.get("ty", 0.0)))
+        final_anchor_x = float(final_state.get("anchor_world_x", base_anchor_x))
+        final_anchor_y = float(final_state.get("anchor_world_y", base_anchor_y))
+        world_delta_x = (final_anchor_x - base_anchor_x) + float(offset_x)
+        world_delta_y = (final_anchor_y - base_anchor_y) + float(offset_y)
+        return (
+            world_delta_x,
+            world_delta_y,
+            rot_offset,
+            float(scale_offset_x),
+            float(scale_offset_y),
+            abs(world_delta_x) > tolerance or abs(world_delta_y) > tolerance,
+            abs(rot_offset) > tolerance,
+            abs(scale_offset_x - 1.0) > tolerance or abs(scale_offset_y - 1.0) > tolerance,
+        )
+
     def _record_pose_for_layer(
         self,
         layer_id: int,
@@ -6188,45 +7289,43 @@ class MSMAnimationViewer(QMainWindow):
         base_states: Dict[int, Dict[str, Any]],
         final_states: Dict[int, Dict[str, Any]],
         tolerance: float = 1e-4,
-        force: bool = False
+        force: bool = False,
+        pose_offsets: Optional[Tuple[float, float, float, float, float, bool, bool, bool]] = None,
     ) -> bool:
-        """Capture gizmo offsets for a single layer."""
-        layer = self.gl_widget.get_layer_by_id(layer_id)
+        """
+        Capture gizmo offsets for a single layer.
+
+        ``pose_offsets`` may carry this layer's row from ``_gather_pose_offsets``
+        when recording many layers; otherwise it is computed here.
+        """
+        gl_widget = self.gl_widget
+        player = gl_widget.player
+        layer = gl_widget.get_layer_by_id(layer_id)
         if not layer:
             return False
-        anchor_override = self.gl_widget.layer_anchor_overrides.get(layer_id)
+        anchor_override = gl_widget.layer_anchor_overrides.get(layer_id)
         anchor_captured = False
-        local_state = self.gl_widget.player.get_layer_state(layer, time_value)
-        base_state = base_states.get(layer_id, {})
-        final_state = final_states.get(layer_id, {})
-        if not base_state or not final_state:
-            base_state = {}
-            final_state = {}
+        local_state = player.get_layer_state(layer, time_value)
+        if pose_offsets is None:
+            pose_offsets = self._pose_offsets_for_layer(
+                layer_id, base_states, final_states, tolerance
+            )
+        (
+            world_delta_x,
+            world_delta_y,
+            rot_offset,
+            scale_offset_x,
+            scale_offset_y,
+            has_translation,
+            has_rotation,
+            has_scale,
+        ) = pose_offsets
         base_pos_x = float(local_state.get("pos_x", 0.0))
         base_pos_y = float(local_state.get("pos_y", 0.0))
         base_rot = float(local_state.get("rotation", 0.0))
         base_scale_x = float(local_state.get("scale_x", 100.0))
         base_scale_y = float(local_state.get("scale_y", 100.0))
 
-        offset_x, offset_y = self.gl_widget.layer_offsets.get(layer_id, (0.0, 0.0))
-        rot_offset = self.gl_widget.layer_rotations.get(layer_id, 0.0)
-        scale_offset_x, scale_offset_y = self.gl_widget.layer_scale_offsets.get(layer_id, (1.0, 1.0))
-
-        base_anchor_x = float(base_state.get("anchor_world_x", base_state.get("tx", 0.0)))
-        base_anchor_y = float(base_state.get("anchor_world_y", base_state.get("ty", 0.0)))
-        final_anchor_x = float(final_state.get("anchor_world_x", base_anchor_x))
-        final_anchor_y = float(final_state.get("anchor_world_y", base_anchor_y))
-        world_delta_x = (final_anchor_x - base_anchor_x) + offset_x
-        world_delta_y = (final_anchor_y - base_anchor_y) + offset_y
-        has_translation = (
-            abs(world_delta_x) > tolerance or abs(world_delta_y) > tolerance
-        )
-        has_rotation = abs(rot_offset) > tolerance
-        has_scale = (
-            abs(scale_offset_x - 1.0) > tolerance
-            or abs(scale_offset_y - 1.0) > tolerance
-        )
-
         if anchor_override is not None:
             anchor_captured = self._update_layer_anchor(layer, anchor_override)
 
@@ -6249,12 +7348,12 @@ class MSMAnimationViewer(QMainWindow):
         target_scale_x = base_scale_x * (scale_offset_x if has_scale else 1.0)
         target_scale_y = base_scale_y * (scale_offset_y if has_scale else 1.0)
 
-        eval_state = self.gl_widget.player.get_layer_state(layer, self.gl_widget.player.current_time)
+        eval_state = player.get_layer_state(layer, player.current_time)
         keyframe = self._find_keyframe_at_time(layer, time_value)
         created = False
         if not keyframe:
             keyframe = KeyframeData(time=time_value)
-            layer.keyframes.append(keyframe)
+            _insort_keyframe(layer.keyframes, keyframe)
             created = True
             keyframe.pos_x = base_pos_x
             keyframe.pos_y = base_pos_y
@@ -6265,6 +7364,7 @@ class MSMAnimationViewer(QMainWindow):
             snapshot_sprite = eval_state.get("sprite_name")
             if snapshot_sprite:
                 keyframe.sprite_name = snapshot_sprite
+                self._bump_sprite_variant_rev()
             keyframe.immediate_sprite = -1
             keyframe.r = int(eval_state.get("r", keyframe.r))
             keyframe.g = int(eval_state.get("g", keyframe.g))
@@ -6286,9 +7386,6 @@ class MSMAnimationViewer(QMainWindow):
             if created:
                 keyframe.immediate_scale = 0
 
-        if created:
-            layer.keyframes.sort(key=lambda frame: frame.time)
-
         if influence == "forward" and changes_requested:
             delta_x = local_delta_x if has_translation else 0.0
             delta_y = local_delta_y if has_translation else 0.0
@@ -6372,7 +7469,7 @@ class MSMAnimationViewer(QMainWindow):
             return False
 
         keyframe.time = time_value
-        layer.keyframes.sort(key=lambda frame: frame.time)
+        _ensure_keyframes_sorted(layer.keyframes)
 
         if influence == "forward":
             forward_tol = 1.0 / 600.0
@@ -6394,33 +7491,57 @@ class MSMAnimationViewer(QMainWindow):
 
     def _clear_user_offsets_for_layers(self, layer_ids: Set[int]) -> None:
         """Remove gizmo offsets after they have been baked into keyframes."""
-        for layer_id in layer_ids:
-            self.gl_widget.layer_offsets.pop(layer_id, None)
-            self.gl_widget.layer_rotations.pop(layer_id, None)
-            self.gl_widget.layer_scale_offsets.pop(layer_id, None)
-            self.gl_widget.layer_anchor_overrides.pop(layer_id, None)
+        gl_widget = self.gl_widget
+        for overrides in (
+            gl_widget.layer_offsets,
+            gl_widget.layer_rotations,
+            gl_widget.layer_scale_offsets,
+            gl_widget.layer_anchor_overrides,
+        ):
+            if not overrides:
+                continue
+            # Walk whichever side is smaller; the dicts are mutated in place
+            # because the renderer holds references to them.
+            if len(overrides) < len(layer_ids):
+                for layer_id in [key for key in overrides if key in layer_ids]:
+                    del overrides[layer_id]
+            else:
+                for layer_id in layer_ids:
+                    overrides.pop(layer_id, None)
 
-    def _capture_keyframe_state(self, layer_ids: List[int]) -> Dict[int, Dict[str, Any]]:
-        """Return deep copies of keyframes and anchor data for the provided layers."""
+    def _capture_keyframe_state(
+        self,
+        layer_ids: List[int],
+        scope: str = "both",
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Return keyframe field tuples and anchor data for the provided layers.
+
+        ``scope`` is ``"keyframes"``, ``"anchors"`` or ``"both"``; the category
+        left out is stored as None so applying the snapshot leaves it alone.
+        """
+        with_keyframes = scope != "anchors"
+        with_anchor = scope != "keyframes"
         snapshot: Dict[int, Dict[str, Any]] = {}
         for layer_id in layer_ids:
             layer = self.gl_widget.get_layer_by_id(layer_id)
             if not layer:
                 continue
             snapshot[layer_id] = {
-                "keyframes": [replace(kf) for kf in layer.keyframes],
-                "anchor": (float(layer.anchor_x), float(layer.anchor_y)),
+                "keyframes": list(map(_keyframe_fields, layer.keyframes)) if with_keyframes else None,
+                "anchor": (float(layer.anchor_x), float(layer.anchor_y)) if with_anchor else None,
             }
         return snapshot
 
-    def _begin_keyframe_action(self, layer_ids: List[int]):
+    def _begin_keyframe_action(self, layer_ids: List[int], scope: str = "both"):
         unique = sorted({layer_id for layer_id in layer_ids if layer_id is not None})
         if not unique:
             self._pending_keyframe_action = None
             return
         self._pending_keyframe_action = {
             'layer_ids': unique,
-            'before': self._capture_keyframe_state(unique),
+            'scope': scope,
+            'before': self._capture_keyframe_state(unique, scope),
         }
 
     def _finalize_keyframe_action(self, label: str):
@@ -6428,8 +7549,10 @@ class MSMAnimationViewer(QMainWindow):
             return
         layer_ids = self._pending_keyframe_action['layer_ids']
         before_state = self._pending_keyframe_action['before']
-        after_state = self._capture_keyframe_state(layer_ids)
+        scope = self._pending_keyframe_action.get('scope', "both")
         self._pending_keyframe_action = None
+        # Tuple snapshots compare as cheaply as a separate fingerprint would.
+        after_state = self._capture_keyframe_state(layer_ids, scope)
         if before_state == after_state:
             return
         action = {
@@ -6448,24 +7571,27 @@ class MSMAnimationViewer(QMainWindow):
             layer = self.gl_widget.get_layer_by_id(layer_id)
             if not layer:
                 continue
-            frames: List[KeyframeData]
+            frames: Optional[List[Any]]
             anchor_value = None
             if isinstance(payload, dict):
                 frames = payload.get("keyframes", [])
                 anchor_value = payload.get("anchor")
             else:
                 frames = payload  # Backwards compatibility with older snapshots
-            layer.keyframes = [replace(kf) for kf in frames]
-            layer.keyframes.sort(key=lambda frame: frame.time)
-            self._sync_layer_source_frames(layer)
+            if frames is not None:
+                layer.keyframes = [
+                    copy.copy(kf) if isinstance(kf, KeyframeData) else KeyframeData(*kf)
+                    for kf in frames
+                ]
+                _ensure_keyframes_sorted(layer.keyframes)
+                self._sync_layer_source_frames(layer)
             if anchor_value is not None:
                 self._update_layer_anchor(layer, anchor_value)
             changed = True
         if changed:
+            self._bump_sprite_variant_rev()
             self.gl_widget.player.calculate_duration()
-            self.update_timeline()
-            self._refresh_timeline_keyframes()
-            self.gl_widget.update()
+            self._request_ui_refresh(_UI_REFRESH_TIMELINE | _UI_REFRESH_GL)
 
     def _update_layer_anchor(
         self,
@@ -6493,12 +7619,10 @@ class MSMAnimationViewer(QMainWindow):
             if isinstance(anchor_block, dict):
                 anchor_block["x"] = target_x
                 anchor_block["y"] = target_y
-        if self.base_layer_cache:
-            for cached in self.base_layer_cache:
-                if cached.layer_id == layer.layer_id:
-                    cached.anchor_x = target_x
-                    cached.anchor_y = target_y
-                    break
+        cached = self._base_layer_cache_by_id.get(layer.layer_id)
+        if cached is not None:
+            cached.anchor_x = target_x
+            cached.anchor_y = target_y
         return True
 
     def _reset_edit_history(self):
@@ -6557,70 +7681,51 @@ class MSMAnimationViewer(QMainWindow):
         layer_ids = target_layer_ids
         target_layer_set = set(layer_ids)
 
-        # Build lookup tables for hierarchy traversal
-        layer_lookup: Dict[int, LayerData] = {}
-        for layer in animation.layers:
-            if layer.layer_id is not None:
-                layer_lookup[layer.layer_id] = layer
-
-        children_map: Dict[int, List[int]] = {}
-        root_layer_ids: List[int] = []
-        for layer in animation.layers:
-            if layer.layer_id is None:
-                continue
-            if layer.layer_id not in target_layer_set:
-                continue
-            parent_id = layer.parent_id
-            if parent_id is None or parent_id < 0 or parent_id not in layer_lookup:
-                root_layer_ids.append(layer.layer_id)
-            else:
-                children_map.setdefault(parent_id, []).append(layer.layer_id)
+        # Cached id -> layer map for hierarchy traversal
+        layer_lookup = self._layer_index(animation)
 
         current_time = round(self.gl_widget.player.current_time, 5)
         original_time = self.gl_widget.player.current_time
         self.gl_widget.player.current_time = current_time
         self._begin_keyframe_action(layer_ids)
 
-        # Only layers with pending gizmo offsets/overrides need pose baking
+        # Every target layer present in the hierarchy gets its pose baked
         pose_layer_ids = {
             layer_id for layer_id in layer_ids
             if layer_id is not None and layer_id in layer_lookup
         }
         pose_bake_required = bool(pose_layer_ids)
         evaluated_world_state = self.gl_widget._build_layer_world_states(current_time)
-        pose_state_cache: Dict[
-            Tuple[int, ...],
-            Tuple[Dict[int, Dict[str, Any]], Dict[int, Dict[str, Any]]]
-        ] = {}
-
-        def pose_state_key(layer_id: int) -> Tuple[int, ...]:
-            chain: List[int] = []
+        # Base states zero the offsets of each pose layer's whole ancestor
+        # chain, selected or not, so pending parent offsets get baked into the
+        # child too. A layer's world state depends only on its own chain, so
+        # zeroing the union of chains at once matches zeroing each chain alone:
+        # two world-state builds total, taken before any layer is flattened.
+        zero_layer_ids: Set[int] = set()
+        for layer_id in pose_layer_ids:
             current = layer_lookup.get(layer_id)
-            visited: Set[int] = set()
-            while current:
+            while current is not None:
                 lid = current.layer_id
-                if lid in visited or lid is None:
+                if lid is None or lid in zero_layer_ids:
                     break
-                visited.add(lid)
-                chain.append(lid)
-                parent_id = current.parent_id
-                current = layer_lookup.get(parent_id)
-            chain.sort()
-            return tuple(chain) if chain else (layer_id,)
+                zero_layer_ids.add(lid)
+                current = layer_lookup.get(current.parent_id)
+        base_states_map: Dict[int, Dict[str, Any]] = {}
+        final_states_map: Dict[int, Dict[str, Any]] = {}
+        if pose_bake_required:
+            base_states_map, final_states_map = self._gather_pose_state_maps(
+                zero_layer_ids,
+                final_raw=evaluated_world_state,
+            )
 
         captured = 0
+        touched_layers: List[LayerData] = []
         for layer in animation.layers:
             if layer.layer_id is None:
                 continue
             if layer.layer_id not in target_layer_set:
                 continue
             if pose_bake_required and layer.layer_id in pose_layer_ids:
-                cache_key = pose_state_key(layer.layer_id)
-                base_states_map, final_states_map = pose_state_cache.get(cache_key, ({}, {}))
-                if not base_states_map or not final_states_map:
-                    ids = set(cache_key)
-                    base_states_map, final_states_map = self._gather_pose_state_maps(ids)
-                    pose_state_cache[cache_key] = (base_states_map, final_states_map)
                 if self._record_pose_for_layer(
                     layer.layer_id,
                     current_time,
@@ -6631,11 +7736,15 @@ class MSMAnimationViewer(QMainWindow):
                 ):
                     captured += 1
             render_snapshot = evaluated_world_state.get(layer.layer_id) if evaluated_world_state else None
-            layer_state = self.gl_widget.player.get_layer_state(layer, current_time)
             keyframe = self._find_keyframe_at_time(layer, current_time, tolerance=1e-4)
             snapshot_sprite = None
             if render_snapshot:
                 snapshot_sprite = render_snapshot.get('sprite_name')
+            # Interpolate only when a new keyframe must be built or the render
+            # snapshot lacks a sprite to fall back from.
+            layer_state: Dict[str, Any] = {}
+            if keyframe is None or not snapshot_sprite:
+                layer_state = self.gl_widget.player.get_layer_state(layer, current_time)
             if not snapshot_sprite:
                 snapshot_sprite = layer_state.get('sprite_name')
             if keyframe:
@@ -6645,7 +7754,7 @@ class MSMAnimationViewer(QMainWindow):
                     keyframe.sprite_name = snapshot_sprite
                     if keyframe.immediate_sprite == -1:
                         keyframe.immediate_sprite = 1
-                layer.keyframes = [replace(keyframe)]
+                layer.keyframes = [copy.copy(keyframe)]
             else:
                 # Capture the interpolated state at current time before clearing keyframes
                 layer.keyframes = [KeyframeData(
@@ -6667,8 +7776,9 @@ class MSMAnimationViewer(QMainWindow):
                     immediate_sprite=1,
                     immediate_rgb=1
                 )]
-            layer.keyframes.sort(key=lambda frame: frame.time)
-            self._sync_layer_source_frames(layer)
+            touched_layers.append(layer)
+        self._sync_layers_source_frames(touched_layers)
+        self._bump_sprite_variant_rev()
         self._clear_user_offsets_for_layers(set(layer_ids))
         self._finalize_keyframe_action("delete_other_keyframes")
         self.gl_widget.player.current_time = original_time
@@ -6720,8 +7830,9 @@ class MSMAnimationViewer(QMainWindow):
         if not layer_ids:
             self.log_widget.log("This animation has no editable layers.", "WARNING")
             return
-        self._begin_keyframe_action(layer_ids)
+        self._begin_keyframe_action(layer_ids, scope="keyframes")
         trimmed_snapshots: Dict[int, Dict[str, Any]] = {}
+        touched_layers: List[LayerData] = []
         shortening = new_duration < current_duration
         tolerance = 1e-4
         if shortening:
@@ -6734,23 +7845,27 @@ class MSMAnimationViewer(QMainWindow):
                 continue
             if not shortening:
                 if layer.keyframes:
-                    last_keyframe = max(layer.keyframes, key=lambda frame: frame.time)
-                    duplicated = replace(last_keyframe)
+                    # Tracks are kept time-sorted, so the tail is the latest keyframe.
+                    last_keyframe = layer.keyframes[-1]
+                    duplicated = copy.copy(last_keyframe)
                 else:
                     duplicated = KeyframeData(time=new_duration)
                 duplicated.time = new_duration
                 layer.keyframes.append(duplicated)
             else:
                 snapshots = trimmed_snapshots.get(layer.layer_id, {})
-                preserved: List[KeyframeData] = []
-                for keyframe in layer.keyframes:
-                    if keyframe.time < new_duration - tolerance:
-                        preserved.append(replace(keyframe))
-                    elif abs(keyframe.time - new_duration) <= tolerance:
-                        clone = replace(keyframe)
+                keyframes = layer.keyframes
+                # Sorted track: everything before ``cut`` ends early enough to
+                # keep as-is; [cut, end) sits on the new end and is snapped.
+                cut = bisect_left(keyframes, new_duration - tolerance, key=_keyframe_time)
+                end = bisect_right(keyframes, new_duration + tolerance, lo=cut, key=_keyframe_time)
+                preserved: List[KeyframeData] = [copy.copy(kf) for kf in keyframes[:cut]]
+                for keyframe in keyframes[cut:end]:
+                    if abs(keyframe.time - new_duration) <= tolerance:
+                        clone = copy.copy(keyframe)
                         clone.time = new_duration
                         preserved.append(clone)
-                    # Keyframes after the new duration are discarded
+                # Keyframes after the new duration are discarded
                 if not preserved or preserved[-1].time < new_duration - tolerance:
                     preserved.append(
                         KeyframeData(
@@ -6774,8 +7889,11 @@ class MSMAnimationViewer(QMainWindow):
                         )
                     )
                 layer.keyframes = preserved
-            layer.keyframes.sort(key=lambda frame: frame.time)
-            self._sync_layer_source_frames(layer)
+            # Extending appends past the old end and trimming preserves order,
+            # so the track stays sorted without a re-sort.
+            touched_layers.append(layer)
+        self._sync_layers_source_frames(touched_layers)
+        self._bump_sprite_variant_rev()
         action_label = "shrink_duration" if shortening else "extend_duration"
         self._finalize_keyframe_action(action_label)
         self.gl_widget.player.calculate_duration()
@@ -6789,13 +7907,22 @@ class MSMAnimationViewer(QMainWindow):
 
     def _gather_pose_state_maps(
         self,
-        target_ids: Set[int]
+        target_ids: Set[int],
+        final_raw: Optional[Dict[int, Dict[str, Any]]] = None,
     ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, Dict[str, Any]]]:
-        """Return (base_states_without_offsets, final_states_with_offsets)."""
+        """
+        Return (base_states_without_offsets, final_states_with_offsets).
+
+        Callers that already built world states at the current time with
+        offsets applied may pass them as ``final_raw`` to skip that build.
+        """
         if not target_ids:
             return {}, {}
-        final_raw = self.gl_widget._build_layer_world_states()
-        final_map = copy.deepcopy(final_raw)
+        # World states hold only scalars, strings and tuples, so copying each
+        # per-layer dict is enough to detach them from the renderer's cache.
+        if final_raw is None:
+            final_raw = self.gl_widget._build_layer_world_states()
+        final_map = {layer_id: state.copy() for layer_id, state in final_raw.items()}
         snapshots: Dict[int, Dict[str, Any]] = {}
         for layer_id in target_ids:
             snapshots[layer_id] = {
@@ -6809,7 +7936,10 @@ class MSMAnimationViewer(QMainWindow):
             self.gl_widget.layer_scale_offsets[layer_id] = (1.0, 1.0)
             if layer_id in self.gl_widget.layer_anchor_overrides:
                 self.gl_widget.layer_anchor_overrides.pop(layer_id, None)
-        base_raw = copy.deepcopy(self.gl_widget._build_layer_world_states())
+        base_raw = {
+            layer_id: state.copy()
+            for layer_id, state in self.gl_widget._build_layer_world_states().items()
+        }
         for layer_id, snapshot in snapshots.items():
             offset_val = snapshot.get("offset")
             rot_val = snapshot.get("rotation")
@@ -6831,7 +7961,10 @@ class MSMAnimationViewer(QMainWindow):
                 self.gl_widget.layer_anchor_overrides.pop(layer_id, None)
             else:
                 self.gl_widget.layer_anchor_overrides[layer_id] = anchor_val
-        self.gl_widget._build_layer_world_states()
+        # The base build left the zero-offset states in the widget's cache; the
+        # offsets are restored, so reinstate the matching final states instead
+        # of rebuilding them.
+        self.gl_widget.prime_world_state_cache(final_raw)
         return base_raw, final_map
 
     def _world_delta_to_local(
@@ -6848,20 +7981,14 @@ class MSMAnimationViewer(QMainWindow):
         parent_state = state_map.get(parent_id)
         if not parent_state:
             return world_dx, world_dy
-        pm00 = float(parent_state.get("m00", 1.0))
-        pm01 = float(parent_state.get("m01", 0.0))
-        pm10 = float(parent_state.get("m10", 0.0))
-        pm11 = float(parent_state.get("m11", 1.0))
-        det = pm00 * pm11 - pm01 * pm10
-        if abs(det) < 1e-6:
-            return world_dx, world_dy
-        inv00 = pm11 / det
-        inv01 = -pm01 / det
-        inv10 = -pm10 / det
-        inv11 = pm00 / det
-        local_x = inv00 * world_dx + inv01 * world_dy
-        local_y = inv10 * world_dx + inv11 * world_dy
-        return local_x, local_y
+        return _world_delta_to_local_kernel(
+            float(parent_state.get("m00", 1.0)),
+            float(parent_state.get("m01", 0.0)),
+            float(parent_state.get("m10", 0.0)),
+            float(parent_state.get("m11", 1.0)),
+            float(world_dx),
+            float(world_dy),
+        )
 
     def _find_keyframe_at_time(
         self,
@@ -6870,61 +7997,67 @@ class MSMAnimationViewer(QMainWindow):
         tolerance: float = 1.0 / 600.0
     ) -> Optional[KeyframeData]:
         """Return the first keyframe whose timestamp is within tolerance."""
-        for keyframe in layer.keyframes:
-            if abs(keyframe.time - time_value) <= tolerance:
-                return keyframe
+        # Tracks are kept time-sorted, so the first match is the first frame
+        # at or after the start of the tolerance window.
+        keyframes = layer.keyframes
+        idx = bisect_left(keyframes, time_value - tolerance, key=_keyframe_time)
+        if idx < len(keyframes) and keyframes[idx].time <= time_value + tolerance:
+            return keyframes[idx]
         return None
 
     def _sync_layer_source_frames(self, layer: LayerData) -> None:
         """Mirror dataclass keyframes back to the source JSON structure."""
-        source = self.layer_source_lookup.get(layer.layer_id)
-        if source is None:
-            return
-        serialized = [self._serialize_keyframe(keyframe) for keyframe in layer.keyframes]
-        source["frames"] = serialized
-        if self.base_layer_cache:
-            for cached in self.base_layer_cache:
-                if cached.layer_id == layer.layer_id:
-                    cached.keyframes = [replace(kf) for kf in layer.keyframes]
-                    break
+        self._sync_layers_source_frames((layer,))
+
+    def _sync_layers_source_frames(self, layers: Iterable[LayerData]) -> None:
+        """Mirror keyframes for several layers back to the JSON and base cache."""
+        cache_index = self._base_layer_cache_by_id
+        serialize = self._serialize_keyframe
+        for layer in layers:
+            layer.sprite_signature = None
+            self._dirty_layer_ids.add(layer.layer_id)
+            source = self.layer_source_lookup.get(layer.layer_id)
+            if source is None:
+                continue
+            source["frames"] = list(map(serialize, layer.keyframes))
+            cached = cache_index.get(layer.layer_id)
+            if cached is not None:
+                cached.keyframes = [copy.copy(kf) for kf in layer.keyframes]
+                cached.sprite_signature = None
 
     def _serialize_keyframe(self, keyframe: KeyframeData) -> Dict[str, Any]:
         """Convert a KeyframeData instance back into the JSON frame schema."""
-        def _int(value: Any, default: int = 0) -> int:
-            try:
-                return int(value)
-            except (TypeError, ValueError):
-                return default
-
+        # A single nested literal compiles to constant-key map builds, which
+        # beats copying and filling pre-baked template dicts.
         return {
             "time": float(keyframe.time),
             "pos": {
                 "x": float(keyframe.pos_x),
                 "y": float(keyframe.pos_y),
-                "immediate": _int(keyframe.immediate_pos),
+                "immediate": _to_int(keyframe.immediate_pos),
             },
             "scale": {
                 "x": float(keyframe.scale_x),
                 "y": float(keyframe.scale_y),
-                "immediate": _int(keyframe.immediate_scale),
+                "immediate": _to_int(keyframe.immediate_scale),
             },
             "rotation": {
                 "value": float(keyframe.rotation),
-                "immediate": _int(keyframe.immediate_rotation),
+                "immediate": _to_int(keyframe.immediate_rotation),
             },
             "opacity": {
                 "value": float(keyframe.opacity),
-                "immediate": _int(keyframe.immediate_opacity),
+                "immediate": _to_int(keyframe.immediate_opacity),
             },
             "sprite": {
                 "string": keyframe.sprite_name or "",
-                "immediate": _int(keyframe.immediate_sprite),
+                "immediate": _to_int(keyframe.immediate_sprite),
             },
             "rgb": {
                 "red": int(keyframe.r),
                 "green": int(keyframe.g),
                 "blue": int(keyframe.b),
-                "immediate": _int(keyframe.immediate_rgb, -1),
+                "immediate": _to_int(keyframe.immediate_rgb, -1),
             },
         }
 
@@ -6939,71 +8072,31 @@ class MSMAnimationViewer(QMainWindow):
             "layers": []
         }
         skipped_layers: List[str] = []
+        templates = self._layer_source_templates
+        last_exported = self._last_exported_layers
         for layer in animation.layers:
             source = self.layer_source_lookup.get(layer.layer_id)
             if source is None:
                 label = layer.name or f"Layer {layer.layer_id}"
                 skipped_layers.append(label)
                 continue
-            layer_dict = copy.deepcopy(source) if source else {}
-            layer_dict["name"] = layer.name
-            layer_dict["id"] = layer.layer_id
-            layer_dict["parent"] = layer.parent_id
-            layer_dict["anchor_x"] = float(layer.anchor_x)
-            layer_dict["anchor_y"] = float(layer.anchor_y)
-            layer_dict["blend"] = int(layer.blend_mode)
-            layer_dict["visible"] = bool(layer.visible)
-            if layer.shader_name:
-                layer_dict["shader"] = layer.shader_name
-            else:
-                layer_dict.pop("shader", None)
-
-            def _assign_color(field_name: str, value: Optional[Tuple[float, float, float, float]]):
-                if value is None:
-                    layer_dict.pop(field_name, None)
-                    return
-                layer_dict[field_name] = [float(component) for component in value]
-
-            _assign_color("color_tint", getattr(layer, "color_tint", None))
-            _assign_color("color_tint_hdr", getattr(layer, "color_tint_hdr", None))
-
-            gradient = getattr(layer, "color_gradient", None)
-            if gradient:
-                layer_dict["color_gradient"] = copy.deepcopy(gradient)
-            else:
-                layer_dict.pop("color_gradient", None)
-
-            animator = getattr(layer, "color_animator", None)
-            if animator:
-                layer_dict["color_animator"] = copy.deepcopy(animator)
-            else:
-                layer_dict.pop("color_animator", None)
-
-            metadata = getattr(layer, "color_metadata", None)
-            if metadata:
-                layer_dict["color_metadata"] = copy.deepcopy(metadata)
-            else:
-                layer_dict.pop("color_metadata", None)
-
-            render_tags = getattr(layer, "render_tags", set())
-            if render_tags:
-                layer_dict["render_tags"] = sorted(tag for tag in render_tags if isinstance(tag, str))
-            else:
-                layer_dict.pop("render_tags", None)
-
-            mask_role = getattr(layer, "mask_role", None)
-            mask_key = getattr(layer, "mask_key", None)
-            if mask_role:
-                layer_dict["mask_role"] = mask_role
-            else:
-                layer_dict.pop("mask_role", None)
-            if mask_key:
-                layer_dict["mask_key"] = mask_key
+            template = templates.get(layer.layer_id)
+            if template is None:
+                template = templates[layer.layer_id] = _layer_source_template(source)
+            signature = self._layer_export_signature(layer, template)
+            cached = last_exported.get(layer.layer_id)
+            if (
+                cached is not None
+                and cached[0] is layer
+                and layer.layer_id not in self._dirty_layer_ids
+                and cached[1] == signature
+            ):
+                layer_dict = _fast_clone(cached[2])
             else:
-                layer_dict.pop("mask_key", None)
-
-            layer_dict["frames"] = [self._serialize_keyframe(keyframe) for keyframe in layer.keyframes]
+                layer_dict = self._export_layer_dict(layer, template)
+                last_exported[layer.layer_id] = (layer, signature, _fast_clone(layer_dict))
             exported["layers"].append(layer_dict)
+        self._dirty_layer_ids.clear()
         if skipped_layers and self.log_widget:
             preview = ", ".join(skipped_layers[:3])
             if len(skipped_layers) > 3:
@@ -7014,6 +8107,78 @@ class MSMAnimationViewer(QMainWindow):
             )
         return exported
 
+    @staticmethod
+    def _layer_export_signature(layer: LayerData, template: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Cheap summary of the LayerData fields _export_layer_dict reads.
+
+        Color blocks are compared by identity since every writer replaces
+        them; keyframe edits are caught through _dirty_layer_ids instead.
+        """
+        return (
+            id(template),
+            layer.name,
+            layer.parent_id,
+            layer.anchor_x,
+            layer.anchor_y,
+            layer.blend_mode,
+            layer.visible,
+            layer.shader_name,
+            layer.color_tint,
+            layer.color_tint_hdr,
+            id(layer.color_gradient),
+            id(layer.color_animator),
+            id(layer.color_metadata),
+            frozenset(layer.render_tags),
+            layer.mask_role,
+            layer.mask_key,
+            id(layer.keyframes),
+            len(layer.keyframes),
+        )
+
+    def _export_layer_dict(self, layer: LayerData, template: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one exported layer dict from its source template and LayerData."""
+        # The template never holds volatile keys, so they are only ever
+        # assigned below, never popped.
+        layer_dict = _fast_clone(template)
+        layer_dict["name"] = layer.name
+        layer_dict["id"] = layer.layer_id
+        layer_dict["parent"] = layer.parent_id
+        layer_dict["anchor_x"] = float(layer.anchor_x)
+        layer_dict["anchor_y"] = float(layer.anchor_y)
+        layer_dict["blend"] = int(layer.blend_mode)
+        layer_dict["visible"] = bool(layer.visible)
+        if layer.shader_name:
+            layer_dict["shader"] = layer.shader_name
+
+        _assign_color_field(layer_dict, "color_tint", layer.color_tint)
+        _assign_color_field(layer_dict, "color_tint_hdr", layer.color_tint_hdr)
+
+        gradient = layer.color_gradient
+        if gradient:
+            layer_dict["color_gradient"] = _fast_clone(gradient)
+
+        animator = layer.color_animator
+        if animator:
+            layer_dict["color_animator"] = _fast_clone(animator)
+
+        metadata = layer.color_metadata
+        if metadata:
+            layer_dict["color_metadata"] = _fast_clone(metadata)
+
+        if layer.render_tags:
+            layer_dict["render_tags"] = list(_layer_sorted_render_tags(layer))
+
+        mask_role = layer.mask_role
+        mask_key = layer.mask_key
+        if mask_role:
+            layer_dict["mask_role"] = mask_role
+        if mask_key:
+            layer_dict["mask_key"] = mask_key
+
+        layer_dict["frames"] = [self._serialize_keyframe(keyframe) for keyframe in layer.keyframes]
+        return layer_dict
+
     def _ensure_payload_defaults(self, payload: Dict[str, Any]) -> None:
         """Guarantee payload has required top-level fields."""
         blend = payload.get("blend_version")
@@ -7038,19 +8203,36 @@ class MSMAnimationViewer(QMainWindow):
             payload["anims"] = anims
             return
         if animation.name:
-            target_name = animation.name.lower()
-            for entry in anims:
-                if isinstance(entry, dict) and (entry.get("name") or "").lower() == target_name:
-                    entry.update(exported)
-                    payload["anims"] = anims
-                    return
+            found = self._find_payload_anim(anims, animation.name)
+            if found is not None:
+                anims[found].update(exported)
+                payload["anims"] = anims
+                return
         anims.append(exported)
         payload["anims"] = anims
+
+    def _find_payload_anim(self, anims: List[Any], name: str) -> Optional[int]:
+        """Return the index of the first dict entry in ``anims`` named ``name``, ignoring case."""
+        target_name = name.lower()
+        for position, entry in enumerate(anims):
+            if isinstance(entry, dict) and (entry.get("name") or "").lower() == target_name:
+                return position
+        return None
     
+    def _schedule_gl_update(self) -> None:
+        """
+        Repaint the viewer within 16 ms, folding any further requests into it.
+
+        The timer is not restarted while pending, so a continuous drag still
+        repaints at a steady rate instead of waiting for the drag to pause.
+        """
+        if not self._gl_update_throttle.isActive():
+            self._gl_update_throttle.start()
+
     def on_scale_changed(self, value: float):
         """Handle render scale change"""
         self.gl_widget.render_scale = value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_fps_changed(self, value: int):
         """Handle FPS change"""
@@ -7064,7 +8246,7 @@ class MSMAnimationViewer(QMainWindow):
         self.control_panel.pos_scale_slider.blockSignals(True)
         self.control_panel.pos_scale_slider.setValue(int(value * 100))
         self.control_panel.pos_scale_slider.blockSignals(False)
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_position_scale_slider_changed(self, value: int):
         """Handle position scale slider change"""
@@ -7074,7 +8256,7 @@ class MSMAnimationViewer(QMainWindow):
         self.control_panel.pos_scale_spin.setValue(scale_value)
         self.control_panel.pos_scale_spin.blockSignals(False)
         self.gl_widget.position_scale = scale_value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_base_world_scale_changed(self, value: float):
         """Handle base world scale spinbox change"""
@@ -7083,7 +8265,7 @@ class MSMAnimationViewer(QMainWindow):
         self.control_panel.base_scale_slider.blockSignals(True)
         self.control_panel.base_scale_slider.setValue(int(value * 100))
         self.control_panel.base_scale_slider.blockSignals(False)
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_base_world_scale_slider_changed(self, value: int):
         """Handle base world scale slider change"""
@@ -7093,7 +8275,7 @@ class MSMAnimationViewer(QMainWindow):
         self.control_panel.base_scale_spin.setValue(scale_value)
         self.control_panel.base_scale_spin.blockSignals(False)
         self.gl_widget.renderer.base_world_scale = scale_value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_translation_sensitivity_changed(self, value: float):
         """Adjust sprite drag translation speed multiplier."""
@@ -7106,7 +8288,7 @@ class MSMAnimationViewer(QMainWindow):
     def on_rotation_overlay_size_changed(self, value: float):
         """Adjust the visual radius of the rotation gizmo."""
         self.gl_widget.rotation_overlay_radius = max(5.0, value)
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def toggle_rotation_gizmo(self, enabled: bool):
         """Toggle visibility of the rotation gizmo overlay."""
@@ -7220,43 +8402,43 @@ class MSMAnimationViewer(QMainWindow):
     
     def on_anchor_bias_x_changed(self, value: float):
         self.gl_widget.renderer.anchor_bias_x = value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_anchor_bias_y_changed(self, value: float):
         self.gl_widget.renderer.anchor_bias_y = value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_local_position_multiplier_changed(self, value: float):
         self.gl_widget.renderer.local_position_multiplier = max(0.0, value)
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_parent_mix_changed(self, value: float):
         self.gl_widget.renderer.parent_mix = max(0.0, min(1.0, value))
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_rotation_bias_changed(self, value: float):
         self.gl_widget.renderer.rotation_bias = value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_scale_bias_x_changed(self, value: float):
         self.gl_widget.renderer.scale_bias_x = max(0.0, value)
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_scale_bias_y_changed(self, value: float):
         self.gl_widget.renderer.scale_bias_y = max(0.0, value)
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_world_offset_x_changed(self, value: float):
         self.gl_widget.renderer.world_offset_x = value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_world_offset_y_changed(self, value: float):
         self.gl_widget.renderer.world_offset_y = value
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def on_trim_shift_multiplier_changed(self, value: float):
         self.gl_widget.renderer.trim_shift_multiplier = max(0.0, value)
-        self.gl_widget.update()
+        self._schedule_gl_update()
     
     def reset_camera(self):
         """Reset camera to default position"""
@@ -7398,8 +8580,177 @@ class MSMAnimationViewer(QMainWindow):
         """
         Render the current frame to a PIL Image.
         """
-        fbo = None
-        texture = None
+        pixels = self._render_frame_pixels(
+            width,
+            height,
+            camera_override=camera_override,
+            render_scale_override=render_scale_override,
+            apply_centering=apply_centering,
+        )
+        if pixels is None:
+            return None
+        return self._frame_pixels_to_image(pixels, width, height, background_color)
+
+    def _iter_rendered_frames(
+        self,
+        frame_times: Iterable[float],
+        width: int,
+        height: int,
+        *,
+        camera_override: Optional[Tuple[float, float]] = None,
+        render_scale_override: Optional[float] = None,
+        apply_centering: bool = True,
+        background_color: Optional[Tuple[int, int, int, int]] = None,
+        finish: Optional[Callable[[int, Image.Image], Any]] = None,
+        discard: Optional[Callable[[int, Any], None]] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Render each frame time in order, yielding ``(index, image)``.
+
+        Readback goes through a _PixelPackPipeline and the CPU side (flip,
+        unpremultiply, background, then ``finish(index, image)`` if given)
+        runs on a small thread pool while later frames render. Results
+        therefore arrive a few frames behind the render, still in order; with
+        ``finish`` its return value is yielded in place of the image. Frames
+        that fail to render, read back or post-process yield ``None``. Sets
+        the player's current time; callers restore it.
+
+        If the caller closes the iterator early, frames already running still
+        finish; ``discard(index, result)`` is then called for each of those
+        that completed but was never yielded, so callers can undo side
+        effects of ``finish`` such as files written to disk.
+        """
+        pipeline = _PixelPackPipeline(width, height, reuse_host_buffers=False)
+        workers = max(1, min(_EXPORT_POSTPROCESS_WORKERS, os.cpu_count() or 1))
+        # Bounds memory: frames past this wait for the oldest to be consumed.
+        frame_bytes = max(1, width * height * 8)
+        max_in_flight = max(2, min(2 * workers, _EXPORT_IN_FLIGHT_BYTES // frame_bytes))
+        in_flight: Deque[Tuple[int, Optional[Future]]] = deque()
+        # The view is fixed for the whole export; resolve it once.
+        view_matrices = self._resolve_export_view(
+            width,
+            height,
+            camera_override=camera_override,
+            render_scale_override=render_scale_override,
+            apply_centering=apply_centering,
+        )
+
+        def process(tag: int, pixels: np.ndarray) -> Any:
+            image = self._postprocess_frame(pixels, width, height, background_color)
+            return finish(tag, image) if finish is not None else image
+
+        def submit(ready: List[Tuple[int, Optional[np.ndarray]]]) -> None:
+            for tag, pixels in ready:
+                in_flight.append((tag, executor.submit(process, tag, pixels) if pixels is not None else None))
+
+        def collect(limit: int) -> Iterator[Tuple[int, Any]]:
+            while len(in_flight) > limit:
+                tag, future = in_flight.popleft()
+                result = None
+                if future is not None:
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.log_widget.log(f"Error rendering frame: {e}", "ERROR")
+                yield tag, result
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="FrameExport")
+        try:
+            for index, frame_time in enumerate(frame_times):
+                self.gl_widget.player.current_time = frame_time
+                ready = self._render_frame_pixels(
+                    width,
+                    height,
+                    read_pixels=lambda tag=index: pipeline.submit(tag),
+                    view_matrices=view_matrices,
+                )
+                if ready is None:
+                    # Keep output in order: queue the in-flight frame first.
+                    submit(self._run_in_gl_context(pipeline.drain, []))
+                    in_flight.append((index, None))
+                else:
+                    submit(ready)
+                yield from collect(max_in_flight)
+            submit(self._run_in_gl_context(pipeline.drain, []))
+            yield from collect(0)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if discard is not None:
+                for tag, future in in_flight:
+                    if future is None or future.cancelled() or future.exception() is not None:
+                        continue
+                    discard(tag, future.result())
+            self._run_in_gl_context(pipeline.release, None)
+
+    def _run_in_gl_context(self, func: Callable[[], Any], default: Any) -> Any:
+        """Call ``func`` with the viewer's GL context current, logging failures."""
+        try:
+            self.gl_widget.makeCurrent()
+            return func()
+        except Exception as e:
+            self.log_widget.log(f"GL readback error: {e}", "ERROR")
+            return default
+        finally:
+            self.gl_widget.doneCurrent()
+
+    def _frame_pixels_to_image(
+        self,
+        pixels: Any,
+        width: int,
+        height: int,
+        background_color: Optional[Tuple[int, int, int, int]],
+    ) -> Optional[Image.Image]:
+        """Turn a bottom-up RGBA readback into a straight-alpha PIL image, logging failures."""
+        try:
+            return self._postprocess_frame(pixels, width, height, background_color)
+        except Exception as e:
+            self.log_widget.log(f"Error rendering frame: {e}", "ERROR")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    @classmethod
+    def _postprocess_frame(
+        cls,
+        pixels: Any,
+        width: int,
+        height: int,
+        background_color: Optional[Tuple[int, int, int, int]],
+    ) -> Image.Image:
+        """
+        Flip, unpremultiply and optionally composite a bottom-up RGBA readback.
+
+        Touches no Qt or GL state, so it may run on a worker thread.
+        """
+        if background_color and unpremultiply_composite_kernel is not None:
+            return cls._unpremultiply_composite(pixels, width, height, background_color)
+        src = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 4)
+        # GL rows are bottom-up; the flipped view is free and the LUT pass copies it.
+        rgba = unpremultiply_array(src[::-1])
+        if background_color:
+            rgba = cls._composite_background(rgba, background_color)
+        return Image.fromarray(rgba, 'RGBA')
+
+    def _render_frame_pixels(
+        self,
+        width: int,
+        height: int,
+        *,
+        camera_override: Optional[Tuple[float, float]] = None,
+        render_scale_override: Optional[float] = None,
+        apply_centering: bool = True,
+        read_pixels: Optional[Callable[[], Any]] = None,
+        view_matrices: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> Any:
+        """
+        Render the current frame offscreen and read it back.
+
+        Returns the raw bottom-up RGBA pixels in a buffer reused by the next
+        call of the same size, or whatever ``read_pixels`` returns when given
+        (it runs with the offscreen target bound), or None on failure.
+        ``view_matrices`` from _resolve_export_view skips re-resolving the
+        camera options, for callers rendering many frames with one view.
+        """
         default_fbo = None
         viewport_before = (0, 0, self.gl_widget.width(), self.gl_widget.height())
         projection_pushed = False
@@ -7408,23 +8759,22 @@ class MSMAnimationViewer(QMainWindow):
             self.gl_widget.makeCurrent()
             default_fbo = self.gl_widget.defaultFramebufferObject()
             viewport_before = glGetIntegerv(GL_VIEWPORT)
-            fbo = glGenFramebuffers(1)
-            glBindFramebuffer(GL_FRAMEBUFFER, fbo)
-            texture = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, texture)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, texture, 0)
-            if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            if self._bind_export_target(width, height) is None:
                 self.log_widget.log("Framebuffer not complete", "ERROR")
                 return None
             glViewport(0, 0, width, height)
+            animation = self.gl_widget.player.animation
+            projection, modelview = view_matrices or self._resolve_export_view(
+                width,
+                height,
+                camera_override=camera_override,
+                render_scale_override=render_scale_override,
+                apply_centering=apply_centering,
+            )
             glMatrixMode(GL_PROJECTION)
             glPushMatrix()
             projection_pushed = True
-            glLoadIdentity()
-            glOrtho(0, width, height, 0, -1, 1)
+            glLoadMatrixf(projection)
             glMatrixMode(GL_MODELVIEW)
             glPushMatrix()
             modelview_pushed = True
@@ -7433,23 +8783,18 @@ class MSMAnimationViewer(QMainWindow):
             glEnable(GL_BLEND)
             glBlendFunc(GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
             glEnable(GL_TEXTURE_2D)
-            camera_x = camera_override[0] if camera_override else self.gl_widget.camera_x
-            camera_y = camera_override[1] if camera_override else self.gl_widget.camera_y
-            render_scale = render_scale_override if render_scale_override is not None else self.gl_widget.render_scale
-            if self.gl_widget.player.animation:
-                glLoadIdentity()
-                glTranslatef(camera_x, camera_y, 0)
-                glScalef(render_scale, render_scale, 1.0)
-                if apply_centering and self.gl_widget.player.animation.centered:
-                    glTranslatef(width / 2, height / 2, 0)
+            if animation:
+                glLoadMatrixf(modelview)
                 self.gl_widget.render_all_layers(self.gl_widget.player.current_time)
             glReadBuffer(GL_COLOR_ATTACHMENT0)
-            pixels = glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE)
-            image = Image.frombytes('RGBA', (width, height), pixels).transpose(Image.FLIP_TOP_BOTTOM)
-            image = self._unpremultiply_image(image)
-            if background_color:
-                image = self._composite_background(image, background_color)
-            return image
+            if read_pixels is not None:
+                return read_pixels()
+            buffer = self._readback_buffers.get((width, height))
+            if buffer is None:
+                buffer = np.empty((height, width, 4), dtype=np.uint8)
+                self._readback_buffers[(width, height)] = buffer
+            glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, buffer)
+            return buffer
         except Exception as e:
             self.log_widget.log(f"Error rendering frame: {e}", "ERROR")
             import traceback
@@ -7458,10 +8803,6 @@ class MSMAnimationViewer(QMainWindow):
         finally:
             target_fbo = default_fbo if default_fbo is not None else 0
             glBindFramebuffer(GL_FRAMEBUFFER, target_fbo)
-            if fbo is not None:
-                glDeleteFramebuffers(1, [fbo])
-            if texture is not None:
-                glDeleteTextures(1, [texture])
             if projection_pushed:
                 glMatrixMode(GL_PROJECTION)
                 glPopMatrix()
@@ -7475,17 +8816,223 @@ class MSMAnimationViewer(QMainWindow):
             self.gl_widget.doneCurrent()
             self.gl_widget.update()
 
+    def _resolve_export_view(
+        self,
+        width: int,
+        height: int,
+        *,
+        camera_override: Optional[Tuple[float, float]] = None,
+        render_scale_override: Optional[float] = None,
+        apply_centering: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Resolve export camera options against the viewer into view matrices."""
+        gl_widget = self.gl_widget
+        camera_x = camera_override[0] if camera_override else gl_widget.camera_x
+        camera_y = camera_override[1] if camera_override else gl_widget.camera_y
+        render_scale = render_scale_override if render_scale_override is not None else gl_widget.render_scale
+        animation = gl_widget.player.animation
+        return self._export_view_matrices(
+            width,
+            height,
+            camera_x,
+            camera_y,
+            render_scale,
+            bool(apply_centering and animation and animation.centered),
+        )
+
+    def _export_view_matrices(
+        self,
+        width: int,
+        height: int,
+        camera_x: float,
+        camera_y: float,
+        render_scale: float,
+        centered: bool,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return column-major ``(projection, modelview)`` matrices for an export frame.
+
+        Equivalent to ``glOrtho(0, w, h, 0, -1, 1)`` and translate(camera) *
+        scale(render_scale) * translate(w/2, h/2 if centered). Only the last
+        key is kept since the view is fixed for the length of an export.
+        """
+        key = (width, height, camera_x, camera_y, render_scale, centered)
+        cached = self._export_view_matrix_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        projection = np.array(
+            [
+                [2.0 / width, 0.0, 0.0, -1.0],
+                [0.0, -2.0 / height, 0.0, 1.0],
+                [0.0, 0.0, -1.0, 0.0],
+                [0.0, 0.0, 0.0, 1.0],
+            ],
+            dtype=np.float32,
+        )
+        offset_x = camera_x + (render_scale * width / 2 if centered else 0.0)
+        offset_y = camera_y + (render_scale * height / 2 if centered else 0.0)
+        modelview = np.array(
+            [
+                [render_scale, 0.0, 0.0, offset_x],
+                [0.0, render_scale, 0.0, offset_y],
+                [0.0, 0.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 1.0],
+            ],
+            dtype=np.float32,
+        )
+        # GL expects column-major storage.
+        projection = np.ascontiguousarray(projection.T)
+        modelview = np.ascontiguousarray(modelview.T)
+        self._export_view_matrix_cache = (key, projection, modelview)
+        return projection, modelview
+
+    def _bind_export_target(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        Bind a cached offscreen FBO/texture of the given size, creating it if needed.
+
+        Returns ``(fbo, texture)`` or None when the framebuffer is incomplete.
+        Requires a current GL context.
+        """
+        key = (width, height)
+        target = self._export_fbo_cache.get(key)
+        if target is not None:
+            glBindFramebuffer(GL_FRAMEBUFFER, target[0])
+            return target
+        self._release_export_targets()
+        fbo = int(glGenFramebuffers(1))
+        glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+        texture = int(glGenTextures(1))
+        glBindTexture(GL_TEXTURE_2D, texture)
+        if bool(glTexStorage2D):
+            glTexStorage2D(GL_TEXTURE_2D, 1, GL_RGBA8, width, height)
+        else:
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, texture, 0)
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            glDeleteFramebuffers(1, [fbo])
+            glDeleteTextures(1, [texture])
+            return None
+        self._export_fbo_cache[key] = (fbo, texture)
+        return fbo, texture
+
+    def _release_export_targets(self) -> None:
+        """Delete cached export FBOs/textures. Requires a current GL context."""
+        for fbo, texture in self._export_fbo_cache.values():
+            glDeleteFramebuffers(1, [fbo])
+            glDeleteTextures(1, [texture])
+        self._export_fbo_cache.clear()
+        self._readback_buffers.clear()
+
+    def cleanup_export_resources(self) -> None:
+        """Free GPU and atlas resources kept between exports."""
+        self._export_atlas_cache.clear()
+        self._export_atlas_cache_bytes = 0
+        if not self._export_fbo_cache:
+            return
+        self._run_in_gl_context(self._release_export_targets, None)
+
+    def _export_atlas_entry(self, image_path: str) -> List[Any]:
+        """
+        Return the cached ``[stamp, image, pixels, crops, bytes]`` entry for an atlas file.
+
+        Reloads when the file's mtime or size changed. Raises on read errors.
+        Also backs the sprite preview cache, so an atlas decoded for thumbnails
+        is not decoded again by the next export (or vice versa).
+        """
+        stat = os.stat(image_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cache = self._export_atlas_cache
+        entry = cache.get(image_path)
+        if entry is not None and entry[0] == stamp:
+            cache.move_to_end(image_path)
+            return entry
+        image = Image.open(image_path)
+        if image.mode != 'RGBA':
+            with image:
+                image = image.convert('RGBA')
+        else:
+            # Most atlases are RGBA already; decode in place rather than copy.
+            # load() releases the file handle of a single-frame image.
+            try:
+                image.load()
+            except Exception:
+                image.close()
+                raise
+        width, height = image.size
+        entry = [stamp, image, None, {}, 0]
+        stale = cache.pop(image_path, None)
+        if stale is not None:
+            self._export_atlas_cache_bytes -= stale[4]
+        cache[image_path] = entry
+        self._grow_export_atlas_entry(entry, width * height * 4)
+        return entry
+
+    def _export_atlas_array(self, image_path: str) -> np.ndarray:
+        """Return an atlas as a uint8 RGBA array, converted once per file version."""
+        entry = self._export_atlas_entry(image_path)
+        if entry[2] is None:
+            entry[2] = np.asarray(entry[1], dtype=np.uint8)
+            self._grow_export_atlas_entry(entry, entry[2].nbytes)
+        return entry[2]
+
+    def _export_sprite_image(self, atlas: TextureAtlas, sprite: SpriteInfo) -> Image.Image:
+        """Return a sprite's upright crop from its atlas file, cached per file version. Read-only."""
+        entry = self._export_atlas_entry(atlas.image_path)
+        crops = entry[3]
+        key = (sprite.x, sprite.y, sprite.w, sprite.h, sprite.rotated)
+        image = crops.get(key)
+        if image is None:
+            image = entry[1].crop((sprite.x, sprite.y, sprite.x + sprite.w, sprite.y + sprite.h))
+            if sprite.rotated:
+                image = image.rotate(90, expand=True)
+            crops[key] = image
+            self._grow_export_atlas_entry(entry, image.width * image.height * 4)
+        return image
+
+    def _grow_export_atlas_entry(self, entry: List[Any], nbytes: int) -> None:
+        """Charge ``nbytes`` to a cached atlas entry and trim the cache to budget."""
+        entry[4] += nbytes
+        self._export_atlas_cache_bytes += nbytes
+        self._trim_export_atlas_cache()
+
+    def _trim_export_atlas_cache(self) -> None:
+        """Evict least recently used atlas entries until the cache fits its byte budget."""
+        cache = self._export_atlas_cache
+        # Always keep the most recent entry, even if it alone exceeds the budget.
+        while self._export_atlas_cache_bytes > _EXPORT_ATLAS_CACHE_BYTES and len(cache) > 1:
+            _, evicted = cache.popitem(last=False)
+            self._export_atlas_cache_bytes -= evicted[4]
+
     def _find_sprite_in_atlases(self, sprite_name: str):
         """Return (sprite, atlas) for a sprite name."""
-        for atlas in self.gl_widget.texture_atlases:
-            sprite = atlas.get_sprite(sprite_name)
-            if sprite:
-                return sprite, atlas
-        return None, None
-
-    def _compute_frame_bounds(self, time: float, include_hidden: bool = False) -> Optional[Tuple[float, float, float, float]]:
+        atlases = self.gl_widget.texture_atlases
+        key = (len(atlases), self._sprite_pixmap_atlas_rev)
+        if atlases is not self._sprite_lookup_source or key != self._sprite_lookup_key:
+            # First atlas wins, matching the old front-to-back scan.
+            lookup: Dict[str, Tuple[SpriteInfo, TextureAtlas]] = {}
+            for atlas in atlases:
+                for name, sprite in atlas.sprites.items():
+                    if sprite and name not in lookup:
+                        lookup[name] = (sprite, atlas)
+            self._sprite_lookup = lookup
+            self._sprite_lookup_source = atlases
+            self._sprite_lookup_key = key
+        return self._sprite_lookup.get(sprite_name, (None, None))
+
+    def _compute_frame_bounds(
+        self,
+        time: float,
+        include_hidden: bool = False,
+        vertex_cache: Optional[Dict[Tuple[int, int], Any]] = None,
+    ) -> Optional[Tuple[float, float, float, float]]:
         """
         Compute world-space bounds for all visible layers at a specific time.
+
+        ``vertex_cache`` lets multi-frame callers reuse local vertices per
+        (sprite, atlas) pair; it must not outlive a change to renderer scale
+        settings.
         """
         animation = self.gl_widget.player.animation
         if not animation:
@@ -7515,8 +9062,17 @@ class MSMAnimationViewer(QMainWindow):
             if not sprite or not atlas:
                 continue
 
-            local_vertices = renderer.compute_local_vertices(sprite, atlas)
-            if not local_vertices:
+            cache_key = (id(sprite), id(atlas))
+            local_vertices = vertex_cache.get(cache_key) if vertex_cache is not None else None
+            if local_vertices is None:
+                local_vertices = renderer.compute_local_vertices(sprite, atlas)
+                # Meshes go through numpy; a handful of quad corners is
+                # cheaper in the plain loop below.
+                if len(local_vertices) > _BOUNDS_NUMPY_VERTEX_THRESHOLD:
+                    local_vertices = np.asarray(local_vertices, dtype=np.float64)
+                if vertex_cache is not None:
+                    vertex_cache[cache_key] = local_vertices
+            if not len(local_vertices):
                 continue
             user_offset_x, user_offset_y = self.gl_widget.layer_offsets.get(layer.layer_id, (0, 0))
 
@@ -7527,6 +9083,17 @@ class MSMAnimationViewer(QMainWindow):
             tx = state['tx'] + user_offset_x
             ty = state['ty'] + user_offset_y
 
+            if isinstance(local_vertices, np.ndarray):
+                world = local_vertices @ np.array(((m00, m10), (m01, m11)))
+                low = world.min(axis=0)
+                high = world.max(axis=0)
+                min_x = min(min_x, float(low[0]) + tx)
+                min_y = min(min_y, float(low[1]) + ty)
+                max_x = max(max_x, float(high[0]) + tx)
+                max_y = max(max_y, float(high[1]) + ty)
+                any_layer = True
+                continue
+
             for lx, ly in local_vertices:
                 wx = m00 * lx + m01 * ly + tx
                 wy = m10 * lx + m11 * ly + ty
@@ -7558,7 +9125,12 @@ class MSMAnimationViewer(QMainWindow):
 
     def _compute_animation_bounds(self, fps: float, include_hidden: bool = False) -> Optional[Tuple[float, float, float, float]]:
         """
-        Compute aggregate bounds for the entire animation by sampling each frame at the export FPS.
+        Compute aggregate bounds for the entire animation at the export FPS.
+
+        Samples every ``_BOUNDS_COARSE_STRIDE``-th frame plus the frames around
+        each keyframe, then every frame near a sample that touches the
+        envelope. Animations with a layer keyed more densely than the stride
+        are sampled frame by frame.
         """
         animation = self.gl_widget.player.animation
         if not animation or fps <= 0.0:
@@ -7567,34 +9139,154 @@ class MSMAnimationViewer(QMainWindow):
         duration = self.gl_widget.player.duration
         total_frames = max(1, int(math.ceil(duration * fps)))
         aggregated = None
+        vertex_cache: Dict[Tuple[int, int], Any] = {}
+
+        token = self._frame_bounds_state_token(animation)
+        if token != self._frame_bounds_token:
+            self._frame_bounds_cache.clear()
+            self._frame_bounds_token = token
+        cache = self._frame_bounds_cache
+        include_hidden = bool(include_hidden)
 
-        for frame_index in range(total_frames + 1):
+        def sample(frame_index: int) -> Optional[Tuple[float, float, float, float]]:
             frame_time = min(duration, frame_index / fps)
-            bounds = self._compute_frame_bounds(frame_time, include_hidden)
+            key = (include_hidden, int(round(frame_time * 1e6)))
+            if key in cache:
+                return cache[key]
+            bounds = self._compute_frame_bounds(frame_time, include_hidden, vertex_cache)
+            if len(cache) >= _FRAME_BOUNDS_CACHE_LIMIT:
+                del cache[next(iter(cache))]
+            cache[key] = bounds
+            return bounds
+
+        stride = _BOUNDS_COARSE_STRIDE
+        frame_count = total_frames + 1
+        keyframe_indices = self._keyframe_frame_indices(animation, fps, stride)
+        if frame_count <= 2 * stride or keyframe_indices is None:
+            for frame_index in range(frame_count):
+                aggregated = self._merge_bounds(aggregated, sample(frame_index))
+            return aggregated
+
+        coarse = set(range(0, frame_count, stride))
+        coarse.add(total_frames)
+        coarse.update(index for index in keyframe_indices if index < frame_count)
+        sampled: Dict[int, Optional[Tuple[float, float, float, float]]] = {}
+        for frame_index in sorted(coarse):
+            bounds = sample(frame_index)
+            sampled[frame_index] = bounds
             aggregated = self._merge_bounds(aggregated, bounds)
+        if aggregated is None:
+            return None
+
+        envelope = aggregated
+        for frame_index, bounds in list(sampled.items()):
+            if not bounds or not any(bounds[side] == envelope[side] for side in range(4)):
+                continue
+            for neighbor in range(max(0, frame_index - stride + 1), min(frame_count, frame_index + stride)):
+                if neighbor not in sampled:
+                    bounds = sample(neighbor)
+                    sampled[neighbor] = bounds
+                    aggregated = self._merge_bounds(aggregated, bounds)
 
         return aggregated
 
     @staticmethod
-    def _unpremultiply_image(image: Image.Image) -> Image.Image:
-        """Convert a premultiplied-alpha image to straight alpha."""
-        if image.mode != 'RGBA':
-            return image
-        arr = np.array(image, dtype=np.float32)
-        alpha = arr[..., 3:4]
-        mask = alpha > 0.0
-        safe_alpha = np.where(mask, alpha, 1.0)
-        arr[..., :3] = np.where(mask, arr[..., :3] * 255.0 / safe_alpha, 0.0)
-        arr[..., :3] = np.clip(arr[..., :3], 0.0, 255.0)
-        return Image.fromarray(arr.astype(np.uint8), 'RGBA')
+    def _keyframe_frame_indices(animation: AnimationData, fps: float, stride: int) -> Optional[Set[int]]:
+        """
+        Return the frames on either side of every keyframe, or None when some
+        layer has two keyframes less than ``stride`` frames apart.
+        """
+        min_gap = stride / fps
+        indices: Set[int] = set()
+        for layer in animation.layers:
+            previous_time = None
+            for frame in layer.keyframes:
+                frame_time = frame.time
+                if previous_time is not None and 0.0 < frame_time - previous_time < min_gap:
+                    return None
+                previous_time = frame_time
+                position = frame_time * fps
+                indices.add(max(0, int(math.floor(position))))
+                indices.add(max(0, int(math.ceil(position))))
+        return indices
+
+    def _frame_bounds_state_token(self, animation: AnimationData) -> Tuple[Any, ...]:
+        """
+        Summarize view state that frame bounds depend on but edits don't signal.
+
+        Covers layer visibility, gizmo overrides, every renderer transform
+        field ``calculate_world_state`` reads and the loaded atlases; keyframe
+        and atlas edits clear the cache directly.
+        """
+        gl_widget = self.gl_widget
+        renderer = gl_widget.renderer
+        return (
+            id(animation),
+            self._sprite_variant_rev,
+            renderer.position_scale,
+            renderer.base_world_scale,
+            renderer.local_position_multiplier,
+            renderer.rotation_bias,
+            renderer.scale_bias_x,
+            renderer.scale_bias_y,
+            renderer.anchor_bias_x,
+            renderer.anchor_bias_y,
+            renderer.parent_mix,
+            renderer.world_offset_x,
+            renderer.world_offset_y,
+            renderer.trim_shift_multiplier,
+            renderer.costume_pivot_adjustment_enabled,
+            tuple(renderer.anchor_overrides.items()),
+            id(gl_widget.texture_atlases),
+            len(gl_widget.texture_atlases),
+            tuple(layer.visible for layer in animation.layers),
+            tuple(gl_widget.layer_offsets.items()),
+            tuple(gl_widget.layer_rotations.items()),
+            tuple(gl_widget.layer_scale_offsets.items()),
+            tuple(gl_widget.layer_anchor_overrides.items()),
+        )
+
+    def _invalidate_frame_bounds_cache(self) -> None:
+        """Forget memoized frame bounds after animation or atlas edits."""
+        self._frame_bounds_cache.clear()
+        self._frame_bounds_token = None
 
     @staticmethod
-    def _composite_background(image: Image.Image, color: Tuple[int, int, int, int]) -> Image.Image:
-        """Composite an RGBA image over an opaque background color."""
-        if image.mode != 'RGBA':
-            return image
-        base = Image.new('RGBA', image.size, color)
-        return Image.alpha_composite(base, image)
+    def _unpremultiply_composite(
+        pixels: Any,
+        width: int,
+        height: int,
+        color: Tuple[int, int, int, int],
+    ) -> Image.Image:
+        """Fused flip + unpremultiply + background composite of a raw GL readback."""
+        src = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 4)
+        out = np.empty_like(src)
+        bg_r, bg_g, bg_b, bg_a = (int(component) for component in color)
+        with _numba_parallel_lock:
+            unpremultiply_composite_kernel(src, UNPREMULTIPLY_LUT, bg_r, bg_g, bg_b, bg_a, out)
+        return Image.fromarray(out, 'RGBA')
+
+    @staticmethod
+    def _composite_background(rgba: np.ndarray, color: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Composite a straight-alpha (h, w, 4) array over a background color.
+
+        Opaque backgrounds are blended in place with the same integer math as
+        ``Image.alpha_composite``; translucent ones go through PIL.
+        """
+        bg_r, bg_g, bg_b, bg_a = (int(component) for component in color)
+        if bg_a != 255:
+            base = Image.new('RGBA', (rgba.shape[1], rgba.shape[0]), (bg_r, bg_g, bg_b, bg_a))
+            return np.asarray(Image.alpha_composite(base, Image.fromarray(rgba, 'RGBA')))
+        # With an opaque base PIL's 7-bit coefficients reduce to alpha << 7
+        # and (255 - alpha) << 7, and the output alpha is always 255.
+        alpha = rgba[..., 3:4].astype(np.uint32)
+        blended = rgba[..., :3] * (alpha << 7)
+        blended += np.array((bg_r, bg_g, bg_b), dtype=np.uint32) * ((255 - alpha) << 7)
+        blended += 0x80 << 7
+        rgba[..., :3] = (((blended >> 8) + blended) >> 8) >> 7
+        rgba[..., 3] = 255
+        return rgba
 
     def _create_unique_export_folder(self, root: str, base_name: str) -> str:
         """Create a unique directory inside root with base_name."""
@@ -7656,7 +9348,7 @@ class MSMAnimationViewer(QMainWindow):
                 )
                 
                 if image:
-                    image.save(filename, 'PNG')
+                    image.save(filename, 'PNG', **self._png_save_kwargs())
                     self.log_widget.log(f"Frame exported to: {filename}", "SUCCESS")
                 else:
                     self.log_widget.log("Failed to render frame", "ERROR")
@@ -7666,6 +9358,33 @@ class MSMAnimationViewer(QMainWindow):
                 import traceback
                 traceback.print_exc()
 
+    @staticmethod
+    def _refresh_export_progress(
+        progress: QProgressDialog,
+        value: int,
+        label: str,
+        last_refresh: float,
+        force: bool = False,
+    ) -> float:
+        """
+        Update an export progress dialog at most every _EXPORT_PROGRESS_INTERVAL seconds.
+
+        The export dialogs are window-modal, so setValue() already pumps the
+        event loop and keeps Cancel responsive. Returns the time of the last
+        refresh for the next call.
+        """
+        now = time.monotonic()
+        if not force and now - last_refresh < _EXPORT_PROGRESS_INTERVAL:
+            return last_refresh
+        progress.setLabelText(label)
+        progress.setValue(value)
+        return now
+
+    def _png_save_kwargs(self) -> Dict[str, Any]:
+        """Return Image.save options for user-facing PNG exports."""
+        level = _to_int(getattr(self.export_settings, 'png_compression', 1), 1)
+        return {'compress_level': max(0, min(9, level))}
+
     def export_animation_frames_as_png(self):
         """Export every frame of the current animation as PNG files."""
         if not self.gl_widget.player.animation:
@@ -7703,36 +9422,56 @@ class MSMAnimationViewer(QMainWindow):
         original_playing = self.gl_widget.player.playing
         self.gl_widget.player.playing = False
 
+        png_save_kwargs = self._png_save_kwargs()
+
+        def save_frame(frame_idx: int, image: Image.Image) -> str:
+            # Runs on an export worker thread.
+            frame_path = os.path.join(export_root, f"{sanitized_name}_{frame_idx + 1:05d}.png")
+            image.save(frame_path, "PNG", **png_save_kwargs)
+            return frame_path
+
+        def discard_frame(frame_idx: int, frame_path: Optional[str]) -> None:
+            # Frames finished after a cancel are never counted, so drop them.
+            if frame_path:
+                try:
+                    os.remove(frame_path)
+                except OSError:
+                    pass
+
         exported = 0
+        last_progress = 0.0
         try:
             background_color = self._active_background_color()
-            for frame_idx in range(total_frames):
+            rendered = self._iter_rendered_frames(
+                (self._get_export_frame_time(frame_idx, fps) for frame_idx in range(total_frames)),
+                width,
+                height,
+                camera_override=camera_override,
+                render_scale_override=render_scale_override,
+                apply_centering=apply_centering,
+                background_color=background_color,
+                finish=save_frame,
+                discard=discard_frame,
+            )
+            for frame_idx, saved in rendered:
                 if progress.wasCanceled():
+                    discard_frame(frame_idx, saved)
                     self.log_widget.log("Frame export cancelled by user", "WARNING")
                     break
 
-                frame_time = self._get_export_frame_time(frame_idx, fps)
-                self.gl_widget.player.current_time = frame_time
-                image = self.render_frame_to_image(
-                    width,
-                    height,
-                    camera_override=camera_override,
-                    render_scale_override=render_scale_override,
-                    apply_centering=apply_centering,
-                    background_color=background_color,
-                )
-                if image:
-                    filename = os.path.join(
-                        export_root, f"{sanitized_name}_{frame_idx + 1:05d}.png"
-                    )
-                    image.save(filename, "PNG")
+                if saved:
                     exported += 1
                 else:
                     self.log_widget.log(f"Failed to render frame {frame_idx}", "WARNING")
 
-                progress.setValue(frame_idx + 1)
-                progress.setLabelText(f"Rendering frame {frame_idx + 1} of {total_frames}...")
-                QApplication.processEvents()
+                last_progress = self._refresh_export_progress(
+                    progress,
+                    frame_idx + 1,
+                    f"Rendering frame {frame_idx + 1} of {total_frames}...",
+                    last_progress,
+                    force=frame_idx + 1 >= total_frames,
+                )
+            rendered.close()
         finally:
             progress.close()
             self.gl_widget.player.current_time = original_time
@@ -7781,6 +9520,8 @@ class MSMAnimationViewer(QMainWindow):
             filename += '.psd'
         
         self._start_hang_watchdog("export_psd", timeout=15.0)
+        psd_layer_executor: Optional[ThreadPoolExecutor] = None
+        psd_encode_executor: Optional[ThreadPoolExecutor] = None
         try:
             
             animation = self.gl_widget.player.animation
@@ -7880,6 +9621,19 @@ class MSMAnimationViewer(QMainWindow):
                 for segment in segments:
                     _shift_points(segment.get('canvas'))
             
+            # Per-export, per-thread scratch for the NumPy polygon fallback's
+            # (n, 4) sample buffers; grown as needed and reused across
+            # triangles and layers.
+            polygon_scratch = threading.local()
+
+            def _polygon_scratch(name: str, count: int) -> np.ndarray:
+                buffer = getattr(polygon_scratch, name, None)
+                if buffer is None or buffer.shape[0] < count:
+                    capacity = count if buffer is None else max(count, buffer.shape[0] * 2)
+                    buffer = np.empty((capacity, 4), dtype=np.float32)
+                    setattr(polygon_scratch, name, buffer)
+                return buffer[:count]
+            
             def _render_polygon_sprite_layer(
                 local_vertices: List[Tuple[float, float]],
                 texcoords: List[Tuple[float, float]],
@@ -7932,8 +9686,16 @@ class MSMAnimationViewer(QMainWindow):
                 height = max(1, int(math.ceil(max_canvas_y - min_canvas_y)))
                 if width <= 0 or height <= 0:
                     return None
+                if width * height > _PSD_LAYER_MAX_PIXELS:
+                    raise ValueError(f"{width}x{height} layer exceeds the PSD export size limit")
                 
-                layer_buffer = np.zeros((height, width, 4), dtype=np.float32)
+                layer_buffer = np.zeros((height, width, 4), dtype=np.uint8)
+                tint_r, tint_g, tint_b = color_tint if color_tint else (1.0, 1.0, 1.0)
+                factors = np.array(
+                    (tint_r, tint_g, tint_b, opacity_value if opacity_value < 1.0 else 1.0),
+                    dtype=np.float32,
+                )
+                tinted = not np.all(factors == 1.0)
                 vertex_layer_coords = [
                     (pt['x'] - min_canvas_x, pt['y'] - min_canvas_y)
                     for pt in canvas_vertices
@@ -7943,96 +9705,139 @@ class MSMAnimationViewer(QMainWindow):
                 texcoords_count = len(texcoords_px)
                 vertex_count = len(vertex_layer_coords)
                 
-                for tri_start in range(0, len(triangles), 3):
-                    idx0 = triangles[tri_start]
-                    idx1 = triangles[tri_start + 1] if tri_start + 1 < len(triangles) else None
-                    idx2 = triangles[tri_start + 2] if tri_start + 2 < len(triangles) else None
-                    if (
-                        idx0 is None or idx1 is None or idx2 is None
-                        or idx0 >= vertex_count or idx1 >= vertex_count or idx2 >= vertex_count
-                        or idx0 >= texcoords_count or idx1 >= texcoords_count or idx2 >= texcoords_count
-                        or idx0 < 0 or idx1 < 0 or idx2 < 0
-                    ):
-                        continue
-                    
-                    (dx0, dy0) = vertex_layer_coords[idx0]
-                    (dx1, dy1) = vertex_layer_coords[idx1]
-                    (dx2, dy2) = vertex_layer_coords[idx2]
-                    (sx0, sy0) = texcoords_px[idx0]
-                    (sx1, sy1) = texcoords_px[idx1]
-                    (sx2, sy2) = texcoords_px[idx2]
-                    
-                    tri_min_x = max(0, int(math.floor(min(dx0, dx1, dx2))))
-                    tri_max_x = min(width, int(math.ceil(max(dx0, dx1, dx2))))
-                    tri_min_y = max(0, int(math.floor(min(dy0, dy1, dy2))))
-                    tri_max_y = min(height, int(math.ceil(max(dy0, dy1, dy2))))
-                    
-                    if tri_max_x <= tri_min_x or tri_max_y <= tri_min_y:
-                        continue
-                    
-                    xs = np.arange(tri_min_x, tri_max_x)
-                    ys = np.arange(tri_min_y, tri_max_y)
-                    if xs.size == 0 or ys.size == 0:
-                        continue
+                # Drop a trailing partial triangle and any out-of-range index up front.
+                index_limit = min(vertex_count, texcoords_count)
+                tri_array = np.asarray(triangles[:len(triangles) - len(triangles) % 3], dtype=np.int64).reshape(-1, 3)
+                tri_array = tri_array[((tri_array >= 0) & (tri_array < index_limit)).all(axis=1)]
+                vertex_array = np.asarray(vertex_layer_coords, dtype=np.float64)
+                
+                if factors[3] <= 0.0:
+                    # Fully transparent; leave the layer empty.
+                    pass
+                elif _rasterize_polygon_kernel is not None:
+                    texcoord_array = np.asarray(texcoords_px, dtype=np.float64)
+                    kernel_factors = factors.astype(np.float64)
+                    with _numba_parallel_lock:
+                        _rasterize_polygon_kernel(
+                            vertex_array,
+                            texcoord_array,
+                            tri_array,
+                            atlas_pixels,
+                            layer_buffer,
+                            kernel_factors,
+                        )
+                else:
+                    # (H*W, 4) view for single-axis texel gathers.
+                    atlas_flat = atlas_pixels.reshape(-1, 4)
+                    # Clipped integer bboxes for every triangle in one pass.
+                    tri_xy = vertex_array[tri_array]
+                    tri_mins = np.maximum(np.floor(tri_xy.min(axis=1)).astype(np.int64), 0)
+                    tri_maxs = np.minimum(np.ceil(tri_xy.max(axis=1)).astype(np.int64), (width, height))
+                    tri_valid = (tri_maxs > tri_mins).all(axis=1)
+                    for tri in np.flatnonzero(tri_valid):
+                        idx0, idx1, idx2 = tri_array[tri].tolist()
+                        tri_min_x, tri_min_y = tri_mins[tri].tolist()
+                        tri_max_x, tri_max_y = tri_maxs[tri].tolist()
                     
-                    grid_x_int, grid_y_int = np.meshgrid(xs, ys)
-                    grid_x = grid_x_int.astype(np.float32)
-                    grid_y = grid_y_int.astype(np.float32)
-                    sample_x = grid_x + 0.5
-                    sample_y = grid_y + 0.5
+                        (dx0, dy0) = vertex_layer_coords[idx0]
+                        (dx1, dy1) = vertex_layer_coords[idx1]
+                        (dx2, dy2) = vertex_layer_coords[idx2]
+                        (sx0, sy0) = texcoords_px[idx0]
+                        (sx1, sy1) = texcoords_px[idx1]
+                        (sx2, sy2) = texcoords_px[idx2]
                     
-                    denom = (dy1 - dy2) * (dx0 - dx2) + (dx2 - dx1) * (dy0 - dy2)
-                    if abs(denom) < epsilon:
-                        continue
+                        denom = (dy1 - dy2) * (dx0 - dx2) + (dx2 - dx1) * (dy0 - dy2)
+                        if abs(denom) < epsilon:
+                            continue
                     
-                    w0 = ((dy1 - dy2) * (sample_x - dx2) + (dx2 - dx1) * (sample_y - dy2)) / denom
-                    w1 = ((dy2 - dy0) * (sample_x - dx2) + (dx0 - dx2) * (sample_y - dy2)) / denom
-                    w2 = 1.0 - w0 - w1
-                    mask = (w0 >= -epsilon) & (w1 >= -epsilon) & (w2 >= -epsilon)
-                    if not np.any(mask):
-                        continue
+                        # Scanline spans: each edge function is linear in x, so
+                        # solve it per row for the covered x range (padded by a
+                        # pixel) instead of testing the whole bbox grid.
+                        rows = np.arange(tri_min_y, tri_max_y)
+                        row_centers = rows + 0.5
+                        span_lo = np.full(rows.shape, tri_min_x, dtype=np.int64)
+                        span_hi = np.full(rows.shape, tri_max_x, dtype=np.int64)
+                        slope0 = (dy1 - dy2) / denom
+                        slope1 = (dy2 - dy0) / denom
+                        offset0 = ((dx2 - dx1) * (row_centers - dy2)) / denom - slope0 * dx2
+                        offset1 = ((dx0 - dx2) * (row_centers - dy2)) / denom - slope1 * dx2
+                        for slope, offset in (
+                            (slope0, offset0),
+                            (slope1, offset1),
+                            (-slope0 - slope1, 1.0 - offset0 - offset1),
+                        ):
+                            if slope > 0.0:
+                                bound = np.ceil((-epsilon - offset) / slope - 0.5).astype(np.int64) - 1
+                                np.maximum(span_lo, bound, out=span_lo)
+                            elif slope < 0.0:
+                                bound = np.floor((-epsilon - offset) / slope - 0.5).astype(np.int64) + 2
+                                np.minimum(span_hi, bound, out=span_hi)
+                            else:
+                                span_hi[offset < -epsilon] = tri_min_x
+                        counts = np.maximum(span_hi - span_lo, 0)
+                        total = int(counts.sum())
+                        if total == 0:
+                            continue
+                        dest_y_vals = np.repeat(rows, counts)
+                        dest_x_vals = np.arange(total) + np.repeat(span_lo - (np.cumsum(counts) - counts), counts)
                     
-                    mask_idx = np.nonzero(mask)
-                    dest_x_vals = grid_x_int[mask_idx]
-                    dest_y_vals = grid_y_int[mask_idx]
-                    w0_vals = w0[mask_idx]
-                    w1_vals = w1[mask_idx]
-                    w2_vals = w2[mask_idx]
+                        sample_x = dest_x_vals.astype(np.float32) + 0.5
+                        sample_y = dest_y_vals.astype(np.float32) + 0.5
+                        w0 = ((dy1 - dy2) * (sample_x - dx2) + (dx2 - dx1) * (sample_y - dy2)) / denom
+                        w1 = ((dy2 - dy0) * (sample_x - dx2) + (dx0 - dx2) * (sample_y - dy2)) / denom
+                        inside = (w0 >= -epsilon) & (w1 >= -epsilon) & (1.0 - w0 - w1 >= -epsilon)
+                        # The padded span edges still get the exact inside test.
+                        if not inside.all():
+                            dest_x_vals = dest_x_vals[inside]
+                            dest_y_vals = dest_y_vals[inside]
+                            w0 = w0[inside]
+                            w1 = w1[inside]
+                            if w0.size == 0:
+                                continue
+                        w0_vals = w0
+                        w1_vals = w1
+                        w2_vals = 1.0 - w0_vals - w1_vals
                     
-                    src_x_vals = w0_vals * sx0 + w1_vals * sx1 + w2_vals * sx2
-                    src_y_vals = w0_vals * sy0 + w1_vals * sy1 + w2_vals * sy2
+                        src_x_vals = w0_vals * sx0 + w1_vals * sx1 + w2_vals * sx2
+                        src_y_vals = w0_vals * sy0 + w1_vals * sy1 + w2_vals * sy2
                     
-                    src_x_vals = np.clip(src_x_vals, 0.0, atlas_width - 1.0)
-                    src_y_vals = np.clip(src_y_vals, 0.0, atlas_height - 1.0)
+                        src_x_vals = np.clip(src_x_vals, 0.0, atlas_width - 1.0)
+                        src_y_vals = np.clip(src_y_vals, 0.0, atlas_height - 1.0)
                     
-                    x0_idx = np.floor(src_x_vals).astype(np.int32)
-                    y0_idx = np.floor(src_y_vals).astype(np.int32)
-                    x1_idx = np.clip(x0_idx + 1, 0, atlas_width - 1)
-                    y1_idx = np.clip(y0_idx + 1, 0, atlas_height - 1)
+                        x0_idx = np.floor(src_x_vals).astype(np.intp)
+                        y0_idx = np.floor(src_y_vals).astype(np.intp)
                     
-                    wx = (src_x_vals - x0_idx).astype(np.float32)
-                    wy = (src_y_vals - y0_idx).astype(np.float32)
+                        wx = (src_x_vals - x0_idx).astype(np.float32)[:, None]
+                        wy = (src_y_vals - y0_idx).astype(np.float32)[:, None]
+                        inv_wx = 1.0 - wx
                     
-                    top = atlas_pixels[y0_idx, x0_idx] * (1.0 - wx)[:, None] + atlas_pixels[y0_idx, x1_idx] * wx[:, None]
-                    bottom = atlas_pixels[y1_idx, x0_idx] * (1.0 - wx)[:, None] + atlas_pixels[y1_idx, x1_idx] * wx[:, None]
-                    samples = top * (1.0 - wy)[:, None] + bottom * wy[:, None]
+                        # Linear texel indices; the right/lower taps are one
+                        # texel/row further except on the clamped last column/row.
+                        lin00 = y0_idx * atlas_width + x0_idx
+                        lin01 = lin00 + (x0_idx < atlas_width - 1)
+                        lin10 = lin00 + np.where(y0_idx < atlas_height - 1, atlas_width, 0)
+                        lin11 = lin10 + (lin01 - lin00)
                     
-                    layer_buffer[dest_y_vals, dest_x_vals] = samples
+                        count = wx.shape[0]
+                        samples = _polygon_scratch('top', count)
+                        bottom = _polygon_scratch('bottom', count)
+                        blend = _polygon_scratch('blend', count)
+                        np.multiply(atlas_flat[lin00], inv_wx, out=samples)
+                        samples += np.multiply(atlas_flat[lin01], wx, out=blend)
+                        np.multiply(atlas_flat[lin10], inv_wx, out=bottom)
+                        bottom += np.multiply(atlas_flat[lin11], wx, out=blend)
+                        samples *= 1.0 - wy
+                        samples += np.multiply(bottom, wy, out=blend)
+                        if tinted:
+                            # One broadcast multiply covers tint and opacity.
+                            samples *= factors
+                            np.clip(samples, 0.0, 255.0, out=samples)
+                        # Taps stay uint8; round once per written pixel. The
+                        # uint8 store truncates exactly like astype().
+                        samples += 0.5
+                        layer_buffer[dest_y_vals, dest_x_vals] = samples
                 
-                if color_tint:
-                    tint_r, tint_g, tint_b = color_tint
-                    if tint_r != 1.0:
-                        layer_buffer[:, :, 0] *= tint_r
-                    if tint_g != 1.0:
-                        layer_buffer[:, :, 1] *= tint_g
-                    if tint_b != 1.0:
-                        layer_buffer[:, :, 2] *= tint_b
-                if opacity_value < 1.0:
-                    layer_buffer[:, :, 3] *= opacity_value
-                
-                layer_bytes = np.clip(layer_buffer, 0.0, 1.0)
-                layer_bytes = (layer_bytes * 255.0 + 0.5).astype(np.uint8)
-                layer_image = Image.fromarray(layer_bytes, 'RGBA')
+                layer_image = Image.fromarray(layer_buffer, 'RGBA')
                 return {
                     'image': layer_image,
                     'origin_x': min_canvas_x,
@@ -8041,6 +9846,20 @@ class MSMAnimationViewer(QMainWindow):
                     'world_vertices': world_vertices
                 }
 
+            def _layer_world_matrix(
+                layer: LayerData, world_state: Dict[str, Any]
+            ) -> Tuple[float, float, float, float, float, float]:
+                """Return the layer's world affine with the user offset applied."""
+                user_offset_x, user_offset_y = layer_offsets.get(layer.layer_id, (0, 0))
+                return (
+                    world_state['m00'],
+                    world_state['m01'],
+                    world_state['m10'],
+                    world_state['m11'],
+                    world_state['tx'] + user_offset_x,
+                    world_state['ty'] + user_offset_y,
+                )
+
             # Build layer map and calculate world states
             layer_map = {layer.layer_id: layer for layer in animation.layers}
             layer_world_states = {}
@@ -8054,13 +9873,59 @@ class MSMAnimationViewer(QMainWindow):
                     layer.layer_id, state
                 )
             
-            # Cache loaded atlas images and pixel arrays
-            atlas_images = {}
-            atlas_pixel_arrays = {}
-            
             # Collect layer data for PSD
             psd_layer_data = []
             
+            # Frame-invariant lookups and scales for the layer loop
+            renderer = self.gl_widget.renderer
+            layer_offsets = self.gl_widget.layer_offsets
+            find_sprite = self._find_sprite_in_atlases
+            position_scale = self.gl_widget.position_scale
+            trim_position_scale = renderer.trim_shift_multiplier * position_scale
+            image_scale = scale_factor * (native_scale_factor if preserve_full_res else 1.0)
+            if image_scale <= 0:
+                image_scale = 1.0
+
+            # Polygon layers rasterize independently once world states are
+            # known, so queue them all on a pool up front; the loop below
+            # collects them in order and does everything else on this thread.
+            # Layers whose inputs fail here are retried (and logged) there.
+            psd_layer_executor = ThreadPoolExecutor(
+                max_workers=max(1, min(_EXPORT_POSTPROCESS_WORKERS, os.cpu_count() or 1)),
+                thread_name_prefix="PsdLayer",
+            )
+            polygon_jobs: Dict[int, Tuple[Any, Future]] = {}
+            for layer in animation.layers:
+                if not include_hidden and not layer.visible:
+                    continue
+                world_state = layer_world_states[layer.layer_id]
+                sprite_name = world_state['sprite_name']
+                if not sprite_name:
+                    continue
+                if not include_hidden and world_state['world_opacity'] <= 1e-4:
+                    continue
+                sprite, atlas = find_sprite(sprite_name)
+                if not sprite or not atlas or not sprite.has_polygon_mesh:
+                    continue
+                try:
+                    geometry = renderer._build_polygon_geometry(sprite, atlas)
+                    atlas_pixels = self._export_atlas_array(atlas.image_path) if geometry else None
+                except Exception:
+                    continue
+                if not geometry:
+                    continue
+                polygon_jobs[layer.layer_id] = (
+                    geometry,
+                    psd_layer_executor.submit(
+                        _render_polygon_sprite_layer,
+                        *geometry,
+                        _layer_world_matrix(layer, world_state),
+                        atlas_pixels,
+                        (world_state['r'] / 255.0, world_state['g'] / 255.0, world_state['b'] / 255.0),
+                        world_state['world_opacity'],
+                    ),
+                )
+
             # Process layers in reverse order (back to front, like rendering)
             for layer in reversed(animation.layers):
                 if not include_hidden and not layer.visible:
@@ -8071,62 +9936,31 @@ class MSMAnimationViewer(QMainWindow):
                 
                 if not sprite_name:
                     continue
+                # A fully transparent layer is as invisible as a hidden one.
+                if not include_hidden and world_state['world_opacity'] <= 1e-4:
+                    continue
                 
-                # Find sprite in atlases
-                sprite = None
-                atlas = None
-                for atl in self.gl_widget.texture_atlases:
-                    sprite = atl.get_sprite(sprite_name)
-                    if sprite:
-                        atlas = atl
-                        break
-                
+                sprite, atlas = find_sprite(sprite_name)
                 if not sprite or not atlas:
                     continue
                 
-                # Load atlas image if not cached
-                if atlas.image_path not in atlas_images:
-                    try:
-                        atlas_img = Image.open(atlas.image_path)
-                        atlas_img = atlas_img.convert('RGBA')
-                        atlas_images[atlas.image_path] = atlas_img
-                        atlas_pixel_arrays[atlas.image_path] = np.asarray(atlas_img, dtype=np.float32) / 255.0
-                    except Exception as e:
-                        self.log_widget.log(f"Failed to load atlas: {e}", "WARNING")
-                        continue
-                elif atlas.image_path not in atlas_pixel_arrays:
-                    atlas_pixel_arrays[atlas.image_path] = np.asarray(atlas_images[atlas.image_path], dtype=np.float32) / 255.0
-                
-                atlas_img = atlas_images[atlas.image_path]
-                atlas_pixels = atlas_pixel_arrays.get(atlas.image_path)
+                # Atlas images persist across exports; pixel arrays are only
+                # built for atlases that feed the polygon rasterizer.
+                try:
+                    atlas_img = self._export_atlas_entry(atlas.image_path)[1]
+                except Exception as e:
+                    self.log_widget.log(f"Failed to load atlas: {e}", "WARNING")
+                    continue
                 
-                # Extract sprite from atlas for quad-based fallback rendering
-                sprite_img = atlas_img.crop((
-                    sprite.x, sprite.y,
-                    sprite.x + sprite.w, sprite.y + sprite.h
-                ))
-                if sprite.rotated:
-                    sprite_img = sprite_img.rotate(90, expand=True)
-                orig_sprite_w, orig_sprite_h = sprite_img.size
                 hires_scale = 0.5 if atlas.is_hires else 1.0
                 
-                # Transformation matrix and color information
-                m00 = world_state['m00']
-                m01 = world_state['m01']
-                m10 = world_state['m10']
-                m11 = world_state['m11']
-                tx = world_state['tx']
-                ty = world_state['ty']
+                # Transformation matrix (with user offsets) and color information
+                m00, m01, m10, m11, tx, ty = _layer_world_matrix(layer, world_state)
                 opacity = world_state['world_opacity']
                 r = world_state['r'] / 255.0
                 g = world_state['g'] / 255.0
                 b = world_state['b'] / 255.0
                 
-                # Apply user offsets
-                user_offset_x, user_offset_y = self.gl_widget.layer_offsets.get(layer.layer_id, (0, 0))
-                tx += user_offset_x
-                ty += user_offset_y
-                
                 # Attempt polygon-aware rasterization if geometry is available
                 polygon_local_vertices: List[Tuple[float, float]] = []
                 polygon_texcoords: List[Tuple[float, float]] = []
@@ -8135,34 +9969,40 @@ class MSMAnimationViewer(QMainWindow):
                 polygon_canvas_vertices: List[Dict[str, float]] = []
                 polygon_render_result: Optional[Dict[str, Any]] = None
                 
+                polygon_job = polygon_jobs.pop(layer.layer_id, None)
                 if sprite.has_polygon_mesh:
-                    try:
-                        geometry = self.gl_widget.renderer._build_polygon_geometry(sprite, atlas)
-                    except Exception as geom_exc:  # pragma: no cover - defensive
-                        self.log_widget.log(
-                            f"Failed to build polygon geometry for {layer.name}: {geom_exc}",
-                            "WARNING"
-                        )
-                        geometry = None
+                    if polygon_job is not None:
+                        geometry = polygon_job[0]
+                    else:
+                        try:
+                            geometry = renderer._build_polygon_geometry(sprite, atlas)
+                        except Exception as geom_exc:  # pragma: no cover - defensive
+                            self.log_widget.log(
+                                f"Failed to build polygon geometry for {layer.name}: {geom_exc}",
+                                "WARNING"
+                            )
+                            geometry = None
                     if geometry:
                         polygon_local_vertices, polygon_texcoords, polygon_triangles = geometry
-                        if atlas_pixels is not None:
-                            try:
+                        try:
+                            if polygon_job is not None:
+                                polygon_render_result = polygon_job[1].result()
+                            else:
                                 polygon_render_result = _render_polygon_sprite_layer(
                                     polygon_local_vertices,
                                     polygon_texcoords,
                                     polygon_triangles,
                                     (m00, m01, m10, m11, tx, ty),
-                                    atlas_pixels,
+                                    self._export_atlas_array(atlas.image_path),
                                     (r, g, b),
                                     opacity
                                 )
-                            except Exception as raster_exc:  # pragma: no cover - defensive
-                                self.log_widget.log(
-                                    f"Polygon rasterization failed for {layer.name}: {raster_exc}",
-                                    "WARNING"
-                                )
-                                polygon_render_result = None
+                        except Exception as raster_exc:  # pragma: no cover - defensive
+                            self.log_widget.log(
+                                f"Polygon rasterization failed for {layer.name}: {raster_exc}",
+                                "WARNING"
+                            )
+                            polygon_render_result = None
                         if polygon_render_result:
                             polygon_world_vertices = polygon_render_result['world_vertices']
                             polygon_canvas_vertices = polygon_render_result['canvas_vertices']
@@ -8177,12 +10017,18 @@ class MSMAnimationViewer(QMainWindow):
                     final_x = polygon_render_result['origin_x']
                     final_y = polygon_render_result['origin_y']
                 else:
-                    # Fall back to quad-based affine transform rendering
-                    trim_multiplier = self.gl_widget.renderer.trim_shift_multiplier
-                    sprite_offset_x = sprite.offset_x * hires_scale * trim_multiplier * self.gl_widget.position_scale
-                    sprite_offset_y = sprite.offset_y * hires_scale * trim_multiplier * self.gl_widget.position_scale
-                    scaled_w = orig_sprite_w * hires_scale * self.gl_widget.position_scale
-                    scaled_h = orig_sprite_h * hires_scale * self.gl_widget.position_scale
+                    # Fall back to quad-based affine transform rendering of the
+                    # sprite's (cached) upright crop
+                    try:
+                        sprite_img = self._export_sprite_image(atlas, sprite)
+                    except Exception as e:
+                        self.log_widget.log(f"Failed to load atlas: {e}", "WARNING")
+                        continue
+                    orig_sprite_w, orig_sprite_h = sprite_img.size
+                    sprite_offset_x = sprite.offset_x * hires_scale * trim_position_scale
+                    sprite_offset_y = sprite.offset_y * hires_scale * trim_position_scale
+                    scaled_w = orig_sprite_w * hires_scale * position_scale
+                    scaled_h = orig_sprite_h * hires_scale * position_scale
                     corners_local = [
                         (sprite_offset_x, sprite_offset_y),
                         (sprite_offset_x + scaled_w, sprite_offset_y),
@@ -8225,36 +10071,44 @@ class MSMAnimationViewer(QMainWindow):
                     final_d = inv_m10 * scale_to_img_y
                     final_e = inv_m11 * scale_to_img_y
                     final_f = inv_ty * scale_to_img_y
-                    image_scale = scale_factor
-                    if preserve_full_res:
-                        image_scale *= native_scale_factor
-                    if image_scale <= 0:
-                        image_scale = 1.0
                     target_w = max(1, int(math.ceil(bbox_w * image_scale)))
                     target_h = max(1, int(math.ceil(bbox_h * image_scale)))
-                    transformed_img = sprite_img.transform(
-                        (target_w, target_h),
-                        Image.Transform.AFFINE,
-                        (
-                            final_a / image_scale,
-                            final_b / image_scale,
-                            final_c,
-                            final_d / image_scale,
-                            final_e / image_scale,
-                            final_f
-                        ),
-                        resample=transform_filter
-                    )
-                    if r != 1.0 or g != 1.0 or b != 1.0:
-                        img_r, img_g, img_b, img_a = transformed_img.split()
-                        img_r = img_r.point(lambda x: int(x * r))
-                        img_g = img_g.point(lambda x: int(x * g))
-                        img_b = img_b.point(lambda x: int(x * b))
-                        transformed_img = Image.merge('RGBA', (img_r, img_g, img_b, img_a))
-                    if opacity < 1.0:
-                        img_r, img_g, img_b, img_a = transformed_img.split()
-                        img_a = img_a.point(lambda x: int(x * opacity))
-                        transformed_img = Image.merge('RGBA', (img_r, img_g, img_b, img_a))
+                    if target_w * target_h > _PSD_LAYER_MAX_PIXELS:
+                        self.log_widget.log(
+                            f"Skipping {layer.name}: {target_w}x{target_h} layer exceeds the PSD export size limit",
+                            "WARNING"
+                        )
+                        continue
+                    if opacity <= 0.0:
+                        # Zero opacity clears every alpha; skip the resample.
+                        transformed_img = Image.new('RGBA', (target_w, target_h))
+                    else:
+                        transformed_img = sprite_img.transform(
+                            (target_w, target_h),
+                            Image.Transform.AFFINE,
+                            (
+                                final_a / image_scale,
+                                final_b / image_scale,
+                                final_c,
+                                final_d / image_scale,
+                                final_e / image_scale,
+                                final_f
+                            ),
+                            resample=transform_filter
+                        )
+                        if r != 1.0 or g != 1.0 or b != 1.0 or opacity < 1.0:
+                            # Tint and opacity in one (4, 256) table pass; entries
+                            # truncate like the old per-channel int(x * factor).
+                            channel_factors = np.array(
+                                (r, g, b, opacity if opacity < 1.0 else 1.0), dtype=np.float64
+                            )
+                            tint_lut = np.clip(
+                                (np.arange(256, dtype=np.float64) * channel_factors[:, None]).astype(np.int64),
+                                0,
+                                255,
+                            ).astype(np.uint8)
+                            pixels = np.asarray(transformed_img)
+                            transformed_img = Image.fromarray(tint_lut[np.arange(4), pixels], 'RGBA')
                     final_x = world_min_x
                     final_y = world_min_y
                     if match_viewport and animation.centered:
@@ -8310,7 +10164,6 @@ class MSMAnimationViewer(QMainWindow):
                             {'u': uv_x * atlas_w, 'v': uv_y * atlas_h}
                             for uv_x, uv_y in sprite.vertices_uv
                         ]
-                    renderer = self.gl_widget.renderer
                     local_vertices_for_meta: List[Tuple[float, float]] = polygon_local_vertices.copy()
                     if not local_vertices_for_meta and renderer and hasattr(renderer, 'compute_local_vertices'):
                         try:
@@ -8492,6 +10345,15 @@ class MSMAnimationViewer(QMainWindow):
             # Create PSD file using pytoshop
             psd = PsdFile(**psd_kwargs)
             
+            # RLE channels are encoded on worker threads while later layers
+            # are cropped, when the compiled encoder is available.
+            if compression_value == 1 and packbits_encode_kernel is not None:
+                psd_encode_executor = ThreadPoolExecutor(
+                    max_workers=max(1, min(_EXPORT_POSTPROCESS_WORKERS, os.cpu_count() or 1)),
+                    thread_name_prefix="PsdEncode",
+                )
+            pending_records = []
+            
             # Add each layer
             for layer_info in psd_layer_data:
                 img = layer_info['image']
@@ -8542,11 +10404,12 @@ class MSMAnimationViewer(QMainWindow):
                 else:
                     continue
                 
-                # Create channel image data objects
-                alpha_data = psd_layers.ChannelImageData(image=alpha_channel, compression=compression_value)
-                red_data = psd_layers.ChannelImageData(image=red_channel, compression=compression_value)
-                green_data = psd_layers.ChannelImageData(image=green_channel, compression=compression_value)
-                blue_data = psd_layers.ChannelImageData(image=blue_channel, compression=compression_value)
+                channel_images = (alpha_channel, red_channel, green_channel, blue_channel)
+                encoded_channels = None
+                if psd_encode_executor is not None:
+                    encoded_channels = psd_encode_executor.submit(
+                        encode_psd_rle_channels, channel_images, psd.version
+                    )
                 
                 # Create layer record with channels and metadata blocks
                 blend_kwargs = {}
@@ -8568,23 +10431,46 @@ class MSMAnimationViewer(QMainWindow):
                             f"Failed to encode PSD metadata for {layer_info['name']}: {exc}",
                             "WARNING"
                         )
+                pending_records.append((
+                    channel_images,
+                    encoded_channels,
+                    dict(
+                        top=top,
+                        left=left,
+                        bottom=bottom,
+                        right=right,
+                        name=name[:31],
+                        opacity=layer_opacity,
+                        blocks=blocks or None,
+                        **blend_kwargs
+                    ),
+                ))
+            
+            # Records go in layer order; pre-encoded channels are wrapped so
+            # pytoshop copies their bytes instead of compressing again.
+            for channel_images, encoded_channels, record_kwargs in pending_records:
+                if encoded_channels is not None:
+                    channel_data = [
+                        psd_layers.ChannelImageData(
+                            fd=io.BytesIO(data),
+                            offset=0,
+                            size=len(data),
+                            shape=image.shape,
+                            depth=psd.depth,
+                            version=psd.version,
+                            compression=compression_value,
+                        )
+                        for image, data in zip(channel_images, encoded_channels.result())
+                    ]
+                else:
+                    channel_data = [
+                        psd_layers.ChannelImageData(image=image, compression=compression_value)
+                        for image in channel_images
+                    ]
                 layer_record = psd_layers.LayerRecord(
-                    top=top,
-                    left=left,
-                    bottom=bottom,
-                    right=right,
-                    name=name[:31],
-                    opacity=layer_opacity,
-                    channels={
-                        -1: alpha_data,
-                        0: red_data,
-                        1: green_data,
-                        2: blue_data,
-                    },
-                    blocks=blocks or None,
-                    **blend_kwargs
+                    channels=dict(zip((-1, 0, 1, 2), channel_data)),
+                    **record_kwargs
                 )
-                
                 psd.layer_and_mask_info.layer_info.layer_records.append(layer_record)
             
             # Write PSD file
@@ -8608,6 +10494,10 @@ class MSMAnimationViewer(QMainWindow):
             traceback.print_exc()
             QMessageBox.warning(self, "Export Error", f"Failed to export PSD: {e}")
         finally:
+            if psd_layer_executor is not None:
+                psd_layer_executor.shutdown(wait=True, cancel_futures=True)
+            if psd_encode_executor is not None:
+                psd_encode_executor.shutdown(wait=True, cancel_futures=True)
             self._stop_hang_watchdog()
     
     def get_psd_resample_filters(self, quality: str):
@@ -8780,39 +10670,47 @@ class MSMAnimationViewer(QMainWindow):
         progress.setAutoReset(False)
         progress.show()
 
+        def save_frame(frame_num: int, image: Image.Image) -> str:
+            # Runs on an export worker thread.
+            frame_path = os.path.join(temp_dir, f"frame_{frame_num:06d}.png")
+            # Scratch frames are read once by ffmpeg; favor encode speed.
+            image.save(frame_path, 'PNG', compress_level=1)
+            return frame_path
+
         frame_files: List[str] = []
         was_canceled = False
+        last_progress = 0.0
         try:
             background_color = self._active_background_color()
-            for frame_num in range(total_frames):
+            rendered = self._iter_rendered_frames(
+                (self._get_export_frame_time(frame_num, fps) for frame_num in range(total_frames)),
+                width,
+                height,
+                camera_override=camera_override,
+                render_scale_override=render_scale_override,
+                apply_centering=apply_centering,
+                background_color=background_color,
+                finish=save_frame,
+            )
+            for frame_num, frame_path in rendered:
                 if progress.wasCanceled():
                     was_canceled = True
                     self.log_widget.log(f"{export_label} export cancelled by user", "WARNING")
                     break
 
-                frame_time = self._get_export_frame_time(frame_num, fps)
-                self.gl_widget.player.current_time = frame_time
-
-                image = self.render_frame_to_image(
-                    width,
-                    height,
-                    camera_override=camera_override,
-                    render_scale_override=render_scale_override,
-                    apply_centering=apply_centering,
-                    background_color=background_color,
-                )
-                if image:
-                    frame_path = os.path.join(temp_dir, f"frame_{frame_num:06d}.png")
-                    image.save(frame_path, 'PNG')
+                if frame_path:
                     frame_files.append(frame_path)
                 else:
                     self.log_widget.log(f"Failed to render frame {frame_num}", "WARNING")
 
-                progress.setValue(frame_num + 1)
-                progress.setLabelText(f"Rendering frame {frame_num + 1} of {total_frames}...")
-
-                from PyQt6.QtWidgets import QApplication
-                QApplication.processEvents()
+                last_progress = self._refresh_export_progress(
+                    progress,
+                    frame_num + 1,
+                    f"Rendering frame {frame_num + 1} of {total_frames}...",
+                    last_progress,
+                    force=frame_num + 1 >= total_frames,
+                )
+            rendered.close()
         finally:
             progress.close()
 
@@ -9405,25 +11303,22 @@ class MSMAnimationViewer(QMainWindow):
             # Render frames
             frames = []
             was_canceled = False
+            last_progress = 0.0
             background_color = self._active_background_color()
             
-            for frame_num in range(total_frames):
+            # Render frames at base size; readback is pipelined one frame behind
+            rendered = self._iter_rendered_frames(
+                (self._get_export_frame_time(frame_num, gif_fps) for frame_num in range(total_frames)),
+                base_width,
+                base_height,
+                background_color=background_color,
+            )
+            for frame_num, image in rendered:
                 if progress.wasCanceled():
                     self.log_widget.log("Export cancelled by user", "WARNING")
                     was_canceled = True
                     break
                 
-                # Set animation time
-                frame_time = self._get_export_frame_time(frame_num, gif_fps)
-                self.gl_widget.player.current_time = frame_time
-                
-                # Render frame at base size
-                image = self.render_frame_to_image(
-                    base_width,
-                    base_height,
-                    background_color=background_color,
-                )
-                
                 if image:
                     # Scale if needed
                     if gif_scale != 1.0:
@@ -9490,12 +11385,14 @@ class MSMAnimationViewer(QMainWindow):
                 else:
                     self.log_widget.log(f"Failed to render frame {frame_num}", "WARNING")
                 
-                progress.setValue(frame_num + 1)
-                progress.setLabelText(f"Rendering frame {frame_num + 1} of {total_frames}...")
-                
-                # Process events
-                from PyQt6.QtWidgets import QApplication
-                QApplication.processEvents()
+                last_progress = self._refresh_export_progress(
+                    progress,
+                    frame_num + 1,
+                    f"Rendering frame {frame_num + 1} of {total_frames}...",
+                    last_progress,
+                    force=frame_num + 1 >= total_frames,
+                )
+            rendered.close()
             
             if was_canceled or len(frames) == 0:
                 self.log_widget.log(f"Export aborted. Frames rendered: {len(frames)}", "WARNING")
@@ -9707,10 +11604,7 @@ All game assets and content are owned by Big Blue Bubble Inc.
         if not animation or not self.selected_layer_ids:
             return
 
-        def _clamp(value: int) -> int:
-            return max(0, min(255, int(value)))
-
-        rgba = tuple(_clamp(v) for v in (r, g, b, a))
+        rgba = (_clamp_byte(r), _clamp_byte(g), _clamp_byte(b), _clamp_byte(a))
         tint = tuple(channel / 255.0 for channel in rgba)
         reset = rgba == (255, 255, 255, 255)
         updated = 0
@@ -9956,6 +11850,7 @@ All game assets and content are owned by Big Blue Bubble Inc.
         if hasattr(self, 'offset_update_timer'):
             self.offset_update_timer.stop()
 
+        self.cleanup_export_resources()
         event.accept()
 
     def _compute_png_export_params(self):
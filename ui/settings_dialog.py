@@ -31,7 +31,7 @@ class ExportSettings:
     def load(self):
         """Load settings from storage"""
         # PNG settings
-        self.png_compression = self.settings.value('png/compression', 6, type=int)
+        self.png_compression = self.settings.value('png/compression', 1, type=int)
         self.png_full_resolution = self.settings.value('png/full_resolution', False, type=bool)
         self.png_full_scale_multiplier = self.settings.value('png/full_scale_multiplier', 1.0, type=float)
         
@@ -1534,7 +1534,7 @@ class SettingsDialog(QDialog):
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
         # PNG
-        self.png_compression_spin.setValue(6)
+        self.png_compression_spin.setValue(1)
         self.png_full_res_check.setChecked(False)
         self.png_full_res_multiplier_spin.setValue(1.0)
         self._update_png_full_res_controls()
@@ -12,9 +12,9 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QLabel,
 )
-from PyQt6.QtCore import Qt, QItemSelectionModel, QSize
+from PyQt6.QtCore import Qt, QItemSelectionModel, QSize, QTimer
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 class SpritePickerDialog(QDialog):
@@ -26,18 +26,37 @@ class SpritePickerDialog(QDialog):
         *,
         current_sprite: Optional[str] = None,
         description: Optional[str] = None,
+        thumbnail_provider: Optional[Callable[[str], Optional[QPixmap]]] = None,
         parent=None,
     ):
+        """
+        Args:
+            sprite_entries: (name, pixmap) pairs; pixmap may be None
+            thumbnail_provider: Optional callback used to fetch pixmaps for
+                entries without one, only once their rows scroll into view
+        """
         super().__init__(parent)
         self.setWindowTitle("Select Sprite")
         self.resize(420, 480)
         self._thumbnail_size = QSize(44, 44)
         self._item_size_hint = QSize(0, max(32, self._thumbnail_size.height() + 12))
         self._placeholder_icon = self._build_placeholder_icon()
+        self._thumbnail_provider = thumbnail_provider
         self._all_entries = []
+        self._entries_by_name: Dict[str, Dict] = {}
         for name, pixmap in sprite_entries:
-            icon = self._build_icon(pixmap)
-            self._all_entries.append({"name": name, "icon": icon})
+            lazy = pixmap is None and thumbnail_provider is not None
+            entry = {
+                "name": name,
+                "icon": None if lazy else self._build_icon(pixmap),
+                "pending": lazy,
+            }
+            self._all_entries.append(entry)
+            self._entries_by_name[name] = entry
+        self._icon_timer = QTimer(self)
+        self._icon_timer.setSingleShot(True)
+        self._icon_timer.setInterval(0)
+        self._icon_timer.timeout.connect(self._load_visible_icons)
         self._current_selection = current_sprite or ""
 
         layout = QVBoxLayout(self)
@@ -57,6 +76,7 @@ class SpritePickerDialog(QDialog):
         self.list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.list_widget.setIconSize(self._thumbnail_size)
         self.list_widget.itemDoubleClicked.connect(self._accept_on_double_click)
+        self.list_widget.verticalScrollBar().valueChanged.connect(self._schedule_icon_load)
         layout.addWidget(self.list_widget, 1)
 
         button_row = QHBoxLayout()
@@ -93,6 +113,42 @@ class SpritePickerDialog(QDialog):
             self._select_text(target)
         elif self.list_widget.count() > 0:
             self.list_widget.setCurrentRow(0)
+        self._schedule_icon_load()
+
+    def _schedule_icon_load(self, *_args):
+        """Coalesce thumbnail loading for the rows currently in view."""
+        if self._thumbnail_provider is not None and hasattr(self, "list_widget"):
+            self._icon_timer.start()
+
+    def _load_visible_icons(self):
+        """Fetch thumbnails for visible rows whose previews have not been loaded yet."""
+        count = self.list_widget.count()
+        if count == 0:
+            return
+        viewport = self.list_widget.viewport().rect()
+        first = self.list_widget.indexAt(viewport.topLeft()).row()
+        last = self.list_widget.indexAt(viewport.bottomLeft()).row()
+        first = max(first, 0)
+        last = count - 1 if last < 0 else last
+        for row in range(first, last + 1):
+            item = self.list_widget.item(row)
+            if item is None:
+                continue
+            entry = self._entries_by_name.get(item.text())
+            if not entry or not entry["pending"]:
+                continue
+            entry["pending"] = False
+            entry["icon"] = self._build_icon(self._thumbnail_provider(entry["name"]))
+            if isinstance(entry["icon"], QIcon):
+                item.setIcon(entry["icon"])
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_icon_load()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_icon_load()
 
     def _select_text(self, text: str):
         """Select the entry matching text if it exists."""
@@ -3,7 +3,7 @@ Timeline Widget
 Provides playback controls and timeline scrubbing with keyframe markers.
 """
 
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -18,6 +18,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRectF
 from PyQt6.QtGui import QPainter, QColor, QPen, QPainterPath
 
+from utils.timeline_markers import apply_marker_delta
+
 
 class KeyframeMarkerBar(QWidget):
     """Custom bar that renders keyframe markers above the timeline slider."""
@@ -50,6 +52,26 @@ class KeyframeMarkerBar(QWidget):
 
     def set_markers(self, markers: List[float], duration: float):
         self._markers = sorted(markers or [])
+        self._apply_marker_duration(duration)
+
+    def apply_marker_delta(
+        self,
+        added: Iterable[float],
+        removed: Iterable[float],
+        duration: float,
+        tolerance: float,
+    ) -> List[float]:
+        """
+        Patch the sorted marker list in place instead of replacing it.
+
+        Markers within ``tolerance`` of a removed time are dropped before the
+        added times are inserted. Returns the updated list (read-only).
+        """
+        markers = apply_marker_delta(self._markers, added, removed, tolerance)
+        self._apply_marker_duration(duration)
+        return markers
+
+    def _apply_marker_duration(self, duration: float):
         self._duration = max(0.0, float(duration))
         if self._view_duration <= 0.0 or self._view_duration > self._duration:
             self._view_start = 0.0
@@ -454,6 +476,18 @@ class TimelineWidget(QWidget):
         self.keyframe_bar.set_markers(markers, duration)
         self.keyframe_bar.set_view_window(self._view_start_ms / 1000.0, self._view_duration_ms / 1000.0)
 
+    def apply_marker_delta(
+        self,
+        added: Iterable[float],
+        removed: Iterable[float],
+        duration: float,
+        tolerance: float,
+    ) -> List[float]:
+        """Add/remove individual keyframe markers; returns the updated marker list."""
+        markers = self.keyframe_bar.apply_marker_delta(added, removed, duration, tolerance)
+        self.keyframe_bar.set_view_window(self._view_start_ms / 1000.0, self._view_duration_ms / 1000.0)
+        return markers
+
     def set_marker_selection(self, markers: List[float]):
         self.keyframe_bar.set_selected_markers(markers)
 
@@ -0,0 +1,113 @@
+"""
+Atlas XML
+Streamed rewrite of a TextureAtlas manifest's root tag attributes
+"""
+
+import os
+import shutil
+from typing import Dict, List, Optional, Tuple
+from xml.parsers import expat
+from xml.sax.saxutils import quoteattr
+
+# The root tag must start within this many bytes of the file.
+ATLAS_XML_HEAD_BYTES = 64 * 1024
+
+_UTF8_NAMES = {"utf-8", "utf8"}
+
+
+class _RootFound(Exception):
+    """Raised from the expat handler to stop parsing at the root start tag."""
+
+
+def _find_root_start(head: bytes) -> Optional[Tuple[str, int, List[str], Optional[str]]]:
+    """
+    Parse ``head`` up to the first start tag.
+
+    Returns ``(tag name, byte offset, ordered attribute name/value list,
+    declared encoding)``, or None when the prolog is malformed or no element
+    starts within ``head``. Comments, processing instructions and the
+    doctype before the root are skipped by the parser itself.
+    """
+    parser = expat.ParserCreate()
+    parser.ordered_attributes = True
+    found: List[Tuple[str, int, List[str]]] = []
+    declared: List[Optional[str]] = [None]
+
+    def on_xml_decl(version, encoding, standalone):
+        declared[0] = encoding
+
+    def on_start(name, attributes):
+        found.append((name, parser.CurrentByteIndex, attributes))
+        raise _RootFound()
+
+    parser.XmlDeclHandler = on_xml_decl
+    parser.StartElementHandler = on_start
+    try:
+        parser.Parse(head, False)
+    except _RootFound:
+        pass
+    except expat.ExpatError:
+        return None
+    if not found:
+        return None
+    name, offset, attributes = found[0]
+    return name, offset, attributes, declared[0]
+
+
+def _start_tag_end(head: bytes, offset: int) -> int:
+    """Return the index just past the start tag at ``offset``, or -1 if cut off."""
+    quote = 0
+    for index in range(offset + 1, len(head)):
+        byte = head[index]
+        if quote:
+            if byte == quote:
+                quote = 0
+        elif byte in (0x22, 0x27):  # " or '
+            quote = byte
+        elif byte == 0x3E:  # >
+            return index + 1
+    return -1
+
+
+def rewrite_atlas_xml_root(source_xml: str, output_xml: str, attributes: Dict[str, str]) -> bool:
+    """
+    Copy an atlas XML while rewriting only the root tag attributes.
+
+    The parser stops at the root start tag, so the sprite entries are streamed
+    through untouched without parsing them. Returns False when the prolog is
+    malformed, the root is not a TextureAtlas element within the first
+    ``ATLAS_XML_HEAD_BYTES``, or the file is not UTF-8, so callers can fall
+    back to a full rebuild.
+    """
+    if os.path.normcase(os.path.abspath(source_xml)) == os.path.normcase(os.path.abspath(output_xml)):
+        return False
+    try:
+        with open(source_xml, "rb") as src:
+            head = src.read(ATLAS_XML_HEAD_BYTES)
+            if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+                return False
+            root = _find_root_start(head)
+            if root is None:
+                return False
+            name, start, parsed, encoding = root
+            if name != "TextureAtlas":
+                return False
+            if encoding is not None and encoding.lower() not in _UTF8_NAMES:
+                return False
+            end = _start_tag_end(head, start)
+            if end < 0:
+                return False
+            values = dict(zip(parsed[::2], parsed[1::2]))
+            values.update(attributes)
+            closing = b"/>" if head[start:end].endswith(b"/>") else b">"
+            tag = "<" + name + "".join(
+                f" {attr}={quoteattr(value)}" for attr, value in values.items()
+            )
+            with open(output_xml, "wb") as dst:
+                dst.write(head[:start])
+                dst.write(tag.encode("utf-8") + closing)
+                dst.write(head[end:])
+                shutil.copyfileobj(src, dst)
+    except Exception:
+        return False
+    return True
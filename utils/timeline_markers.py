@@ -0,0 +1,31 @@
+"""
+Timeline Markers
+Incremental updates of sorted keyframe marker lists
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List
+
+
+def apply_marker_delta(
+    markers: List[float],
+    added: Iterable[float],
+    removed: Iterable[float],
+    tolerance: float,
+) -> List[float]:
+    """
+    Patch a sorted marker list in place and return it.
+
+    Markers within ``tolerance`` of a removed time are dropped before the
+    added times are inserted; an added time already present is skipped.
+    """
+    for time_value in removed:
+        lo = bisect_left(markers, time_value - tolerance)
+        hi = bisect_right(markers, time_value + tolerance)
+        del markers[lo:hi]
+    for time_value in sorted(added):
+        idx = bisect_left(markers, time_value)
+        if idx < len(markers) and markers[idx] == time_value:
+            continue
+        markers.insert(idx, time_value)
+    return markers